@@ -0,0 +1,213 @@
+# activation_cache.py
+import logging
+import threading
+import time
+from datetime import datetime
+
+from database import connection
+from metrics import cache_lookups
+
+logger = logging.getLogger(__name__)
+
+
+class CachedCode:
+    __slots__ = ("id", "is_active", "expires_at", "usage_limit", "usage_count", "loaded_at")
+
+    def __init__(self, row, loaded_at: float):
+        self.id, self.is_active, self.expires_at, self.usage_limit, self.usage_count = row
+        self.loaded_at = loaded_at
+
+    def as_row(self, pending: int = 0):
+        return (self.id, self.is_active, self.expires_at, self.usage_limit, self.usage_count + pending)
+
+
+class ActivationCache:
+    """
+    نسخة محلية لكل عامل من أكواد التفعيل مع عدّادات استخدام تُكتب على دفعات.
+    الكود الذي بقي له أقل من strict_margin استخداماً يُخصم بجملة UPDATE ذرية
+    في قاعدة البيانات فلا يتجاوز مجموع العمال حده، ويبقى التجاوز ممكناً فقط إذا
+    استهلك غيره من العمال أكثر من strict_margin خلال مدة صلاحية النسخة المحلية.
+    """
+
+    def __init__(self, ttl_seconds: float, flush_interval: float, flush_batch: int, strict_margin: int):
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self.strict_margin = strict_margin
+        self._codes = {}
+        self._pending = {}
+        self._pending_total = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _load(self, code: str):
+        with connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT id, is_active, expires_at, usage_limit, usage_count
+                FROM activation_codes
+                WHERE code=?
+            """, (code,))
+            row = cur.fetchone()
+        return row
+
+    def _entry(self, code: str):
+        now = time.time()
+        with self._lock:
+            entry = self._codes.get(code)
+            if entry and now - entry.loaded_at < self.ttl_seconds:
+                cache_lookups.labels("activation", "hit").inc()
+                return entry
+        cache_lookups.labels("activation", "miss").inc()
+        row = self._load(code)
+        if not row:
+            return None
+        entry = CachedCode(row, now)
+        with self._lock:
+            self._codes[code] = entry
+        return entry
+
+    def lookup(self, code: str):
+        """صف الكود كما تراه الطلبات الحالية، شاملاً الاستخدام غير المكتوب بعد"""
+        entry = self._entry(code)
+        if not entry:
+            return None
+        with self._lock:
+            return entry.as_row(self._pending.get(entry.id, 0))
+
+    def reserve(self, code: str, amount: int, allowed):
+        """
+        يحجز amount استخداماً إذا قبلت allowed(row, amount) الصف الحالي،
+        ويعيد الصف المستخدم في الفحص ومعه نتيجة الحجز.
+        """
+        entry = self._entry(code)
+        if not entry:
+            return None, False
+        with self._lock:
+            pending = self._pending.get(entry.id, 0)
+            row = entry.as_row(pending)
+            if not allowed(row, amount):
+                return row, False
+            near_limit = (
+                entry.usage_limit is not None
+                and entry.usage_limit - row[4] - amount < self.strict_margin
+            )
+            if not near_limit:
+                self._pending[entry.id] = pending + amount
+                self._pending_total += amount
+                should_flush = self._pending_total >= self.flush_batch
+        if near_limit:
+            return self._reserve_in_db(entry.id, amount)
+        if should_flush:
+            self._wake.set()
+        return row, True
+
+    def _reserve_in_db(self, code_id: int, amount: int):
+        """خصم ذري مع كتابة المعلّق لهذا الكود في نفس الجملة"""
+        with self._flush_lock:
+            with self._lock:
+                pending = self._pending.pop(code_id, 0)
+                self._pending_total -= pending
+            now = datetime.utcnow().isoformat()
+            try:
+                with connection() as conn:
+                    cur = conn.cursor()
+                    cur.execute("""
+                        UPDATE activation_codes
+                        SET usage_count = usage_count + ?,
+                            last_used_at = ?
+                        WHERE id = ?
+                          AND is_active = 1
+                          AND (usage_limit IS NULL OR usage_count + ? <= usage_limit)
+                        RETURNING id, is_active, expires_at, usage_limit, usage_count
+                    """, (pending + amount, now, code_id, pending + amount))
+                    row = cur.fetchone()
+                    reserved = row is not None
+                    if not reserved:
+                        # المعلّق استخدام تم فعلاً فيُكتب وإن رُفض الطلب الحالي
+                        cur.execute("""
+                            UPDATE activation_codes
+                            SET usage_count = usage_count + ?
+                            WHERE id = ?
+                            RETURNING id, is_active, expires_at, usage_limit, usage_count
+                        """, (pending, code_id))
+                        row = cur.fetchone()
+            except BaseException:
+                with self._lock:
+                    self._pending[code_id] = self._pending.get(code_id, 0) + pending
+                    self._pending_total += pending
+                raise
+        self.invalidate(code_id)
+        return row, reserved
+
+    def pending_for(self, code_id: int) -> int:
+        with self._lock:
+            return self._pending.get(code_id, 0)
+
+    def invalidate(self, code_id: int):
+        with self._lock:
+            for code, entry in list(self._codes.items()):
+                if entry.id == code_id:
+                    del self._codes[code]
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                pending = dict(self._pending)
+            if not pending:
+                return
+
+            now = datetime.utcnow().isoformat()
+            with connection() as conn:
+                cur = conn.cursor()
+                cur.executemany("""
+                    UPDATE activation_codes
+                    SET usage_count = usage_count + ?,
+                        last_used_at = ?
+                    WHERE id = ?
+                """, [(amount, now, code_id) for code_id, amount in pending.items()])
+
+            # الاستخدام أصبح في قاعدة البيانات: يُطرح من المعلّق وتُعاد قراءة الأكواد
+            with self._lock:
+                for code_id, amount in pending.items():
+                    left = self._pending[code_id] - amount
+                    if left:
+                        self._pending[code_id] = left
+                    else:
+                        del self._pending[code_id]
+                    self._pending_total -= amount
+                for code, entry in list(self._codes.items()):
+                    if entry.id in pending:
+                        del self._codes[code]
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                # الاستخدام المعلّق يبقى في الذاكرة ويُعاد في الدورة التالية
+                logger.exception("Failed to flush activation usage")
+
+    def start(self):
+        if not self.enabled or self._thread:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="activation-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread:
+            self._stopped.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
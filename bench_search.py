@@ -0,0 +1,70 @@
+# bench_search.py
+# قياس زمن البحث العادي والمتسامح مع الأخطاء مع تضخيم الكتالوج صناعياً.
+# التشغيل: python bench_search.py
+import random
+import statistics
+import time
+
+from catalog import load_catalog
+from search_index import SearchIndex, TrigramIndex
+
+CATALOG = load_catalog()
+REPORTS, SUBCATEGORIES, CRITERIA = CATALOG.reports, CATALOG.subcategories, CATALOG.criteria
+SCALES = (1, 10, 50)
+REPEAT = 200
+EXACT_QUERIES = ("الطابور", "تقرير عن الطلاب", "الاذاعه المدرسيه", "المهني التعلم")
+FUZZY_QUERIES = (
+    "الاذاعه المدرسيه بكلمت عن حب الوطن",
+    "تقرير عن الالتزم بالزي الوطني",
+    "توثيق حظور الندوات التعليميه",
+    "اختبارت نهايه الوحده",
+)
+
+
+def inflate(scale: int):
+    """نسخ إضافية بأسماء مختلفة تُركَّب من كلمات تقارير أخرى في نفس التصنيف"""
+    rng = random.Random(scale)
+    words_by_sub = {}
+    for report in REPORTS:
+        words_by_sub.setdefault(report.subcategory_id, []).extend(report.name.split())
+
+    reports = list(REPORTS)
+    for copy in range(1, scale):
+        for report in REPORTS:
+            words = words_by_sub[report.subcategory_id]
+            name = " ".join(rng.sample(words, min(len(words), len(report.name.split()))))
+            reports.append(report._replace(id=f"{report.id}_{copy}", name=name))
+    return reports
+
+
+def measure(search, queries):
+    timings = []
+    for _ in range(REPEAT):
+        for query in queries:
+            start = time.perf_counter()
+            search(query)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.99) - 1]
+
+
+def main():
+    print(f"{'reports':>8} {'mode':>6} {'build ms':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for scale in SCALES:
+        reports = inflate(scale)
+
+        start = time.perf_counter()
+        exact = SearchIndex(reports, SUBCATEGORIES, CRITERIA)
+        build = (time.perf_counter() - start) * 1000
+        p50, p99 = measure(exact.search, EXACT_QUERIES)
+        print(f"{len(reports):>8} {'exact':>6} {build:>9.0f} {p50:>8.3f} {p99:>8.3f}")
+
+        start = time.perf_counter()
+        fuzzy = TrigramIndex(reports)
+        build = (time.perf_counter() - start) * 1000
+        p50, p99 = measure(fuzzy.search, FUZZY_QUERIES)
+        print(f"{len(reports):>8} {'fuzzy':>6} {build:>9.0f} {p50:>8.3f} {p99:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# catalog.py
+import json
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
+
+CATALOG_PATH = Path(os.getenv("CATALOG_PATH", Path(__file__).with_name("catalog.json")))
+
+
+class Criterion(NamedTuple):
+    id: str
+    name: str
+    weight: str
+    order: int
+
+
+class Subcategory(NamedTuple):
+    id: str
+    criterion_id: str
+    name: str
+    order: int
+
+
+class Report(NamedTuple):
+    id: str
+    subcategory_id: str
+    name: str
+    order: int
+
+
+TABLES = (
+    ("criteria", Criterion),
+    ("subcategories", Subcategory),
+    ("reports", Report),
+)
+LISTS = (
+    "education_offices",
+    "school_subjects",
+    "school_grades",
+    "target_audiences",
+    "implementation_places",
+    "educational_tools",
+)
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def _records(data: dict, name: str, record_type):
+    table = data.get(name)
+    if not isinstance(table, dict):
+        raise CatalogError(f"Missing table: {name}")
+    if table.get("fields") != list(record_type._fields):
+        raise CatalogError(f"{name}: fields must be {list(record_type._fields)}")
+
+    rows = table.get("rows", [])
+    if not isinstance(rows, list):
+        raise CatalogError(f"{name}: rows must be a list")
+    records = []
+    seen = set()
+    for row in rows:
+        if not isinstance(row, list) or len(row) != len(record_type._fields):
+            raise CatalogError(f"{name}: malformed row {row!r}")
+        record = record_type(*row)
+        if not isinstance(record.id, str) or not record.id:
+            raise CatalogError(f"{name}: invalid id {record.id!r}")
+        if record.id in seen:
+            raise CatalogError(f"{name}: duplicate id {record.id}")
+        if not isinstance(record.name, str) or not record.name.strip():
+            raise CatalogError(f"{name}: empty name for {record.id}")
+        if not isinstance(record.order, int):
+            raise CatalogError(f"{name}: order must be an integer for {record.id}")
+        seen.add(record.id)
+        records.append(record)
+    return tuple(records)
+
+
+def _check_parents(name: str, records, parent_field: str, parents):
+    for record in records:
+        parent = getattr(record, parent_field)
+        if not isinstance(parent, str):
+            raise CatalogError(f"{name}: {parent_field} must be a string for {record.id}")
+        if parent not in parents:
+            raise CatalogError(
+                f"{name}: {record.id} references unknown {parent_field} "
+                f"{getattr(record, parent_field)}"
+            )
+
+
+def _group_by(records, parent_field: str):
+    groups = {}
+    for record in records:
+        groups.setdefault(getattr(record, parent_field), []).append(record)
+    return MappingProxyType({key: tuple(items) for key, items in groups.items()})
+
+
+class Catalog:
+    """نسخة ثابتة من بيانات المعايير والتصنيفات والتقارير مع فهارسها"""
+
+    __slots__ = (
+        "version",
+        "criteria",
+        "subcategories",
+        "reports",
+        "lists",
+        "criteria_by_id",
+        "subcategories_by_id",
+        "reports_by_id",
+        "subcategories_by_criterion",
+        "reports_by_subcategory",
+    )
+
+    def __init__(self, data: dict):
+        if not isinstance(data, dict):
+            raise CatalogError("Catalog must be a JSON object")
+        version = data.get("version")
+        if not isinstance(version, str) or not version:
+            raise CatalogError("Catalog version is required")
+        self.version = version
+
+        self.criteria, self.subcategories, self.reports = (
+            _records(data, name, record_type) for name, record_type in TABLES
+        )
+
+        self.criteria_by_id = MappingProxyType({c.id: c for c in self.criteria})
+        self.subcategories_by_id = MappingProxyType({s.id: s for s in self.subcategories})
+        self.reports_by_id = MappingProxyType({r.id: r for r in self.reports})
+        _check_parents("subcategories", self.subcategories, "criterion_id", self.criteria_by_id)
+        _check_parents("reports", self.reports, "subcategory_id", self.subcategories_by_id)
+
+        self.subcategories_by_criterion = _group_by(self.subcategories, "criterion_id")
+        self.reports_by_subcategory = _group_by(self.reports, "subcategory_id")
+
+        lists = data.get("lists", {})
+        if not isinstance(lists, dict):
+            raise CatalogError("lists must be an object")
+        for name in LISTS:
+            values = lists.get(name)
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                raise CatalogError(f"lists.{name} must be a list of strings")
+        self.lists = MappingProxyType({name: tuple(lists[name]) for name in LISTS})
+
+
+def load_catalog(path=CATALOG_PATH) -> Catalog:
+    with open(path, encoding="utf-8") as f:
+        return Catalog(json.load(f))
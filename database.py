@@ -1,28 +1,201 @@
 # database.py
 import sqlite3
 import os
+import queue
+import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
+from metrics import db_query_seconds
+
 DB_PATH = "/tmp/database.db"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(64 * 1024 * 1024)))
+# sqlite3 يحتفظ بجملة مُحضّرة لكل نص SQL مختلف على كل اتصال
+DB_STATEMENT_CACHE = 128
+
+PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={DB_BUSY_TIMEOUT_MS}",
+    f"PRAGMA mmap_size={DB_MMAP_SIZE}",
+    "PRAGMA temp_store=MEMORY",
+)
+
+_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+_pool_pid = os.getpid()
 
 def get_connection():
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        timeout=DB_BUSY_TIMEOUT_MS / 1000,
+        cached_statements=DB_STATEMENT_CACHE,
+    )
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _reset_pool_after_fork():
+    # اتصالات SQLite لا تُشارك بين العمليات: عامل gunicorn يبدأ بمجمّع فارغ
+    global _pool, _pool_pid
+    if _pool_pid != os.getpid():
+        _pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+        _pool_pid = os.getpid()
+
+@contextmanager
+def connection(site: str = None):
+    """اتصال من المجمّع يُعتمد عند النجاح ويُتراجع عنه عند الخطأ ثم يُعاد"""
+    # الوحدة واسم الدالة المستدعية يميّزان زمن كل موضع استعلام في /metrics
+    if not site:
+        frame = sys._getframe(2)
+        site = f"{frame.f_globals.get('__name__')}.{frame.f_code.co_qualname}"
+    _reset_pool_after_fork()
+    try:
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = get_connection()
+
+    start = time.perf_counter()
+    try:
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        db_query_seconds.labels(site).observe(time.perf_counter() - start)
+        try:
+            _pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
 def init_db():
     os.makedirs("/tmp", exist_ok=True)
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-    CREATE TABLE IF NOT EXISTS activation_codes (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        code TEXT UNIQUE,
-        is_active INTEGER,
-        created_at TEXT,
-        expires_at TEXT,
-        usage_limit INTEGER,
-        usage_count INTEGER,
-        last_used_at TEXT
-    )
-    """)
-    conn.commit()
-    conn.close()
\ No newline at end of file
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS activation_codes (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            code TEXT UNIQUE,
+            is_active INTEGER,
+            created_at TEXT,
+            expires_at TEXT,
+            usage_limit INTEGER,
+            usage_count INTEGER,
+            last_used_at TEXT,
+            plan TEXT
+        )
+        """)
+        # قواعد بيانات أُنشئت قبل إضافة عمود الخطة
+        columns = {row[1] for row in cur.execute("PRAGMA table_info(activation_codes)")}
+        if "plan" not in columns:
+            cur.execute("ALTER TABLE activation_codes ADD COLUMN plan TEXT")
+        # فهارس قائمة الأكواد في لوحة الإدارة: كل ترتيب مع id للصفحات المتتالية
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS activation_codes_expires
+        ON activation_codes (COALESCE(expires_at, ''), id)
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS activation_codes_usage ON activation_codes (usage_count, id)
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS activation_codes_plan ON activation_codes (plan, id)
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS activation_codes_active ON activation_codes (is_active, id)
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS report_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            expires_at REAL
+        )
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS report_cache_expires ON report_cache (expires_at)
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            code_id INTEGER,
+            kind TEXT,
+            payload TEXT,
+            status TEXT,
+            attempts INTEGER,
+            result TEXT,
+            error TEXT,
+            available_at REAL,
+            lease_until REAL,
+            expires_at REAL,
+            created_at TEXT,
+            finished_at TEXT
+        )
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, available_at)
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS generation_usage (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            code_id INTEGER,
+            key_index INTEGER,
+            model TEXT,
+            prompt_tokens INTEGER,
+            candidate_tokens INTEGER,
+            total_tokens INTEGER,
+            latency_ms INTEGER,
+            created_at TEXT,
+            day TEXT
+        )
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS generation_usage_day ON generation_usage (day)
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS generation_usage_code ON generation_usage (code_id)
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS code_rate (
+            code_id INTEGER PRIMARY KEY,
+            tokens REAL,
+            updated_at REAL
+        )
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS code_slots (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            code_id INTEGER,
+            expires_at REAL
+        )
+        """)
+        cur.execute("""
+        CREATE INDEX IF NOT EXISTS code_slots_code ON code_slots (code_id, expires_at)
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS gemini_keys (
+            model TEXT,
+            key_index INTEGER,
+            requests INTEGER,
+            errors INTEGER,
+            failures INTEGER,
+            cooldown_until REAL,
+            half_open INTEGER,
+            PRIMARY KEY (model, key_index)
+        )
+        """)
+        cur.execute("""
+        CREATE TABLE IF NOT EXISTS gemini_key_load (
+            model TEXT,
+            key_index INTEGER,
+            pid INTEGER,
+            in_flight INTEGER,
+            updated_at REAL NOT NULL DEFAULT 0,
+            PRIMARY KEY (model, key_index, pid)
+        )
+        """)
+        columns = {row[1] for row in cur.execute("PRAGMA table_info(gemini_key_load)")}
+        if "updated_at" not in columns:
+            cur.execute("ALTER TABLE gemini_key_load ADD COLUMN updated_at REAL NOT NULL DEFAULT 0")
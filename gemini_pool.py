@@ -0,0 +1,68 @@
+# gemini_pool.py
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import google.generativeai as genai
+from google.ai import generativelanguage as glm
+from fastapi.concurrency import run_in_threadpool
+
+from key_scheduler import KeyScheduler
+from metrics import gemini_errors, gemini_in_flight, gemini_request_seconds
+
+
+class GeminiClient:
+    """نموذج Gemini دائم مرتبط بمفتاح واحد دون المساس بإعدادات genai العامة"""
+
+    def __init__(self, index: int, api_key: str, model_name: str):
+        self.index = index
+        self.model_name = model_name
+        self._api_key = api_key
+        self.model = genai.GenerativeModel(model_name)
+
+    def _ensure_async_client(self):
+        # قنوات grpc.aio ترتبط بحلقة الأحداث الجارية فيُنشأ العميل عند أول استدعاء
+        if self.model._async_client is None:
+            self.model._async_client = glm.GenerativeServiceAsyncClient(
+                client_options={"api_key": self._api_key}
+            )
+
+    async def generate_async(self, prompt, **kwargs):
+        self._ensure_async_client()
+        return await self.model.generate_content_async(prompt, **kwargs)
+
+
+class GeminiPool:
+    def __init__(self, api_keys, model_name: str):
+        self.model_name = model_name
+        self.clients = [
+            GeminiClient(i, key, model_name) for i, key in enumerate(api_keys)
+        ]
+        self.scheduler = KeyScheduler(len(self.clients), model_name)
+
+    def __len__(self):
+        return len(self.clients)
+
+    @asynccontextmanager
+    async def borrow(self, avoid=()):
+        # الجدولة في قاعدة البيانات فتُنفذ خارج حلقة الأحداث
+        index = await run_in_threadpool(self.scheduler.acquire, avoid)
+        key = str(index)
+        error = None
+        record = True
+        gemini_in_flight.labels(key).inc()
+        start = time.perf_counter()
+        try:
+            yield self.clients[index]
+        except Exception as exc:
+            error = exc
+            gemini_errors.labels(key, type(exc).__name__).inc()
+            raise
+        except BaseException:
+            record = False
+            raise
+        finally:
+            gemini_request_seconds.labels(key).observe(time.perf_counter() - start)
+            gemini_in_flight.labels(key).dec()
+            # التحرير يكتمل حتى لو أُلغي الطلب مرة أخرى أثناء انتظاره
+            await asyncio.shield(run_in_threadpool(self.scheduler.release, index, error, record))
@@ -0,0 +1,9 @@
+# gunicorn.conf.py
+# يُقرأ تلقائياً عند تشغيل gunicorn من مجلد المشروع
+from key_scheduler import forget_process
+from metrics import mark_process_dead
+
+
+def child_exit(server, worker):
+    mark_process_dead(worker.pid)
+    forget_process(worker.pid)
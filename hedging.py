@@ -0,0 +1,46 @@
+# hedging.py
+from collections import deque
+
+
+class HedgePolicy:
+    """
+    متى يُرسل طلب احتياطي: بعد تجاوز الطلب الأصلي النسبة percentile من
+    أزمنة الاستجابة الأخيرة، وبشرط ألا تتجاوز الطلبات الاحتياطية نسبة budget
+    من آخر window طلباً. تُستخدم من حلقة الأحداث فقط فلا تحتاج قفلاً.
+    """
+
+    def __init__(self, percentile: float, budget: float, min_samples: int, window: int):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._decisions = deque(maxlen=window)
+        self._hedged = 0
+
+    def record_latency(self, seconds: float):
+        self._latencies.append(seconds)
+
+    def delay(self):
+        """زمن الانتظار قبل الطلب الاحتياطي، أو None إن لم تكفِ العينات بعد"""
+        if len(self._latencies) < self.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+    def allow(self) -> bool:
+        """هل يبقى الطلب الاحتياطي التالي ضمن الميزانية"""
+        return self._hedged + 1 <= self.budget * (len(self._decisions) + 1)
+
+    def settle(self, hedged: bool):
+        """تسجيل كل طلب مرة واحدة بعد معرفة إن كان قد احتيط له"""
+        if len(self._decisions) == self._decisions.maxlen:
+            self._hedged -= self._decisions[0]
+        self._decisions.append(hedged)
+        self._hedged += hedged
+
+    def stats(self):
+        return {
+            "delay": self.delay(),
+            "samples": len(self._latencies),
+            "hedge_rate": round(self._hedged / len(self._decisions), 4) if self._decisions else 0.0,
+        }
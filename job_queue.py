@@ -0,0 +1,237 @@
+# job_queue.py
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+
+from fastapi.concurrency import run_in_threadpool
+
+from database import connection
+
+PURGE_INTERVAL = 60
+
+
+class JobFailed(Exception):
+    """خطأ نهائي في المهمة لا تفيد إعادة المحاولة فيه"""
+
+
+class JobQueue:
+    """
+    طابور مهام محفوظ في جدول jobs. أي عامل يستطيع سحب أي مهمة بجملة UPDATE
+    ذرية، والمهمة التي ينتهي حجزها دون نتيجة (عامل توقف) تعود للطابور.
+    """
+
+    def __init__(
+        self,
+        handler,
+        concurrency: int,
+        max_attempts: int,
+        retention_seconds: float,
+        lease_seconds: float,
+        poll_interval: float,
+    ):
+        self.handler = handler
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self._wake = None
+        self._loop = None
+        self._claimer_task = None
+        self._running = {}
+        self._last_purge = 0.0
+
+    def submit(self, code_id: int, kind: str, payload: dict) -> str:
+        job_id = uuid.uuid4().hex
+        with connection() as conn:
+            conn.execute("""
+                INSERT INTO jobs (id, code_id, kind, payload, status, attempts,
+                                  available_at, created_at)
+                VALUES (?, ?, ?, ?, 'queued', 0, ?, ?)
+            """, (
+                job_id, code_id, kind, json.dumps(payload, ensure_ascii=False),
+                time.time(), datetime.utcnow().isoformat()
+            ))
+        # submit تعمل في threadpool، وasyncio.Event لا يُلمس إلا من حلقته
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        return job_id
+
+    def get(self, job_id: str, code_id: int):
+        with connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                SELECT status, attempts, result, error, created_at, finished_at
+                FROM jobs
+                WHERE id = ? AND code_id = ? AND (expires_at IS NULL OR expires_at > ?)
+            """, (job_id, code_id, time.time()))
+            row = cur.fetchone()
+        if not row:
+            return None
+
+        status, attempts, result, error, created_at, finished_at = row
+        job = {
+            "job_id": job_id,
+            "status": status,
+            "attempts": attempts,
+            "created_at": created_at,
+            "finished_at": finished_at,
+        }
+        if result is not None:
+            job["result"] = json.loads(result)
+        if error is not None:
+            job["error"] = error
+        return job
+
+    def _claim(self):
+        now = time.time()
+        with connection() as conn:
+            cur = conn.cursor()
+            # فحص بقراءة فقط أولاً حتى لا يأخذ الطابور الخالي قفل الكتابة في كل دورة
+            cur.execute("""
+                SELECT 1 FROM jobs
+                WHERE (status = 'queued' AND available_at <= ?)
+                   OR (status = 'running' AND lease_until < ?)
+                LIMIT 1
+            """, (now, now))
+            if not cur.fetchone():
+                return None
+            cur.execute("""
+                UPDATE jobs
+                SET status = 'running',
+                    attempts = attempts + 1,
+                    lease_until = ?
+                WHERE id = (
+                    SELECT id FROM jobs
+                    WHERE (status = 'queued' AND available_at <= ?)
+                       OR (status = 'running' AND lease_until < ?)
+                    ORDER BY available_at
+                    LIMIT 1
+                )
+                RETURNING id, code_id, kind, payload, attempts
+            """, (now + self.lease_seconds, now, now))
+            return cur.fetchone()
+
+    def _finish(self, job_id: str, status: str, result=None, error: str = None):
+        now = time.time()
+        with connection() as conn:
+            conn.execute("""
+                UPDATE jobs
+                SET status = ?, result = ?, error = ?, lease_until = NULL,
+                    finished_at = ?, expires_at = ?
+                WHERE id = ?
+            """, (
+                status,
+                None if result is None else json.dumps(result, ensure_ascii=False),
+                error,
+                datetime.utcnow().isoformat(),
+                now + self.retention_seconds,
+                job_id,
+            ))
+
+    def _retry(self, job_id: str, attempts: int, error: str):
+        # تأخير متزايد بين المحاولات: 2 ثم 4 ثم 8 ثوانٍ...
+        with connection() as conn:
+            conn.execute("""
+                UPDATE jobs
+                SET status = 'queued', error = ?, lease_until = NULL, available_at = ?
+                WHERE id = ?
+            """, (error, time.time() + 2 ** attempts, job_id))
+
+    def _requeue(self, job_ids):
+        # إيقاف العامل ليس محاولة فاشلة: تعود المهمة فوراً بعدد محاولاتها السابق
+        with connection() as conn:
+            conn.executemany("""
+                UPDATE jobs
+                SET status = 'queued', attempts = attempts - 1,
+                    lease_until = NULL, available_at = ?
+                WHERE id = ? AND status = 'running'
+            """, [(time.time(), job_id) for job_id in job_ids])
+
+    def purge(self):
+        with connection() as conn:
+            conn.execute("DELETE FROM jobs WHERE expires_at <= ?", (time.time(),))
+
+    def stats(self):
+        with connection() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status")
+            counts = dict(cur.fetchall())
+        return {
+            "counts": counts,
+            "running": len(self._running),
+            "concurrency": self.concurrency,
+        }
+
+    async def _process(self, job_id: str, code_id: int, kind: str, payload: str, attempts: int):
+        try:
+            result = await self.handler(kind, json.loads(payload), code_id)
+        except JobFailed as e:
+            await run_in_threadpool(self._finish, job_id, "failed", error=str(e))
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if attempts < self.max_attempts:
+                await run_in_threadpool(self._retry, job_id, attempts, error)
+            else:
+                await run_in_threadpool(self._finish, job_id, "failed", error=error)
+        else:
+            await run_in_threadpool(self._finish, job_id, "done", result)
+
+    async def _run(self, free: asyncio.Semaphore, job):
+        try:
+            await self._process(*job)
+        finally:
+            self._running.pop(job[0], None)
+            free.release()
+
+    async def _claimer(self):
+        # ساحب واحد لكل عملية يوزّع المهام على concurrency منفّذاً
+        free = asyncio.Semaphore(self.concurrency)
+        while True:
+            now = time.time()
+            if now - self._last_purge >= PURGE_INTERVAL:
+                self._last_purge = now
+                await run_in_threadpool(self.purge)
+
+            await free.acquire()
+            job = await run_in_threadpool(self._claim)
+            if job:
+                self._running[job[0]] = asyncio.create_task(
+                    self._run(free, job), name=f"job-{job[0]}"
+                )
+                continue
+            free.release()
+
+            # لا توجد مهام جاهزة: انتظار مهمة جديدة من هذا العامل أو فحص دوري
+            # لما يُضاف من العمال الآخرين وما يحين موعد إعادة محاولته
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def start(self):
+        """يجب استدعاؤها داخل حلقة الأحداث التي سيعمل فيها المعالج"""
+        if self.concurrency <= 0 or self._claimer_task:
+            return
+        self._wake = asyncio.Event()
+        self._loop = asyncio.get_running_loop()
+        self._claimer_task = asyncio.create_task(self._claimer(), name="job-claimer")
+
+    async def stop(self):
+        if not self._claimer_task:
+            return
+        self._claimer_task.cancel()
+        running = dict(self._running)
+        for task in running.values():
+            task.cancel()
+        await asyncio.gather(self._claimer_task, *running.values(), return_exceptions=True)
+        # المهام المقطوعة تعود للطابور الآن بدل انتظار انتهاء حجزها
+        if running:
+            await run_in_threadpool(self._requeue, list(running))
+        self._claimer_task = None
+        self._running = {}
+        self._loop = None
+        self._wake = None
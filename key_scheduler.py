@@ -0,0 +1,230 @@
+# key_scheduler.py
+import math
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from fastapi import HTTPException
+from google.api_core import exceptions as google_exceptions
+
+from database import connection
+
+ERROR_WINDOW = int(os.getenv("GEMINI_KEY_ERROR_WINDOW", "50"))
+ERROR_RATE_LIMIT = float(os.getenv("GEMINI_KEY_ERROR_RATE", "0.5"))
+ERROR_MIN_SAMPLES = int(os.getenv("GEMINI_KEY_ERROR_MIN_SAMPLES", "5"))
+ERROR_COOLDOWN_SECONDS = float(os.getenv("GEMINI_KEY_ERROR_COOLDOWN", "30"))
+RATE_LIMIT_COOLDOWN_SECONDS = float(os.getenv("GEMINI_KEY_RATE_LIMIT_COOLDOWN", "60"))
+# قاطع الدائرة: عدد الأخطاء المتتالية التي تفتحه، ثم طلب تجريبي واحد بعد التبريد
+BREAKER_THRESHOLD = int(os.getenv("GEMINI_KEY_BREAKER_THRESHOLD", "3"))
+# حمل عامل لم يُحدَّث منذ هذه المدة يُعد لعامل توقف دون child_exit (يجب أن تتجاوز أطول استدعاء)
+LOAD_STALE_SECONDS = float(os.getenv("GEMINI_KEY_LOAD_STALE", "300"))
+
+# أخطاء عابرة تستحق إعادة المحاولة على مفتاح آخر أو نموذج آخر
+RETRYABLE_ERRORS = (
+    google_exceptions.ResourceExhausted,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+    google_exceptions.Aborted,
+    google_exceptions.GatewayTimeout,
+    ConnectionError,
+    TimeoutError,
+)
+
+# أخطاء تخص المفتاح نفسه (ملغى أو غير صالح): لا تفيد إعادتها عليه لكن مفتاحاً آخر قد ينجح
+KEY_ERRORS = (
+    google_exceptions.PermissionDenied,
+    google_exceptions.Unauthenticated,
+)
+
+# حصص Gemini اليومية تُصفَّر عند منتصف الليل بتوقيت المحيط الهادئ
+QUOTA_RESET_TZ = ZoneInfo("America/Los_Angeles")
+
+
+def seconds_until_quota_reset(now: float) -> float:
+    local = datetime.fromtimestamp(now, QUOTA_RESET_TZ)
+    midnight = (local + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (midnight - local).total_seconds()
+
+
+def cooldown_for(exc: Exception, now: float):
+    """مدة إيقاف المفتاح بعد الخطأ، أو None إذا لم يكن الخطأ متعلقاً بالحصة أو بالمفتاح"""
+    if is_key_error(exc):
+        return ERROR_COOLDOWN_SECONDS
+    if not isinstance(exc, google_exceptions.ResourceExhausted):
+        return None
+    message = str(exc).lower()
+    if "perday" in message or "per day" in message or "daily" in message:
+        return seconds_until_quota_reset(now)
+    return RATE_LIMIT_COOLDOWN_SECONDS
+
+
+def is_retryable(exc: Exception) -> bool:
+    return isinstance(exc, RETRYABLE_ERRORS)
+
+
+def is_key_error(exc: Exception) -> bool:
+    if isinstance(exc, KEY_ERRORS):
+        return True
+    # Gemini يرد على المفتاح غير الصالح بـ 400 "API key not valid"
+    return isinstance(exc, google_exceptions.InvalidArgument) and "api key" in str(exc).lower()
+
+
+class KeyScheduler:
+    """
+    اختيار مفتاح Gemini لكل طلب بحالة مشتركة بين عمال gunicorn في قاعدة البيانات:
+    العدّادات وفترات التبريد وقاطع الدائرة في gemini_keys، والحمل الحالي لكل
+    عامل في gemini_key_load حتى يُحذف حمل العامل المتوقف دون المساس بغيره.
+    كل عامل يجدد وقت صفوفه مع كل طلب، والصفوف الأقدم من LOAD_STALE_SECONDS تُحذف.
+    نسبة الأخطاء الحديثة وحدها محلية لكل عامل.
+    """
+
+    def __init__(self, key_count: int, model: str = ""):
+        self.key_count = key_count
+        self.model = model
+        self.recent = [deque(maxlen=ERROR_WINDOW) for _ in range(key_count)]
+        self._lock = threading.Lock()
+        with connection() as conn:
+            conn.executemany("""
+                INSERT OR IGNORE INTO gemini_keys
+                (model, key_index, requests, errors, failures, cooldown_until, half_open)
+                VALUES (?, ?, 0, 0, 0, 0, 0)
+            """, [(model, i) for i in range(key_count)])
+            # رقم عملية أُعيد استخدامه بعد توقف عامل سابق
+            conn.execute("DELETE FROM gemini_key_load WHERE pid = ?", (os.getpid(),))
+
+    def error_rate(self, index: int) -> float:
+        with self._lock:
+            recent = self.recent[index]
+            return recent.count(False) / len(recent) if recent else 0.0
+
+    def _keys(self, cur):
+        cur.execute("""
+            SELECT k.key_index, k.requests, k.errors, k.failures, k.cooldown_until,
+                   k.half_open, COALESCE(SUM(l.in_flight), 0)
+            FROM gemini_keys k
+            LEFT JOIN gemini_key_load l
+              ON l.model = k.model AND l.key_index = k.key_index
+            WHERE k.model = ? AND k.key_index < ?
+            GROUP BY k.key_index
+        """, (self.model, self.key_count))
+        return cur.fetchall()
+
+    def acquire(self, avoid=()) -> int:
+        """
+        أقل المفاتيح المتاحة انشغالاً على مستوى كل العمال، مع تجنب المفاتيح في
+        avoid (جُرّبت لنفس الطلب) ما دام هناك غيرها.
+        """
+        if not self.key_count:
+            raise HTTPException(status_code=500, detail="No Gemini API key configured")
+        now = time.time()
+        with connection() as conn:
+            cur = conn.cursor()
+            # قفل الكتابة من البداية حتى لا يختار عاملان نفس الطلب التجريبي
+            cur.execute("BEGIN IMMEDIATE")
+            # نبضة هذا العامل، ثم حذف حمل العمال الذين توقفوا دون child_exit
+            cur.execute("""
+                UPDATE gemini_key_load SET updated_at = ? WHERE model = ? AND pid = ?
+            """, (now, self.model, os.getpid()))
+            cur.execute("""
+                DELETE FROM gemini_key_load WHERE model = ? AND updated_at < ?
+            """, (self.model, now - LOAD_STALE_SECONDS))
+            keys = self._keys(cur)
+            # بعد انتهاء التبريد يمر طلب تجريبي واحد فقط حتى يثبت المفتاح تعافيه
+            healthy = [k for k in keys if k[4] <= now and not (k[5] and k[6])]
+            healthy = [k for k in healthy if k[0] not in avoid] or healthy
+            if not healthy:
+                retry_after = max(1, min(k[4] for k in keys) - now)
+                raise HTTPException(
+                    status_code=503,
+                    detail="All Gemini API keys are cooling down",
+                    headers={"Retry-After": str(math.ceil(retry_after))},
+                )
+            index = min(healthy, key=lambda k: (k[6], self.error_rate(k[0]), k[1]))[0]
+            cur.execute("""
+                UPDATE gemini_keys SET requests = requests + 1
+                WHERE model = ? AND key_index = ?
+            """, (self.model, index))
+            cur.execute("""
+                INSERT INTO gemini_key_load (model, key_index, pid, in_flight, updated_at)
+                VALUES (?, ?, ?, 1, ?)
+                ON CONFLICT (model, key_index, pid) DO UPDATE SET in_flight = in_flight + 1
+            """, (self.model, index, os.getpid(), now))
+        return index
+
+    def release(self, index: int, exc: Exception = None, record: bool = True):
+        now = time.time()
+        with connection() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                UPDATE gemini_key_load SET in_flight = in_flight - 1, updated_at = ?
+                WHERE model = ? AND key_index = ? AND pid = ?
+            """, (now, self.model, index, os.getpid()))
+            # طلب أُلغي (مثل الطلب الخاسر في التحوّط) لا يُحسب نجاحاً ولا خطأً
+            if not record:
+                return
+            with self._lock:
+                self.recent[index].append(exc is None)
+            if exc is None:
+                cur.execute("""
+                    UPDATE gemini_keys SET failures = 0, half_open = 0
+                    WHERE model = ? AND key_index = ? AND (failures > 0 OR half_open)
+                """, (self.model, index))
+                return
+
+            cur.execute("""
+                UPDATE gemini_keys SET errors = errors + 1, failures = failures + 1
+                WHERE model = ? AND key_index = ?
+                RETURNING failures, half_open
+            """, (self.model, index))
+            failures, half_open = cur.fetchone()
+            cooldown = cooldown_for(exc, now)
+            if cooldown is None:
+                with self._lock:
+                    recent = self.recent[index]
+                    error_rate = recent.count(False) / len(recent)
+                    if failures >= BREAKER_THRESHOLD or half_open or (
+                        len(recent) >= ERROR_MIN_SAMPLES and error_rate >= ERROR_RATE_LIMIT
+                    ):
+                        cooldown = ERROR_COOLDOWN_SECONDS
+                        recent.clear()
+            if cooldown is not None:
+                cur.execute("""
+                    UPDATE gemini_keys
+                    SET cooldown_until = MAX(cooldown_until, ?), half_open = 1
+                    WHERE model = ? AND key_index = ?
+                """, (now + cooldown, self.model, index))
+
+    def stats(self):
+        now = time.time()
+        with connection() as conn:
+            keys = self._keys(conn.cursor())
+        result = []
+        for index, requests, errors, failures, cooldown_until, half_open, in_flight in keys:
+            if cooldown_until > now:
+                circuit = "open"
+            else:
+                circuit = "half_open" if half_open else "closed"
+            result.append({
+                "index": index,
+                "in_flight": in_flight,
+                "requests": requests,
+                "errors": errors,
+                "error_rate": round(self.error_rate(index), 3),
+                "healthy": cooldown_until <= now,
+                "circuit": circuit,
+                "cooldown_until": (
+                    datetime.utcfromtimestamp(cooldown_until).isoformat()
+                    if cooldown_until > now else None
+                ),
+            })
+        return result
+
+
+def forget_process(pid: int):
+    """حذف حمل عامل توقف، وتُستدعى من child_exit في gunicorn"""
+    with connection() as conn:
+        conn.execute("DELETE FROM gemini_key_load WHERE pid = ?", (pid,))
@@ -1,25 +1,67 @@
 # main.py
-from fastapi import FastAPI, HTTPException, Depends, Header, Query
+from fastapi import FastAPI, HTTPException, Depends, Header, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from pathlib import Path
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 import os
-import itertools
+import asyncio
+import base64
 import json
-import google.generativeai as genai
+import logging
+import random
+import threading
+import time
 from typing import Optional, List, Dict, Any
 
-from database import init_db, get_connection
+from database import init_db, connection
 from create_key import create_key
-from security import activation_required
+from security import (
+    activation_required, activation_code, activation_owner, consume_activation, activation_cache
+)
+from gemini_pool import GeminiPool
+from key_scheduler import is_key_error, is_retryable
+from report_cache import ReportCache, cache_key
+from precomputed import PrecomputedResponse
+from search_index import SearchIndex, TrigramIndex
+from catalog import CATALOG_PATH, CatalogError, load_catalog
+from job_queue import JobQueue, JobFailed
+from single_flight import SingleFlight
+from hedging import HedgePolicy
+from rate_limit import RateLimiter, CodeLimits
+from usage_log import UsageLog, GROUPS as USAGE_GROUPS
+import metrics
+from report_fields import (
+    FIELD_KEYS, parse_fields, missing_fields, format_fields, build_repair_prompt
+)
+
+logger = logging.getLogger(__name__)
 
 # ---------- Init DB ----------
 init_db()
 
 # ---------- App ----------
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    activation_cache.start()
+    usage_log.start()
+    watcher = None
+    if CATALOG_WATCH_INTERVAL > 0:
+        catalog_watch_stop.clear()
+        watcher = threading.Thread(target=watch_catalog, name="catalog-watch", daemon=True)
+        watcher.start()
+    job_queue.start()
+    yield
+    await job_queue.stop()
+    catalog_watch_stop.set()
+    # كتابة عدّادات الاستخدام المعلّقة قبل إيقاف العامل
+    await run_in_threadpool(activation_cache.stop)
+    await run_in_threadpool(usage_log.stop)
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -29,6 +71,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def measure_requests(request: Request, call_next):
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # قالب المسار وليس الرابط الفعلي حتى لا تتضخم قيم route
+        route = request.scope.get("route")
+        metrics.http_request_seconds.labels(
+            request.method, route.path if route else "unmatched", str(status)
+        ).observe(time.perf_counter() - start)
+
 # ---------- Admin Auth ----------
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
 
@@ -48,21 +105,68 @@ class GenerateReportRequest(BaseModel):
     subcategory_id: str
     report_id: str
     report_data: Dict[str, Any] = {}
+    fresh: bool = False
+
+class GenerateBatchRequest(BaseModel):
+    items: List[GenerateReportRequest]
+
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "30"))
 
 # ---------- Plans ----------
+# rate: طلبات توليد في الدقيقة، burst: أقصى دفعة متتالية، concurrency: توليدات متزامنة
 PLANS = {
-    "5min_1":   {"minutes": 5,    "usage": 1},
-    "15min_2":  {"minutes": 15,   "usage": 2},
-    "30min_3":  {"minutes": 30,   "usage": 3},
-    "1day_6":   {"days": 1,       "usage": 6},
-    "3day_15":  {"days": 3,       "usage": 15},
-    "7day_25":  {"days": 7,       "usage": 25},
-    "1m_45":    {"days": 30,      "usage": 45},
-    "2m_65":    {"days": 60,      "usage": 65},
-    "3m_120":   {"days": 90,      "usage": 120},
-    "5m_200":   {"days": 150,     "usage": 200},
+    "5min_1":   {"minutes": 5,    "usage": 1,   "rate": 2, "burst": 2,  "concurrency": 1},
+    "15min_2":  {"minutes": 15,   "usage": 2,   "rate": 2, "burst": 2,  "concurrency": 1},
+    "30min_3":  {"minutes": 30,   "usage": 3,   "rate": 2, "burst": 3,  "concurrency": 1},
+    "1day_6":   {"days": 1,       "usage": 6,   "rate": 4, "burst": 6,  "concurrency": 2},
+    "3day_15":  {"days": 3,       "usage": 15,  "rate": 4, "burst": 6,  "concurrency": 2},
+    "7day_25":  {"days": 7,       "usage": 25,  "rate": 4, "burst": 8,  "concurrency": 2},
+    "1m_45":    {"days": 30,      "usage": 45,  "rate": 6, "burst": 10, "concurrency": 3},
+    "2m_65":    {"days": 60,      "usage": 65,  "rate": 6, "burst": 10, "concurrency": 3},
+    "3m_120":   {"days": 90,      "usage": 120, "rate": 6, "burst": 15, "concurrency": 3},
+    "5m_200":   {"days": 150,     "usage": 200, "rate": 6, "burst": 15, "concurrency": 3},
 }
 
+# الأكواد بلا خطة مسجلة (أُنشئت قبل حفظ الخطة) تأخذ الحدود الافتراضية
+rate_limiter = RateLimiter(
+    PLANS,
+    default=CodeLimits(
+        rate=float(os.getenv("DEFAULT_RATE_PER_MINUTE", "4")),
+        burst=int(os.getenv("DEFAULT_RATE_BURST", "6")),
+        concurrency=int(os.getenv("DEFAULT_CONCURRENCY", "2")),
+    ),
+    slot_ttl=float(os.getenv("CODE_SLOT_TTL", "180")),
+)
+
+async def admit_generation(code: str, amount: int = 1, slot: bool = True, rate_cost: int = None):
+    """
+    فحص حدود المعدل والتزامن قبل خصم amount من الرصيد، ويعيد (code_id, slot_id).
+    rate_cost ما يُسحب من حد المعدل الآن إن اختلف عن amount.
+    """
+    rate_cost = amount if rate_cost is None else rate_cost
+    slot_id = await run_in_threadpool(rate_limiter.admit, code, rate_cost, slot)
+    try:
+        code_id = await run_in_threadpool(consume_activation, code, amount)
+    except BaseException:
+        await release_generation(slot_id)
+        raise
+    return code_id, slot_id
+
+async def wait_for_rate(code: str):
+    """سحب رمز واحد من حد معدل الكود، والانتظار حتى يتوفر بدل الرفض"""
+    while True:
+        try:
+            await run_in_threadpool(rate_limiter.admit, code, 1, False)
+            return
+        except HTTPException as e:
+            if e.status_code != 429:
+                raise
+            await asyncio.sleep(float(e.headers["Retry-After"]))
+
+async def release_generation(slot_id):
+    # التحرير يكتمل حتى لو أُلغي الطلب (أو انقطع البث) أثناء انتظاره
+    await asyncio.shield(run_in_threadpool(rate_limiter.release, slot_id))
+
 # ---------- Gemini Keys ----------
 api_keys = [
     os.getenv("GEMINI_API_KEY_1"),
@@ -74,1120 +178,147 @@ api_keys = [
     os.getenv("GEMINI_API_KEY_7"),
 ]
 api_keys = [k for k in api_keys if k]
-key_cycle = itertools.cycle(api_keys) if api_keys else None
 
-def get_api_key():
-    if not key_cycle:
-        raise HTTPException(status_code=500, detail="No Gemini API key configured")
-    return next(key_cycle)
-
-# ============================================================================
-# المعايير التربوية (11 معياراً)
-# ============================================================================
-
-CRITERIA = [
-    {
-        "id": "c1",
-        "name": "أداء الواجبات الوظيفية",
-        "weight": "10%",
-        "order": 1
-    },
-    {
-        "id": "c2",
-        "name": "التفاعل مع المجتمع المهني",
-        "weight": "10%",
-        "order": 2
-    },
-    {
-        "id": "c3",
-        "name": "التفاعل مع أولياء الأمور",
-        "weight": "10%",
-        "order": 3
-    },
-    {
-        "id": "c4",
-        "name": "التنويع في استراتيجيات التدريس",
-        "weight": "10%",
-        "order": 4
-    },
-    {
-        "id": "c5",
-        "name": "تحسين نتائج المتعلمين",
-        "weight": "10%",
-        "order": 5
-    },
-    {
-        "id": "c6",
-        "name": "إعداد وتنفيذ خطة التعلم",
-        "weight": "10%",
-        "order": 6
-    },
-    {
-        "id": "c7",
-        "name": "توظيف تقنيات ووسائل التعليم المناسبة",
-        "weight": "10%",
-        "order": 7
-    },
-    {
-        "id": "c8",
-        "name": "تهيئة البيئة التعليمية",
-        "weight": "5%",
-        "order": 8
-    },
-    {
-        "id": "c9",
-        "name": "الإدارة الصفية",
-        "weight": "5%",
-        "order": 9
-    },
-    {
-        "id": "c10",
-        "name": "تحليل نتائج المتعلمين وتشخيص مستوياتهم",
-        "weight": "10%",
-        "order": 10
-    },
-    {
-        "id": "c11",
-        "name": "تنوع أساليب التقويم",
-        "weight": "10%",
-        "order": 11
-    }
-]
-
-# ============================================================================
-# التصنيفات الفرعية
-# ============================================================================
-
-SUBCATEGORIES = [
-    # c1: أداء الواجبات الوظيفية
-    {"id": "c1_s1", "criterion_id": "c1", "name": "يطبق الأنظمة وقواعد السلوك الوظيفية وأخلاقيات بيئة التعلم", "order": 1},
-    {"id": "c1_s2", "criterion_id": "c1", "name": "حماية البيانات والمعلومات التي تتعلق بالعمل أو الأنشطة المهنية من الوصول غير المصرح به", "order": 2},
-    {"id": "c1_s3", "criterion_id": "c1", "name": "التعاون مع المؤسسات الحكومية في المبادرات الوطنية", "order": 3},
-    {"id": "c1_s4", "criterion_id": "c1", "name": "تنظيم أنشطة توعوية حول أهمية الانتماء الوطني", "order": 4},
-    {"id": "c1_s5", "criterion_id": "c1", "name": "تنظيم أنشطة توعوية حول أهمية الانتماء (المدرسي والمجتمعي)", "order": 5},
-    {"id": "c1_s6", "criterion_id": "c1", "name": "الامتثال للقوانين واللوائح وسياسات وإجراءات العمل", "order": 6},
-    
-    # c2: التفاعل مع المجتمع المهني
-    {"id": "c2_s1", "criterion_id": "c2", "name": "حضور المؤتمرات والندوات التعليمية", "order": 1},
-    {"id": "c2_s2", "criterion_id": "c2", "name": "المشاركة في ورش العمل التدريبية لتحسين المهارات التعليمية", "order": 2},
-    {"id": "c2_s3", "criterion_id": "c2", "name": "الالتحاق ببرامج تدريبية لتعلم أساليب تدريس حديثة", "order": 3},
-    {"id": "c2_s4", "criterion_id": "c2", "name": "الحصول على شهادات مهنية معتمدة في مجال التعليم", "order": 4},
-    {"id": "c2_s5", "criterion_id": "c2", "name": "إطلاق مبادرات تعليمية لتحسين جودة التعليم", "order": 5},
-    {"id": "c2_s6", "criterion_id": "c2", "name": "تقديم استشارات تربوية للمعلمين الجدد", "order": 6},
-    {"id": "c2_s7", "criterion_id": "c2", "name": "تبادل الخبرات مع المعلمين في نفس التخصص أو تخصصات أخرى", "order": 7},
-    {"id": "c2_s8", "criterion_id": "c2", "name": "التفكير الذاتي لتحسين الممارسات وبناء بيئة تعليمية تعزز التعلم المستمر", "order": 8},
-    
-    # c3: التفاعل مع أولياء الأمور
-    {"id": "c3_s1", "criterion_id": "c3", "name": "تنظيم اجتماعات دورية مع أولياء الأمور لمناقشة تقدم الطلاب", "order": 1},
-    {"id": "c3_s2", "criterion_id": "c3", "name": "إرسال تقارير منتظمة عن أداء الطلاب أكاديمياً وسلوكياً", "order": 2},
-    {"id": "c3_s3", "criterion_id": "c3", "name": "استخدام وسائل التواصل الحديثة لإبقاء أولياء الأمور على اطلاع", "order": 3},
-    {"id": "c3_s4", "criterion_id": "c3", "name": "الاستجابة والاستماع لملاحظات ومخاوف أولياء الأمور", "order": 4},
-    {"id": "c3_s5", "criterion_id": "c3", "name": "تشجيع أولياء الأمور بالمشاركة في العملية التعليمية", "order": 5},
-    
-    # c4: التنويع في استراتيجيات التدريس
-    {"id": "c4_s1", "criterion_id": "c4", "name": "استخدام التعلم النشط مثل المناقشات الجماعية والعروض التقديمية", "order": 1},
-    {"id": "c4_s2", "criterion_id": "c4", "name": "تطبيق التعلم القائم على المشاريع لتعزيز الإبداع وحل المشكلات", "order": 2},
-    {"id": "c4_s3", "criterion_id": "c4", "name": "استخدام استراتيجيات تنمية التفكير (التفكير الناقد، الإبداعي، العصف الذهني)", "order": 3},
-    {"id": "c4_s4", "criterion_id": "c4", "name": "استخدام الوسائل البصرية والسمعية مثل الفيديوهات والصور", "order": 4},
-    {"id": "c4_s5", "criterion_id": "c4", "name": "تطبيق استراتيجيات التعليم المتمايز لتناسب أنماط التعلم المختلفة", "order": 5},
-    {"id": "c4_s6", "criterion_id": "c4", "name": "تطبيق استراتيجيات التعلم الحديثة (الصف المقلوب، الألعاب الإلكترونية، الرحلات المعرفية)", "order": 6},
-    {"id": "c4_s7", "criterion_id": "c4", "name": "تطبيق التعلم التعاوني واستراتيجيات العمل الجماعي", "order": 7},
-    
-    # c5: تحسين نتائج المتعلمين
-    {"id": "c5_s1", "criterion_id": "c5", "name": "تحديد أهداف ومعايير واضحة ليعرف المتعلمون ما يتوقع منهم تحقيقه", "order": 1},
-    {"id": "c5_s2", "criterion_id": "c5", "name": "تقديم إفادة سريعة ومحددة فور ملاحظة الأداء", "order": 2},
-    {"id": "c5_s3", "criterion_id": "c5", "name": "تكييف الإفادة وفق الاحتياجات الفردية للطلاب", "order": 3},
-    {"id": "c5_s4", "criterion_id": "c5", "name": "تعزيز الثقة وتشجيع التطور من خلال ملاحظات تشجيعية", "order": 4},
-    {"id": "c5_s5", "criterion_id": "c5", "name": "استخدام التكنولوجيا لتقديم الإفادة بطرق مبتكرة", "order": 5},
-    
-    # c6: إعداد وتنفيذ خطة التعلم
-    {"id": "c6_s1", "criterion_id": "c6", "name": "وضع أهداف تعليمية واضحة وقابلة للقياس", "order": 1},
-    {"id": "c6_s2", "criterion_id": "c6", "name": "تصميم خطة دراسية تتوافق مع المنهج الدراسي واحتياجات الطلاب", "order": 2},
-    {"id": "c6_s3", "criterion_id": "c6", "name": "مراجعة الخطط بشكل دوري وتعديلها بناءً على نتائج الطلاب", "order": 3},
-    {"id": "c6_s4", "criterion_id": "c6", "name": "مشاركة الخطط مع الزملاء للحصول على ملاحظات وتحسينها", "order": 4},
-    {"id": "c6_s5", "criterion_id": "c6", "name": "تفهم الخصائص النفسية للمرحلة العمرية التي يقوم بتدريسها", "order": 5},
-    
-    # c7: توظيف تقنيات ووسائل التعليم المناسبة
-    {"id": "c7_s1", "criterion_id": "c7", "name": "استخدام السبورات الذكية والأجهزة اللوحية في التدريس", "order": 1},
-    {"id": "c7_s2", "criterion_id": "c7", "name": "تطبيق برامج التعلم الالكتروني مثل منصات التعليم عن بعد", "order": 2},
-    {"id": "c7_s3", "criterion_id": "c7", "name": "تشجيع الطلاب على استخدام التطبيقات التعليمية لتعزيز التعلم الذاتي", "order": 3},
-    {"id": "c7_s4", "criterion_id": "c7", "name": "تنظيم ورش العمل حول استخدام التكنولوجيا في التعليم", "order": 4},
-    
-    # c8: تهيئة البيئة التعليمية
-    {"id": "c8_s1", "criterion_id": "c8", "name": "تزيين الفصل بوسائل تعليمية جذابة", "order": 1},
-    {"id": "c8_s2", "criterion_id": "c8", "name": "تنظيم الفصل بشكل يسهل الحركة والتفاعل", "order": 2},
-    {"id": "c8_s3", "criterion_id": "c8", "name": "توفير الأدوات والموارد التعليمية اللازمة", "order": 3},
-    {"id": "c8_s4", "criterion_id": "c8", "name": "توفير بيئة تعليمية آمنة وخالية من الأخطار المادية", "order": 4},
-    {"id": "c8_s5", "criterion_id": "c8", "name": "تمكين المتعلمين من التعبير عن أنفسهم ومشاركة أفكارهم", "order": 5},
-    {"id": "c8_s6", "criterion_id": "c8", "name": "إثارة دافعية المتعلمين من خلال التنوع في أساليب التعلم", "order": 6},
-    
-    # c9: الإدارة الصفية
-    {"id": "c9_s1", "criterion_id": "c9", "name": "وضع قواعد واضحة للسلوك في الصف", "order": 1},
-    {"id": "c9_s2", "criterion_id": "c9", "name": "استخدام أساليب تحفيزية لتشجيع الطلاب على الالتزام", "order": 2},
-    {"id": "c9_s3", "criterion_id": "c9", "name": "التعامل مع المشكلات السلوكية بشكل عادل وحازم", "order": 3},
-    {"id": "c9_s4", "criterion_id": "c9", "name": "تنظيم الوقت بشكل فعال خلال الحصة", "order": 4},
-    
-    # c10: تحليل نتائج المتعلمين وتشخيص مستوياتهم
-    {"id": "c10_s1", "criterion_id": "c10", "name": "استخدام اختبارات تقييمية دورية لقياس تقدم الطلاب", "order": 1},
-    {"id": "c10_s2", "criterion_id": "c10", "name": "تحليل النتائج لتحديد نقاط القوة والضعف", "order": 2},
-    {"id": "c10_s3", "criterion_id": "c10", "name": "توفير تغذية راجعة فردية للطلاب", "order": 3},
-    {"id": "c10_s4", "criterion_id": "c10", "name": "تطبيق خطط علاجية للطلاب الذين يحتاجون إلى دعم", "order": 4},
-    {"id": "c10_s5", "criterion_id": "c10", "name": "قياس التطبيق العملي للمعرفة عبر مواقف ومشاريع حقيقية", "order": 5},
-    
-    # c11: تنوع أساليب التقويم
-    {"id": "c11_s1", "criterion_id": "c11", "name": "استخدام الاختبارات الكتابية والشفوية", "order": 1},
-    {"id": "c11_s2", "criterion_id": "c11", "name": "تطبيق التقييم العملي من خلال المشاريع والعروض", "order": 2},
-    {"id": "c11_s3", "criterion_id": "c11", "name": "استخدام التقييم التكويني لتتبع تقدم الطلاب", "order": 3},
-    {"id": "c11_s4", "criterion_id": "c11", "name": "استخدام التقويم القبلي للوقوف على مدى استعداد المتعلمين", "order": 4},
-    {"id": "c11_s5", "criterion_id": "c11", "name": "تطبيق التقويم الختامي لمعرفة مدى تحقق الأهداف", "order": 5}
-]
-
-# ============================================================================
-# التقارير (أكثر من 1100 تقرير) - بعد إزالة التحيز للمواد الدراسية
-# ============================================================================
-
-REPORTS = [
-    # ======================================================
-    # c1_s1: يطبق الأنظمة وقواعد السلوك الوظيفية
-    # ======================================================
-    {"id": "r_c1_s1_001", "subcategory_id": "c1_s1", "name": "تقرير عن التزامي بارتداء الزي الوطني السعودي يومياً خلال الدوام الرسمي", "order": 1},
-    {"id": "r_c1_s1_002", "subcategory_id": "c1_s1", "name": "توثيق لمهام الإشراف اليومي على الطابور الصباحي ومتابعة اصطفاف الطلاب", "order": 2},
-    {"id": "r_c1_s1_003", "subcategory_id": "c1_s1", "name": "تقرير عن الإشراف على الفسحة المدرسية ومتابعة سلوك الطلاب وتوجيههم", "order": 3},
-    {"id": "r_c1_s1_004", "subcategory_id": "c1_s1", "name": "توثيق جدول المناوبة نهاية اليوم الدراسي والإشراف على خروج الطلاب", "order": 4},
-    {"id": "r_c1_s1_005", "subcategory_id": "c1_s1", "name": "تقرير عن الالتزام بالحضور قبل بداية الطابور الصباحي بخمس عشرة دقيقة", "order": 5},
-    {"id": "r_c1_s1_006", "subcategory_id": "c1_s1", "name": "توثيق لتفعيل لائحة السلوك والمواظبة مع طالب كثير الغياب ومتابعته", "order": 6},
-    {"id": "r_c1_s1_007", "subcategory_id": "c1_s1", "name": "تقرير عن الالتزام بالجدول الدراسي وعدم مغادرة الفصل أثناء الحصة", "order": 7},
-    {"id": "r_c1_s1_008", "subcategory_id": "c1_s1", "name": "توثيق للمشاركة الفاعلة في اجتماعات مجلس المعلمين الأسبوعية", "order": 8},
-    {"id": "r_c1_s1_009", "subcategory_id": "c1_s1", "name": "تقرير عن تطبيق تعليمات الاختبارات وعدم السماح بالغش داخل القاعة", "order": 9},
-    {"id": "r_c1_s1_010", "subcategory_id": "c1_s1", "name": "توثيق للالتزام بتعبئة سجل متابعة الطلاب وتوثيق الملاحظات اليومية", "order": 10},
-
-    # ======================================================
-    # c1_s2: حماية البيانات والمعلومات
-    # ======================================================
-    {"id": "r_c1_s2_001", "subcategory_id": "c1_s2", "name": "تقرير عن تسليم كشوف الدرجات النهائية للإدارة في مظاريف مغلقة", "order": 1},
-    {"id": "r_c1_s2_002", "subcategory_id": "c1_s2", "name": "توثيق لحفظ سجلات متابعة الطلاب في ملفات داخل خزانة مغلقة بالفصل", "order": 2},
-    {"id": "r_c1_s2_003", "subcategory_id": "c1_s2", "name": "تقرير عن الالتزام بعدم تصوير أوراق الأسئلة أو نماذج الإجابة ونشرها", "order": 3},
-    {"id": "r_c1_s2_004", "subcategory_id": "c1_s2", "name": "توثيق لاستخدام نظام نور بشكل آمن وتأمين كلمة المرور وعدم مشاركتها", "order": 4},
-    {"id": "r_c1_s2_005", "subcategory_id": "c1_s2", "name": "تقرير عن إتلاف أوراق الاختبارات بعد انتهاء العام الدراسي بطريقة آمنة", "order": 5},
-    {"id": "r_c1_s2_006", "subcategory_id": "c1_s2", "name": "توثيق لعدم مشاركة صور الطلاب أو نتائجهم على وسائل التواصل الاجتماعي", "order": 6},
-    {"id": "r_c1_s2_007", "subcategory_id": "c1_s2", "name": "تقرير عن حفظ تقارير الطلاب ذوي المشكلات السلوكية في ملفات سرية", "order": 7},
-    {"id": "r_c1_s2_008", "subcategory_id": "c1_s2", "name": "توثيق للتأكد من تسجيل الخروج من منصة مدرستي بعد الانتهاء من العمل", "order": 8},
-    {"id": "r_c1_s2_009", "subcategory_id": "c1_s2", "name": "تقرير عن عدم ترك أوراق الدرجات أو كشوف الرصد على المكتب أمام الزوار", "order": 9},
-    {"id": "r_c1_s2_010", "subcategory_id": "c1_s2", "name": "توثيق للتعامل مع سجلات الطلاب المحولة من التوجيه الطلابي بسرية تامة", "order": 10},
-
-    # ======================================================
-    # c1_s3: التعاون مع المؤسسات الحكومية
-    # ======================================================
-    {"id": "r_c1_s3_001", "subcategory_id": "c1_s3", "name": "تقرير عن المشاركة في تفعيل فعاليات اليوم الوطني السعودي بالمدرسة", "order": 1},
-    {"id": "r_c1_s3_002", "subcategory_id": "c1_s3", "name": "توثيق لتفعيل برنامج رفق للإرشاد الطلابي بالتعاون مع وحدة الخدمات", "order": 2},
-    {"id": "r_c1_s3_003", "subcategory_id": "c1_s3", "name": "تقرير عن تنظيم محاضرة توعوية عن أضرار التدخين مع مكافحة التدخين", "order": 3},
-    {"id": "r_c1_s3_004", "subcategory_id": "c1_s3", "name": "توثيق لمشاركة المدرسة في حملة التبرع بالدم بالتعاون مع مستشفى المنطقة", "order": 4},
-    {"id": "r_c1_s3_005", "subcategory_id": "c1_s3", "name": "تقرير عن استضافة الدفاع المدني لتدريب الطلاب على خطط الإخلاء", "order": 5},
-    {"id": "r_c1_s3_006", "subcategory_id": "c1_s3", "name": "توثيق لمشاركتي في مبادرة السعودية الخضراء بزراعة شتلات في المدرسة", "order": 6},
-    {"id": "r_c1_s3_007", "subcategory_id": "c1_s3", "name": "تقرير عن تفعيل برنامج فطن لتنمية المهارات الشخصية والاجتماعية", "order": 7},
-    {"id": "r_c1_s3_008", "subcategory_id": "c1_s3", "name": "توثيق لتنظيم رحلة لطلاب الثانوي لزيارة معرض أمننا بمناسبة اليوم العالمي", "order": 8},
-    {"id": "r_c1_s3_009", "subcategory_id": "c1_s3", "name": "تقرير عن المشاركة في حملة التوعية المرورية مع المرور السعودي", "order": 9},
-    {"id": "r_c1_s3_010", "subcategory_id": "c1_s3", "name": "توثيق للتعاون مع هيئة الأمر بالمعروف في برامج الأمن الفكري", "order": 10},
-
-    # ======================================================
-    # c1_s4: تنظيم أنشطة توعوية عن الانتماء الوطني
-    # ======================================================
-    {"id": "r_c1_s4_001", "subcategory_id": "c1_s4", "name": "تقرير عن تفعيل الإذاعة المدرسية بكلمات عن حب الوطن في الطابور الصباحي", "order": 1},
-    {"id": "r_c1_s4_002", "subcategory_id": "c1_s4", "name": "توثيق مسابقة فنية (رسم وتلوين) لطلاب الابتدائي عن معالم المملكة", "order": 2},
-    {"id": "r_c1_s4_003", "subcategory_id": "c1_s4", "name": "تقرير عن تنظيم ندوة قصيرة لطلاب المتوسط عن رؤية 2030 وإنجازات الوطن", "order": 3},
-    {"id": "r_c1_s4_004", "subcategory_id": "c1_s4", "name": "توثيق المشاركة في احتفالات المدرسة بيوم التأسيس", "order": 4},
-    {"id": "r_c1_s4_005", "subcategory_id": "c1_s4", "name": "تقرير عن إعداد مجلة حائطية عن أئمة وملوك المملكة وإنجازاتهم", "order": 5},
-    {"id": "r_c1_s4_006", "subcategory_id": "c1_s4", "name": "توثيق فعالية الزي الوطني بتشجيع الطلاب على ارتداء الزي السعودي", "order": 6},
-    {"id": "r_c1_s4_007", "subcategory_id": "c1_s4", "name": "تقرير عن تنظيم مسابقة شعرية عن الوطنية لطلاب المرحلة الثانوية", "order": 7},
-    {"id": "r_c1_s4_008", "subcategory_id": "c1_s4", "name": "توثيق لتنظيم رحلة مدرسية لزيارة متحف وطني أو معلم تاريخي", "order": 8},
-    {"id": "r_c1_s4_009", "subcategory_id": "c1_s4", "name": "تقرير عن تخصيص حصة النشاط للحديث عن المناسبات الوطنية", "order": 9},
-    {"id": "r_c1_s4_010", "subcategory_id": "c1_s4", "name": "توثيق لمشاركة الطلاب في ترديد النشيد الوطني بانضباط في الطابور", "order": 10},
-
-    # ======================================================
-    # c1_s5: تنظيم أنشطة توعوية عن الانتماء المدرسي والمجتمعي
-    # ======================================================
-    {"id": "r_c1_s5_001", "subcategory_id": "c1_s5", "name": "تقرير عن حث الطلاب على الحفاظ على نظافة المدرسة وفصولهم", "order": 1},
-    {"id": "r_c1_s5_002", "subcategory_id": "c1_s5", "name": "توثيق فعالية أنا ساعد مدرستي لتجميل ساحة المدرسة", "order": 2},
-    {"id": "r_c1_s5_003", "subcategory_id": "c1_s5", "name": "تقرير عن تنظيم برنامج ترحيب بالطلاب المستجدين في الصف الأول الابتدائي", "order": 3},
-    {"id": "r_c1_s5_004", "subcategory_id": "c1_s5", "name": "توثيق مسابقة أفضل فصل لتعزيز روح الانتماء للمكان", "order": 4},
-    {"id": "r_c1_s5_005", "subcategory_id": "c1_s5", "name": "تقرير عن تخصيص حصة للحديث عن تاريخ المدرسة وإنجازاتها السابقة", "order": 5},
-    {"id": "r_c1_s5_006", "subcategory_id": "c1_s5", "name": "توثيق مشاركة الطلاب في الإذاعة المدرسية لتعزيز ثقتهم وانتمائهم", "order": 6},
-    {"id": "r_c1_s5_007", "subcategory_id": "c1_s5", "name": "تقرير عن تنظيم حملة توعوية عن احترام المعلم والعاملين في المدرسة", "order": 7},
-    {"id": "r_c1_s5_008", "subcategory_id": "c1_s5", "name": "توثيق فعالية تعزيز الهوية من خلال الأزياء الشعبية في المناسبات", "order": 8},
-    {"id": "r_c1_s5_009", "subcategory_id": "c1_s5", "name": "تقرير عن تشجيع الطلاب على المشاركة في أعمال تطوعية لخدمة الحي", "order": 9},
-    {"id": "r_c1_s5_010", "subcategory_id": "c1_s5", "name": "توثيق لبرنامج توجيهي عن أهمية احترام ممتلكات المدرسة العامة", "order": 10},
-
-    # ======================================================
-    # c1_s6: الامتثال للقوانين واللوائح
-    # ======================================================
-    {"id": "r_c1_s6_001", "subcategory_id": "c1_s6", "name": "تقرير عن تطبيق سياسة منع الغش في الاختبارات كما هو منصوص عليه", "order": 1},
-    {"id": "r_c1_s6_002", "subcategory_id": "c1_s6", "name": "توثيق للإجراءات المتبعة أثناء مناوبة نهاية اليوم لضمان سلامة الخروج", "order": 2},
-    {"id": "r_c1_s6_003", "subcategory_id": "c1_s6", "name": "تقرير عن تطبيق خطة الإخلاء في حالات الطوارئ والتدريب عليها مع الطلاب", "order": 3},
-    {"id": "r_c1_s6_004", "subcategory_id": "c1_s6", "name": "توثيق للالتزام بسياسة استقبال أولياء الأمور في الأوقات المخصصة فقط", "order": 4},
-    {"id": "r_c1_s6_005", "subcategory_id": "c1_s6", "name": "تقرير عن تطبيق لائحة تقويم الطالب في رصد الدرجات", "order": 5},
-    {"id": "r_c1_s6_006", "subcategory_id": "c1_s6", "name": "توثيق للامتثال لإجراءات التعامل مع الطلاب ذوي الإعاقة داخل الفصل", "order": 6},
-    {"id": "r_c1_s6_007", "subcategory_id": "c1_s6", "name": "تقرير عن تطبيق إجراءات السلامة في المعامل والفصول الدراسية", "order": 7},
-    {"id": "r_c1_s6_008", "subcategory_id": "c1_s6", "name": "توثيق للالتزام بسياسة الإجازات المرضية وتقديم التقارير الرسمية", "order": 8},
-    {"id": "r_c1_s6_009", "subcategory_id": "c1_s6", "name": "تقرير عن تطبيق تعليمات الاختبارات وعدم مغادرة قاعة الاختبار", "order": 9},
-    {"id": "r_c1_s6_010", "subcategory_id": "c1_s6", "name": "توثيق للالتزام بإجراءات تسليم المقررات الدراسية في بداية العام", "order": 10},
-
-    # ======================================================
-    # c2_s1: حضور المؤتمرات والندوات التعليمية
-    # ======================================================
-    {"id": "r_c2_s1_001", "subcategory_id": "c2_s1", "name": "شهادة حضور لندوة التعليم في العصر الرقمي التي أقامتها إدارة التعليم", "order": 1},
-    {"id": "r_c2_s1_002", "subcategory_id": "c2_s1", "name": "تقرير عن مشاركتي في المؤتمر الافتراضي تطوير مهارات المعلمين", "order": 2},
-    {"id": "r_c2_s1_003", "subcategory_id": "c2_s1", "name": "حضور ندوة استراتيجيات التعامل مع المراهقين في مركز التدريب التربوي", "order": 3},
-    {"id": "r_c2_s1_004", "subcategory_id": "c2_s1", "name": "تقرير عن استفادتي من ندوة التقييم من أجل التعلم وتطبيق أفكارها", "order": 4},
-    {"id": "r_c2_s1_005", "subcategory_id": "c2_s1", "name": "شهادة حضور المؤتمر السنوي الأول للمدرسة", "order": 5},
-    {"id": "r_c2_s1_006", "subcategory_id": "c2_s1", "name": "تقرير عن مشاركتي في ندوة تعريفية عن المناهج المطورة", "order": 6},
-    {"id": "r_c2_s1_007", "subcategory_id": "c2_s1", "name": "حضور فعاليات اليوم العالمي للمعلم على مستوى الحي", "order": 7},
-    {"id": "r_c2_s1_008", "subcategory_id": "c2_s1", "name": "تقرير عن حضور ندوة عبر الإنترنت حول الذكاء العاطفي للمعلم", "order": 8},
-    {"id": "r_c2_s1_009", "subcategory_id": "c2_s1", "name": "شهادة حضور مؤتمر الصحة النفسية للطلاب في الجامعة", "order": 9},
-    {"id": "r_c2_s1_010", "subcategory_id": "c2_s1", "name": "تقرير عن المشاركة في ندوة المواطنة الرقمية المقدمة من وزارة التعليم", "order": 10},
-
-    # ======================================================
-    # c2_s2: المشاركة في ورش العمل التدريبية
-    # ======================================================
-    {"id": "r_c2_s2_001", "subcategory_id": "c2_s2", "name": "شهادة حضور ورشة عمل صناعة الوسائل التعليمية من الخامات البيئية", "order": 1},
-    {"id": "r_c2_s2_002", "subcategory_id": "c2_s2", "name": "تقرير عن مشاركتي في ورشة إدارة الصف بفاعلية", "order": 2},
-    {"id": "r_c2_s2_003", "subcategory_id": "c2_s2", "name": "حضور ورشة عمل تصميم الاختبارات الإلكترونية على منصة مدرستي", "order": 3},
-    {"id": "r_c2_s2_004", "subcategory_id": "c2_s2", "name": "تقرير عن ورشة تنمية مهارات التفكير الناقد عند الطلاب", "order": 4},
-    {"id": "r_c2_s2_005", "subcategory_id": "c2_s2", "name": "شهادة حضور ورشة عمل مهارات التعامل مع صعوبات التعلم", "order": 5},
-    {"id": "r_c2_s2_006", "subcategory_id": "c2_s2", "name": "تقرير عن تطبيقي لاستراتيجيات تعلمتها من ورشة التعلم باللعب مع الطلاب", "order": 6},
-    {"id": "r_c2_s2_007", "subcategory_id": "c2_s2", "name": "حضور ورشة عمل إعداد خطط علاجية للطلاب المتعثرين", "order": 7},
-    {"id": "r_c2_s2_008", "subcategory_id": "c2_s2", "name": "تقرير عن ورشة فن الإلقاء والعرض التقديمي للمعلم", "order": 8},
-    {"id": "r_c2_s2_009", "subcategory_id": "c2_s2", "name": "شهادة حضور ورشة أمن المعلومات في المنظومة التعليمية", "order": 9},
-    {"id": "r_c2_s2_010", "subcategory_id": "c2_s2", "name": "حضور ورشة أنشطة تقوية مهارات القراءة والكتابة للصفوف الأولية", "order": 10},
-
-    # ======================================================
-    # c2_s3: الالتحاق ببرامج تدريبية
-    # ======================================================
-    {"id": "r_c2_s3_001", "subcategory_id": "c2_s3", "name": "شهادة اجتياز برنامج التعلم القائم على المشروعات عبر منصة دروب", "order": 1},
-    {"id": "r_c2_s3_002", "subcategory_id": "c2_s3", "name": "تقرير عن إكمال دورة استراتيجيات التعلم النشط في أكاديمية المعلم", "order": 2},
-    {"id": "r_c2_s3_003", "subcategory_id": "c2_s3", "name": "شهادة حضور برنامج تدريبي عن تطبيقات الذكاء الاصطناعي في التعليم", "order": 3},
-    {"id": "r_c2_s3_004", "subcategory_id": "c2_s3", "name": "تقرير عن التحاقي ببرنامج التقويم البديل (ملف الإنجاز) عبر التدريب عن بعد", "order": 4},
-    {"id": "r_c2_s3_005", "subcategory_id": "c2_s3", "name": "شهادة اجتياز برنامج الصف المقلوب وأثره في التحصيل الدراسي", "order": 5},
-    {"id": "r_c2_s3_006", "subcategory_id": "c2_s3", "name": "تقرير عن تطبيقي لأسلوب التلعيب في التدريس بعد حضوري دورة متخصصة", "order": 6},
-    {"id": "r_c2_s3_007", "subcategory_id": "c2_s3", "name": "شهادة حضور برنامج الوعي الصوتي لمعلمي الصفوف الأولية", "order": 7},
-    {"id": "r_c2_s3_008", "subcategory_id": "c2_s3", "name": "تقرير عن دورة المهارات القيادية للمعلم داخل الفصل", "order": 8},
-    {"id": "r_c2_s3_009", "subcategory_id": "c2_s3", "name": "شهادة برنامج تدريبي عن أنماط التعلم (VARK) وكيفية مراعاتها", "order": 9},
-    {"id": "r_c2_s3_010", "subcategory_id": "c2_s3", "name": "تقرير عن الاستفادة من برنامج تحسين المهارات اللغوية", "order": 10},
-
-    # ======================================================
-    # c2_s4: الحصول على شهادات مهنية معتمدة
-    # ======================================================
-    {"id": "r_c2_s4_001", "subcategory_id": "c2_s4", "name": "شهادة (IC3) في أساسيات الحاسب الآلي وتطبيقاته", "order": 1},
-    {"id": "r_c2_s4_002", "subcategory_id": "c2_s4", "name": "شهادة (EF SET) أو (IELTS) لمستوى اللغة الإنجليزية", "order": 2},
-    {"id": "r_c2_s4_003", "subcategory_id": "c2_s4", "name": "شهادة معتمدة في تأهيل المعلمين", "order": 3},
-    {"id": "r_c2_s4_004", "subcategory_id": "c2_s4", "name": "تقرير عن الحصول على شهادة المعلم الخبير من إحدى المؤسسات التدريبية", "order": 4},
-    {"id": "r_c2_s4_005", "subcategory_id": "c2_s4", "name": "شهادة في إدارة الصفوف الافتراضية من منصة مدرستي", "order": 5},
-    {"id": "r_c2_s4_006", "subcategory_id": "c2_s4", "name": "شهادة أساسيات التوجيه المهني والإرشاد الطلابي", "order": 6},
-    {"id": "r_c2_s4_007", "subcategory_id": "c2_s4", "name": "شهادة دبلومة التأهيل التربوي من إحدى الكليات", "order": 7},
-    {"id": "r_c2_s4_008", "subcategory_id": "c2_s4", "name": "شهادة معتمدة في صعوبات التعلم النمائية", "order": 8},
-    {"id": "r_c2_s4_009", "subcategory_id": "c2_s4", "name": "شهادة تصميم وإنتاج المحتوى الرقمي التفاعلي", "order": 9},
-    {"id": "r_c2_s4_010", "subcategory_id": "c2_s4", "name": "شهادة اجتياز اختبار الرخصة المهنية", "order": 10},
-
-    # ======================================================
-    # c2_s5: إطلاق مبادرات تعليمية
-    # ======================================================
-    {"id": "r_c2_s5_001", "subcategory_id": "c2_s5", "name": "تقرير عن إطلاق مبادرة قارئ الشهر لتشجيع القراءة الحرة بين الطلاب", "order": 1},
-    {"id": "r_c2_s5_002", "subcategory_id": "c2_s5", "name": "توثيق مبادرة مصححون صغار لتصحيح أخطاء بعضهم البعض", "order": 2},
-    {"id": "r_c2_s5_003", "subcategory_id": "c2_s5", "name": "تقرير عن مبادرتي لتبسيط المصطلحات وتقريب المفاهيم للطلاب", "order": 3},
-    {"id": "r_c2_s5_004", "subcategory_id": "c2_s5", "name": "توثيق مبادرة منصة للتفوق لمشاركة ملخصات الدروس للطلاب المتغيبين", "order": 4},
-    {"id": "r_c2_s5_005", "subcategory_id": "c2_s5", "name": "تقرير عن مبادرة فصل بلا غياب بالتعاون مع طلاب الصف", "order": 5},
-    {"id": "r_c2_s5_006", "subcategory_id": "c2_s5", "name": "توثيق مبادرة لتحسين الخط وتحسين جودة الكتابة", "order": 6},
-    {"id": "r_c2_s5_007", "subcategory_id": "c2_s5", "name": "تقرير عن إطلاق مبادرة سفراء الأمن لتعزيز السلامة في المدرسة", "order": 7},
-    {"id": "r_c2_s5_008", "subcategory_id": "c2_s5", "name": "توثيق مبادرة المرشد الصغير لمساعدة الطلاب الجدد على الاندماج", "order": 8},
-    {"id": "r_c2_s5_009", "subcategory_id": "c2_s5", "name": "تقرير عن مبادرة ورشة إبداع لطلاب الموهوبين داخل الفصل", "order": 9},
-    {"id": "r_c2_s5_010", "subcategory_id": "c2_s5", "name": "توثيق مبادرة التعلم التشاركي حيث يطرح الطلاب أسئلة لبعضهم", "order": 10},
-
-    # ======================================================
-    # c2_s6: تقديم استشارات تربوية للمعلمين الجدد
-    # ======================================================
-    {"id": "r_c2_s6_001", "subcategory_id": "c2_s6", "name": "تقرير عن لقاء تعريفي للمعلمين الجدد بسياسة المدرسة ونظام التعامل مع الطلاب", "order": 1},
-    {"id": "r_c2_s6_002", "subcategory_id": "c2_s6", "name": "توثيق لاجتماعي مع معلم جديد لمساعدته في إعداد خطة تحضير أسبوعية", "order": 2},
-    {"id": "r_c2_s6_003", "subcategory_id": "c2_s6", "name": "تقرير عن مشاركتي خبرتي في كيفية إدارة وقت الحصة مع معلم حديث", "order": 3},
-    {"id": "r_c2_s6_004", "subcategory_id": "c2_s6", "name": "توثيق لمساعدة معلم جديد في استخدام منصة مدرستي لرفع الدرجات", "order": 4},
-    {"id": "r_c2_s6_005", "subcategory_id": "c2_s6", "name": "تقرير عن توجيه معلم جديد في كيفية التعامل مع ولي أمر غاضب", "order": 5},
-    {"id": "r_c2_s6_006", "subcategory_id": "c2_s6", "name": "توثيق لحضوري حصة لمعلم جديد وتقديم تغذية راجعة بناءة له", "order": 6},
-    {"id": "r_c2_s6_007", "subcategory_id": "c2_s6", "name": "تقرير عن إرشاد معلم جديد لطرق تشجيع الطلاب الخجولين على المشاركة", "order": 7},
-    {"id": "r_c2_s6_008", "subcategory_id": "c2_s6", "name": "توثيق لشرح آلية التعامل مع الطلاب ذوي فرط الحركة لمعلم مستجد", "order": 8},
-    {"id": "r_c2_s6_009", "subcategory_id": "c2_s6", "name": "تقرير عن لقاء غير رسمي (مجلس معلمين) لتبادل الخبرات مع الزملاء الجدد", "order": 9},
-    {"id": "r_c2_s6_010", "subcategory_id": "c2_s6", "name": "توثيق مساهمتي في إعداد دليل إرشادي للمعلم الجديد في المدرسة", "order": 10},
-
-    # ======================================================
-    # c2_s7: تبادل الخبرات مع المعلمين
-    # ======================================================
-    {"id": "r_c2_s7_001", "subcategory_id": "c2_s7", "name": "تقرير عن اجتماع فريق المواد الدراسية لمناقشة خطة تدريس موحدة", "order": 1},
-    {"id": "r_c2_s7_002", "subcategory_id": "c2_s7", "name": "توثيق لتبادل نماذج أسئلة اختبارات مع معلم في مدرسة أخرى", "order": 2},
-    {"id": "r_c2_s7_003", "subcategory_id": "c2_s7", "name": "تقرير عن مشاركتي استراتيجية ناجحة في التدريس مع زملائي", "order": 3},
-    {"id": "r_c2_s7_004", "subcategory_id": "c2_s7", "name": "توثيق لقاء مع معلم تربية فنية لتصميم وسيلة تعليمية مشتركة", "order": 4},
-    {"id": "r_c2_s7_005", "subcategory_id": "c2_s7", "name": "تقرير عن التعاون مع معلم الحاسب لتصميم اختبار إلكتروني تفاعلي", "order": 5},
-    {"id": "r_c2_s7_006", "subcategory_id": "c2_s7", "name": "توثيق لحلقة نقاش مع معلمي الصفوف الأولية حول تحسين القراءة", "order": 6},
-    {"id": "r_c2_s7_007", "subcategory_id": "c2_s7", "name": "تقرير عن مشاركتي في مجموعة (واتساب) خاصة بمعلمي التخصص لتبادل الخبرات", "order": 7},
-    {"id": "r_c2_s7_008", "subcategory_id": "c2_s7", "name": "توثيق لزيارة صفية لمعلم متميز في المدرسة للاستفادة من أسلوبه", "order": 8},
-    {"id": "r_c2_s7_009", "subcategory_id": "c2_s7", "name": "تقرير عن ورشة داخلية قمت بتقديمها لزملائي عن استخدام السبورة الذكية", "order": 9},
-    {"id": "r_c2_s7_010", "subcategory_id": "c2_s7", "name": "توثيق لتبادل مصادر تعليمية (فيديو، صور) مع المعلمين", "order": 10},
-
-    # ======================================================
-    # c2_s8: التفكير الذاتي لتحسين الممارسات
-    # ======================================================
-    {"id": "r_c2_s8_001", "subcategory_id": "c2_s8", "name": "تقرير أسبوعي شخصي (مذكرة تأملات) عن أنجح الحصص والأخطاء التي وقعت فيها", "order": 1},
-    {"id": "r_c2_s8_002", "subcategory_id": "c2_s8", "name": "توثيق لتسجيل فيديو لحصة دراسية ومشاهدتها لاحقًا لتقييم أدائي", "order": 2},
-    {"id": "r_c2_s8_003", "subcategory_id": "c2_s8", "name": "تقرير عن ملاحظاتي الذاتية على أداء الطلاب في الاختبار القصير وسبب تدني درجاتهم", "order": 3},
-    {"id": "r_c2_s8_004", "subcategory_id": "c2_s8", "name": "توثيق لخطة شخصية قمت بإعدادها لتطوير مهارة معينة لدي (مثل إدارة الصف)", "order": 4},
-    {"id": "r_c2_s8_005", "subcategory_id": "c2_s8", "name": "تقرير عن قراءة كتاب تربوي وتدوين كيف سيساعدني في تطوير أسلوبي", "order": 5},
-    {"id": "r_c2_s8_006", "subcategory_id": "c2_s8", "name": "توثيق لاستبيان رأي بسيط للطلاب عن حصتي وطريقة شرحي", "order": 6},
-    {"id": "r_c2_s8_007", "subcategory_id": "c2_s8", "name": "تقرير عن تعديل استراتيجية تدريسية بعد شعوري بعدم مناسبتها للمستوى العمري", "order": 7},
-    {"id": "r_c2_s8_008", "subcategory_id": "c2_s8", "name": "توثيق لأهدافي المهنية للسنة القادمة بناء على تحديّات هذا العام", "order": 8},
-    {"id": "r_c2_s8_009", "subcategory_id": "c2_s8", "name": "تقرير عن مراجعة خططي السابقة وتحديد ما يمكن تحسينه", "order": 9},
-    {"id": "r_c2_s8_010", "subcategory_id": "c2_s8", "name": "توثيق لتحديد نقاط ضعف لدي والعمل على حلها من خلال دورات تدريبية", "order": 10},
-
-    # ======================================================
-    # c3_s1: تنظيم اجتماعات دورية مع أولياء الأمور
-    # ======================================================
-    {"id": "r_c3_s1_001", "subcategory_id": "c3_s1", "name": "تقرير عن عقد لقاء فردي مع ولي أمر طالب متميز لمناقشة سبل دعمه", "order": 1},
-    {"id": "r_c3_s1_002", "subcategory_id": "c3_s1", "name": "توثيق لمشاركتي في مجلس الآباء والمعلمين الفصلي", "order": 2},
-    {"id": "r_c3_s1_003", "subcategory_id": "c3_s1", "name": "تقرير عن اجتماع عاجل مع ولي أمر طالب يعاني من صعوبات في التعلم", "order": 3},
-    {"id": "r_c3_s1_004", "subcategory_id": "c3_s1", "name": "توثيق لدعوة أولياء الأمور لحضور معرض إنجازات الطلاب", "order": 4},
-    {"id": "r_c3_s1_005", "subcategory_id": "c3_s1", "name": "تقرير عن تنظيم لقاء مفتوح لشرح خطة الفصل الدراسي الثاني لأولياء الأمور", "order": 5},
-    {"id": "r_c3_s1_006", "subcategory_id": "c3_s1", "name": "توثيق اجتماع هاتفي مع ولي أمر طالب متغيب لتدارك الأمر", "order": 6},
-    {"id": "r_c3_s1_007", "subcategory_id": "c3_s1", "name": "تقرير عن حوار مع ولي أمر طالب موهوب لتوفير أنشطة إثرائية له", "order": 7},
-    {"id": "r_c3_s1_008", "subcategory_id": "c3_s1", "name": "توثيق لقاء مع أولياء أمور فصل كامل لمناقشة نتائج الاختبارات", "order": 8},
-    {"id": "r_c3_s1_009", "subcategory_id": "c3_s1", "name": "تقرير عن اجتماع لمناقشة مشكلة سلوكية جماعية", "order": 9},
-    {"id": "r_c3_s1_010", "subcategory_id": "c3_s1", "name": "توثيق للقاء ختامي مع أولياء الأمور لمناقشة التقرير السنوي للطالب", "order": 10},
-
-    # ======================================================
-    # c3_s2: إرسال تقارير منتظمة عن أداء الطلاب
-    # ======================================================
-    {"id": "r_c3_s2_001", "subcategory_id": "c3_s2", "name": "نموذج من تقرير شهري أرسلته لأولياء الأمور عن درجات الواجبات", "order": 1},
-    {"id": "r_c3_s2_002", "subcategory_id": "c3_s2", "name": "تقرير أسبوعي عن السلوك العام للطالب عبر استمارة متابعة في دفتر الواجبات", "order": 2},
-    {"id": "r_c3_s2_003", "subcategory_id": "c3_s2", "name": "توثيق لإشعار (إيجابي) أرسلته لولي الأمر عن تميز ابنه في النشاط", "order": 3},
-    {"id": "r_c3_s2_004", "subcategory_id": "c3_s2", "name": "نموذج من بطاقة متابعة المهارات الأساسية للطلاب", "order": 4},
-    {"id": "r_c3_s2_005", "subcategory_id": "c3_s2", "name": "تقرير عن إرسال كشف بنتائج الاختبارات القصيرة (شهرية) عبر البريد الإلكتروني", "order": 5},
-    {"id": "r_c3_s2_006", "subcategory_id": "c3_s2", "name": "توثيق لتقرير سلوكي عن تحسن طالب كان كثير المشاكل", "order": 6},
-    {"id": "r_c3_s2_007", "subcategory_id": "c3_s2", "name": "نموذج من إشعار ضعف لطلب دعم ولي الأمر في المادة الدراسية", "order": 7},
-    {"id": "r_c3_s2_008", "subcategory_id": "c3_s2", "name": "تقرير عن إرسال خطة علاجية لولي الأمر لتطبيقها في المنزل", "order": 8},
-    {"id": "r_c3_s2_009", "subcategory_id": "c3_s2", "name": "توثيق لبطاقة إنجاز أسبوعية للطلاب الضعاف لرفع معنوياتهم واطلاع أولياء أمورهم", "order": 9},
-    {"id": "r_c3_s2_010", "subcategory_id": "c3_s2", "name": "تقرير فصلي مختوم من الإدارة عن مستوى الطالب", "order": 10},
-
-    # ======================================================
-    # c3_s3: استخدام وسائل التواصل الحديثة
-    # ======================================================
-    {"id": "r_c3_s3_001", "subcategory_id": "c3_s3", "name": "تقرير عن تفعيل مجموعة (واتساب) خاصة بالفصل للتنبيهات اليومية", "order": 1},
-    {"id": "r_c3_s3_002", "subcategory_id": "c3_s3", "name": "توثيق لاستخدام خاصية الإشعارات في نظام (نور) أو (مدرستي) لإرسال التنبيهات", "order": 2},
-    {"id": "r_c3_s3_003", "subcategory_id": "c3_s3", "name": "تقرير عن استخدام البريد الإلكتروني لإرسال ملفات تفاعلية لدعم الطلاب", "order": 3},
-    {"id": "r_c3_s3_004", "subcategory_id": "c3_s3", "name": "توثيق للتواصل عبر تطبيق (توكلنا) للاستفسار عن حالة الطالب الصحية", "order": 4},
-    {"id": "r_c3_s3_005", "subcategory_id": "c3_s3", "name": "تقرير عن إنشاء قناة على (تليجرام) لنشر ملخصات الدروس والفيديوهات التعليمية", "order": 5},
-    {"id": "r_c3_s3_006", "subcategory_id": "c3_s3", "name": "توثيق لاستخدام استبيانات (جوجل فورم) لاستطلاع رأي أولياء الأمور", "order": 6},
-    {"id": "r_c3_s3_007", "subcategory_id": "c3_s3", "name": "تقرير عن التواصل الفردي عبر الرسائل النصية القصيرة (SMS)", "order": 7},
-    {"id": "r_c3_s3_008", "subcategory_id": "c3_s3", "name": "توثيق لمشاركة صور الأنشطة الصفية مع أولياء الأمور عبر تطبيقات آمنة", "order": 8},
-    {"id": "r_c3_s3_009", "subcategory_id": "c3_s3", "name": "تقرير عن الرد على استفسارات أولياء الأمور عبر خاصية الدردشة في منصة المدرسة", "order": 9},
-    {"id": "r_c3_s3_010", "subcategory_id": "c3_s3", "name": "توثيق لاستخدام تقويم جوجل لمشاركة أولياء الأمور بمواعيد الاختبارات الهامة", "order": 10},
-
-    # ======================================================
-    # c3_s4: الاستجابة والاستماع لملاحظات أولياء الأمور
-    # ======================================================
-    {"id": "r_c3_s4_001", "subcategory_id": "c3_s4", "name": "تقرير عن استقبال شكوى ولي أمر حول صعوبة المادة ومناقشتها معه", "order": 1},
-    {"id": "r_c3_s4_002", "subcategory_id": "c3_s4", "name": "توثيق لملاحظة ولي أمر عن تنمر طالب على ابنه واتخاذ الإجراءات المناسبة", "order": 2},
-    {"id": "r_c3_s4_003", "subcategory_id": "c3_s4", "name": "تقرير عن اجتماع مع ولي أمر استجبت فيه لطلبه بتغيير طريقة التواصل مع ابنه", "order": 3},
-    {"id": "r_c3_s4_004", "subcategory_id": "c3_s4", "name": "توثيق لتعاوني مع ولي أمر طالب يعاني من قلق الاختبارات ووضع خطة تهدئة", "order": 4},
-    {"id": "r_c3_s4_005", "subcategory_id": "c3_s4", "name": "تقرير عن تعديل موعد تسليم واجب ثقيل بعد استفسار مجموعة من أولياء الأمور", "order": 5},
-    {"id": "r_c3_s4_006", "subcategory_id": "c3_s4", "name": "توثيق لمناقشة ولي أمر حول طريقة الشرح وتوضيح الهدف منها", "order": 6},
-    {"id": "r_c3_s4_007", "subcategory_id": "c3_s4", "name": "تقرير عن استقبال اقتراح ولي أمر لرحلة مدرسية وأخذ رأي الإدارة فيه", "order": 7},
-    {"id": "r_c3_s4_008", "subcategory_id": "c3_s4", "name": "توثيق لحل مشكلة سوء فهم بين الطالب والمعلم بالتعاون مع ولي الأمر", "order": 8},
-    {"id": "r_c3_s4_009", "subcategory_id": "c3_s4", "name": "تقرير عن استفسار ولي أمر عن سر تأخر ابنه الدراسي وتقديم خطة دعم له", "order": 9},
-    {"id": "r_c3_s4_010", "subcategory_id": "c3_s4", "name": "توثيق لشكر ولي أمر بعد حل مشكلة كان يعاني منها مع ابنه", "order": 10},
-
-    # ======================================================
-    # c3_s5: تشجيع أولياء الأمور بالمشاركة
-    # ======================================================
-    {"id": "r_c3_s5_001", "subcategory_id": "c3_s5", "name": "تقرير عن دعوة ولي أمر مهندس للتحدث مع الطلاب عن مهنته (للتوجيه المهني)", "order": 1},
-    {"id": "r_c3_s5_002", "subcategory_id": "c3_s5", "name": "توثيق لمشاركة ولي أمر في تحكيم مسابقة مدرسية", "order": 2},
-    {"id": "r_c3_s5_003", "subcategory_id": "c3_s5", "name": "تقرير عن تشجيع ولي الأمر على حضور حصة مع ابنه في الصف (أسبوع القراءة)", "order": 3},
-    {"id": "r_c3_s5_004", "subcategory_id": "c3_s5", "name": "توثيق لمشاركة ولي أمر في تنظيم رحلة مدرسية", "order": 4},
-    {"id": "r_c3_s5_005", "subcategory_id": "c3_s5", "name": "تقرير عن دعوة أولياء الأمور للمشاركة في تزيين الفصل بالمناسبات", "order": 5},
-    {"id": "r_c3_s5_006", "subcategory_id": "c3_s5", "name": "توثيق لمشاركة أولياء الأمور في فعالية اليوم المفتوح بالمدرسة", "order": 6},
-    {"id": "r_c3_s5_007", "subcategory_id": "c3_s5", "name": "تقرير عن تشجيع أولياء الأمور على التطوع في الإشراف على مكتبة المدرسة", "order": 7},
-    {"id": "r_c3_s5_008", "subcategory_id": "c3_s5", "name": "توثيق لمساهمة ولي أمر في توفير مواد خام لأنشطة فنية", "order": 8},
-    {"id": "r_c3_s5_009", "subcategory_id": "c3_s5", "name": "تقرير عن مشاركة ولي أمر في لجنة تحكيم مشاريع الطلاب النهائية", "order": 9},
-    {"id": "r_c3_s5_010", "subcategory_id": "c3_s5", "name": "توثيق لاستضافة أحد أولياء الأمور لتقديم ورشة عن الإسعافات الأولية", "order": 10},
-
-    # ======================================================
-    # c4_s1: استخدام التعلم النشط
-    # ======================================================
-    {"id": "r_c4_s1_001", "subcategory_id": "c4_s1", "name": "تقرير عن تطبيق استراتيجية التعلم التعاوني في الحصة الدراسية", "order": 1},
-    {"id": "r_c4_s1_002", "subcategory_id": "c4_s1", "name": "توثيق لتنفيذ استراتيجية العصف الذهني لطرح أفكار حول موضوع الدرس", "order": 2},
-    {"id": "r_c4_s1_003", "subcategory_id": "c4_s1", "name": "تقرير عن استخدام استراتيجية المناقشة الجماعية في الدرس", "order": 3},
-    {"id": "r_c4_s1_004", "subcategory_id": "c4_s1", "name": "توثيق لعروض تقديمية قدمها الطلاب عن مشاريعهم البحثية", "order": 4},
-    {"id": "r_c4_s1_005", "subcategory_id": "c4_s1", "name": "تقرير عن تطبيق استراتيجية لعب الأدوار في الحصة الدراسية", "order": 5},
-    {"id": "r_c4_s1_006", "subcategory_id": "c4_s1", "name": "توثيق لاستخدام استراتيجية الكرسي الساخن مع طالب يجيب على أسئلة زملائه", "order": 6},
-    {"id": "r_c4_s1_007", "subcategory_id": "c4_s1", "name": "تقرير عن تنفيذ استراتيجية مثلث الاستماع في حصة القراءة", "order": 7},
-    {"id": "r_c4_s1_008", "subcategory_id": "c4_s1", "name": "توثيق لاستخدام استراتيجية فكر-زاوج-شارك في حل التمارين", "order": 8},
-    {"id": "r_c4_s1_009", "subcategory_id": "c4_s1", "name": "تقرير عن تطبيق استراتيجية المناظرة بين مجموعتين من الطلاب", "order": 9},
-    {"id": "r_c4_s1_010", "subcategory_id": "c4_s1", "name": "توثيق لاستخدام استراتيجية التعلم باللعب في الحصة الدراسية", "order": 10},
-
-    # ======================================================
-    # c4_s2: التعلم القائم على المشاريع
-    # ======================================================
-    {"id": "r_c4_s2_001", "subcategory_id": "c4_s2", "name": "تقرير عن مشروع مجسم تعليمي من تنفيذ الطلاب", "order": 1},
-    {"id": "r_c4_s2_002", "subcategory_id": "c4_s2", "name": "توثيق لمشروع بحثي عن موضوع دراسي من قبل الطلاب", "order": 2},
-    {"id": "r_c4_s2_003", "subcategory_id": "c4_s2", "name": "تقرير عن مشروع صحيفة حائطية عن مناسبة وطنية أو عالمية", "order": 3},
-    {"id": "r_c4_s2_004", "subcategory_id": "c4_s2", "name": "توثيق لمشروع ابتكار نموذج عملي لتطبيق المفاهيم", "order": 4},
-    {"id": "r_c4_s2_005", "subcategory_id": "c4_s2", "name": "تقرير عن مشروع معرض تعليمي بالتعاون مع معلم التربية الفنية", "order": 5},
-    {"id": "r_c4_s2_006", "subcategory_id": "c4_s2", "name": "توثيق لمشروع إعداد وجبة صحية في حصة التربية الأسرية", "order": 6},
-    {"id": "r_c4_s2_007", "subcategory_id": "c4_s2", "name": "تقرير عن مشروع تصميم لعبة تعليمية لطلاب الحاسب الآلي", "order": 7},
-    {"id": "r_c4_s2_008", "subcategory_id": "c4_s2", "name": "توثيق لمشروع الرحلات المعرفية عبر الإنترنت", "order": 8},
-    {"id": "r_c4_s2_009", "subcategory_id": "c4_s2", "name": "تقرير عن مشروع إعادة التدوير للحفاظ على البيئة المدرسية", "order": 9},
-    {"id": "r_c4_s2_010", "subcategory_id": "c4_s2", "name": "توثيق لمشروع الاختراع الصغير لتطبيق المفاهيم العلمية", "order": 10},
-
-    # ======================================================
-    # c4_s3: استراتيجيات تنمية التفكير
-    # ======================================================
-    {"id": "r_c4_s3_001", "subcategory_id": "c4_s3", "name": "تقرير عن تطبيق استراتيجية حل المشكلات في الحصة الدراسية", "order": 1},
-    {"id": "r_c4_s3_002", "subcategory_id": "c4_s3", "name": "توثيق لاستخدام استراتيجية القبعات الست في مناقشة قضية مع الطلاب", "order": 2},
-    {"id": "r_c4_s3_003", "subcategory_id": "c4_s3", "name": "تقرير عن تطبيق استراتيجية التفكير الناقد بتحليل النصوص", "order": 3},
-    {"id": "r_c4_s3_004", "subcategory_id": "c4_s3", "name": "توثيق لاستخدام استراتيجية العصف الذهني لتوليد أفكار إبداعية للطلاب", "order": 4},
-    {"id": "r_c4_s3_005", "subcategory_id": "c4_s3", "name": "تقرير عن تطبيق استراتيجية الخرائط الذهنية في تلخيص الدروس", "order": 5},
-    {"id": "r_c4_s3_006", "subcategory_id": "c4_s3", "name": "توثيق لاستخدام استراتيجية الأسئلة السابرة (لماذا؟ كيف؟ ماذا لو؟) لتوسيع التفكير", "order": 6},
-    {"id": "r_c4_s3_007", "subcategory_id": "c4_s3", "name": "تقرير عن تطبيق استراتيجية التفكير الإبداعي في حصة التعبير الكتابي", "order": 7},
-    {"id": "r_c4_s3_008", "subcategory_id": "c4_s3", "name": "توثيق لاستخدام استراتيجية القصة المشوقة لحل مشكلة خيالية", "order": 8},
-    {"id": "r_c4_s3_009", "subcategory_id": "c4_s3", "name": "تقرير عن تطبيق استراتيجية التعلم بالاكتشاف", "order": 9},
-    {"id": "r_c4_s3_010", "subcategory_id": "c4_s3", "name": "توثيق لاستخدام استراتيجية المقارنة والتبويب في تصنيف المفاهيم", "order": 10},
-
-    # ======================================================
-    # c4_s4: استخدام الوسائل البصرية والسمعية
-    # ======================================================
-    {"id": "r_c4_s4_001", "subcategory_id": "c4_s4", "name": "تقرير عن استخدام عروض البوربوينت المصورة في شرح الدرس", "order": 1},
-    {"id": "r_c4_s4_002", "subcategory_id": "c4_s4", "name": "توثيق لعرض فيديو تعليمي في الحصة الدراسية", "order": 2},
-    {"id": "r_c4_s4_003", "subcategory_id": "c4_s4", "name": "تقرير عن استخدام البطاقات المصورة لتعليم المفردات", "order": 3},
-    {"id": "r_c4_s4_004", "subcategory_id": "c4_s4", "name": "توثيق لاستخدام الخرائط الصماء في الحصة الدراسية", "order": 4},
-    {"id": "r_c4_s4_005", "subcategory_id": "c4_s4", "name": "تقرير عن تشغيل مقاطع صوتية (للقرآن، الأناشيد) في الحصة", "order": 5},
-    {"id": "r_c4_s4_006", "subcategory_id": "c4_s4", "name": "توثيق لاستخدام الرسوم البيانية في توضيح نتائج استبيان", "order": 6},
-    {"id": "r_c4_s4_007", "subcategory_id": "c4_s4", "name": "تقرير عن استخدام السبورة الذكية لعرض صور تفاعلية", "order": 7},
-    {"id": "r_c4_s4_008", "subcategory_id": "c4_s4", "name": "توثيق لاستخدام الإنفوجرافيك في تلخيص المعلومات", "order": 8},
-    {"id": "r_c4_s4_009", "subcategory_id": "c4_s4", "name": "تقرير عن استخدام المجسمات التعليمية في الشرح", "order": 9},
-    {"id": "r_c4_s4_010", "subcategory_id": "c4_s4", "name": "توثيق لعرض فيلم قصير في الحصة الدراسية", "order": 10},
-
-    # ======================================================
-    # c4_s5: التعليم المتمايز
-    # ======================================================
-    {"id": "r_c4_s5_001", "subcategory_id": "c4_s5", "name": "تقرير عن تخصيص أنشطة بصرية (رسوم، خرائط) للطلاب ذوي النمط البصري", "order": 1},
-    {"id": "r_c4_s5_002", "subcategory_id": "c4_s5", "name": "توثيق لتوفير أنشطة سمعية (تسجيلات، مناقشات) للطلاب ذوي النمط السمعي", "order": 2},
-    {"id": "r_c4_s5_003", "subcategory_id": "c4_s5", "name": "تقرير عن تصميم أنشطة حركية (تجارب، نماذج) للطلاب ذوي النمط الحركي", "order": 3},
-    {"id": "r_c4_s5_004", "subcategory_id": "c4_s5", "name": "توثيق لتقديم خيارات متعددة للواجب (كتابة تقرير، رسم مجسم، إعداد عرض)", "order": 4},
-    {"id": "r_c4_s5_005", "subcategory_id": "c4_s5", "name": "تقرير عن تقسيم الطلاب لمجموعات حسب مستوياتهم وتقديم مهام مناسبة", "order": 5},
-    {"id": "r_c4_s5_006", "subcategory_id": "c4_s5", "name": "توثيق لإعطاء وقت إضافي للطلاب بطيئي التعلم لإنجاز المهام", "order": 6},
-    {"id": "r_c4_s5_007", "subcategory_id": "c4_s5", "name": "تقرير عن توفير أنشطة إثرائية للطلاب المتفوقين والمتقدمين", "order": 7},
-    {"id": "r_c4_s5_008", "subcategory_id": "c4_s5", "name": "توثيق لاستخدام نصوص متنوعة المستوى في حصة القراءة", "order": 8},
-    {"id": "r_c4_s5_009", "subcategory_id": "c4_s5", "name": "تقرير عن تنويع أسئلة التقويم لتناسب الجميع", "order": 9},
-    {"id": "r_c4_s5_010", "subcategory_id": "c4_s5", "name": "توثيق لتقديم الدعم الفردي للطلاب ذوي صعوبات التعلم أثناء الحصة", "order": 10},
-
-    # ======================================================
-    # c4_s6: استراتيجيات التعلم الحديثة
-    # ======================================================
-    {"id": "r_c4_s6_001", "subcategory_id": "c4_s6", "name": "تقرير عن تطبيق استراتيجية الصف المقلوب بتكليف الطلاب بمشاهدة فيديو قبل الحصة", "order": 1},
-    {"id": "r_c4_s6_002", "subcategory_id": "c4_s6", "name": "توثيق لاستخدام استراتيجية التعلم بالألعاب الإلكترونية عبر منصة تعليمية", "order": 2},
-    {"id": "r_c4_s6_003", "subcategory_id": "c4_s6", "name": "تقرير عن تطبيق استراتيجية الرحلات المعرفية عبر الإنترنت (WebQuest)", "order": 3},
-    {"id": "r_c4_s6_004", "subcategory_id": "c4_s6", "name": "توثيق لاستخدام استراتيجية التعلم بالترفيه من خلال ألعاب تعليمية ورقية", "order": 4},
-    {"id": "r_c4_s6_005", "subcategory_id": "c4_s6", "name": "تقرير عن تطبيق استراتيجية مسرح الدمى مع طلاب الصفوف الأولية", "order": 5},
-    {"id": "r_c4_s6_006", "subcategory_id": "c4_s6", "name": "توثيق لاستخدام استراتيجية المعارض العلمية لعرض مشاريع الطلاب", "order": 6},
-    {"id": "r_c4_s6_007", "subcategory_id": "c4_s6", "name": "تقرير عن تطبيق استراتيجية التعلم بالمشاريع التعاونية عبر منصات إلكترونية", "order": 7},
-    {"id": "r_c4_s6_008", "subcategory_id": "c4_s6", "name": "توثيق لاستخدام استراتيجية القصة الرقمية في سرد الأحداث", "order": 8},
-    {"id": "r_c4_s6_009", "subcategory_id": "c4_s6", "name": "تقرير عن تطبيق استراتيجية التعلم التبادلي في تدريس النصوص", "order": 9},
-    {"id": "r_c4_s6_010", "subcategory_id": "c4_s6", "name": "توثيق لاستخدام استراتيجية الألعاب اللغوية", "order": 10},
-
-    # ======================================================
-    # c4_s7: التعلم التعاوني
-    # ======================================================
-    {"id": "r_c4_s7_001", "subcategory_id": "c4_s7", "name": "تقرير عن تطبيق استراتيجية التعلم التعاوني (جيجسو) في الحصة الدراسية", "order": 1},
-    {"id": "r_c4_s7_002", "subcategory_id": "c4_s7", "name": "توثيق لتوزيع الطلاب على مجموعات عمل متعاونة في الحصة", "order": 2},
-    {"id": "r_c4_s7_003", "subcategory_id": "c4_s7", "name": "تقرير عن تطبيق استراتيجية مجموعات الخبراء في حل المسائل المعقدة", "order": 3},
-    {"id": "r_c4_s7_004", "subcategory_id": "c4_s7", "name": "توثيق لاستخدام استراتيجية التعلم التعاوني في مشروع بحثي جماعي", "order": 4},
-    {"id": "r_c4_s7_005", "subcategory_id": "c4_s7", "name": "تقرير عن تنفيذ استراتيجية الرؤوس المرقمة في حصة المراجعة", "order": 5},
-    {"id": "r_c4_s7_006", "subcategory_id": "c4_s7", "name": "توثيق لتطبيق استراتيجية مسابقة الفرق في نهاية الوحدة", "order": 6},
-    {"id": "r_c4_s7_007", "subcategory_id": "c4_s7", "name": "تقرير عن استخدام استراتيجية المجموعات المتداخلة في مناقشة موضوع معقد", "order": 7},
-    {"id": "r_c4_s7_008", "subcategory_id": "c4_s7", "name": "توثيق لتقييم أداء المجموعات في مشروع تعاوني", "order": 8},
-    {"id": "r_c4_s7_009", "subcategory_id": "c4_s7", "name": "تقرير عن تطبيق استراتيجية دوائر التعلم", "order": 9},
-    {"id": "r_c4_s7_010", "subcategory_id": "c4_s7", "name": "توثيق لاستخدام استراتيجية التحقق من الزميل في تصحيح الواجبات", "order": 10},
-
-    # ======================================================
-    # c5_s1: تحديد أهداف ومعايير واضحة
-    # ======================================================
-    {"id": "r_c5_s1_001", "subcategory_id": "c5_s1", "name": "تقرير عن كتابة أهداف الدرس على السبورة في بداية كل حصة", "order": 1},
-    {"id": "r_c5_s1_002", "subcategory_id": "c5_s1", "name": "توثيق لصياغة معايير النجاح بطريقة مبسطة للطلاب", "order": 2},
-    {"id": "r_c5_s1_003", "subcategory_id": "c5_s1", "name": "تقرير عن مناقشة الأهداف مع الطلاب قبل البدء بالشرح", "order": 3},
-    {"id": "r_c5_s1_004", "subcategory_id": "c5_s1", "name": "توثيق لتوزيع ورقة عمل توضح المطلوب من الطالب تحقيقه في المشروع", "order": 4},
-    {"id": "r_c5_s1_005", "subcategory_id": "c5_s1", "name": "تقرير عن توضيح معايير التصحيح للطلاب قبل أداء الاختبار", "order": 5},
-    {"id": "r_c5_s1_006", "subcategory_id": "c5_s1", "name": "توثيق لكتابة أهداف أسبوعية على لوحة الإعلانات بالفصل", "order": 6},
-    {"id": "r_c5_s1_007", "subcategory_id": "c5_s1", "name": "تقرير عن شرح نموذج إجابة متوقع للطلاب في المرحلة الثانوية", "order": 7},
-    {"id": "r_c5_s1_008", "subcategory_id": "c5_s1", "name": "توثيق لاستخدام قوائم الرصد الذاتي للطلاب لمتابعة تقدمهم", "order": 8},
-    {"id": "r_c5_s1_009", "subcategory_id": "c5_s1", "name": "تقرير عن توجيه الطلاب لكتابة أهدافهم الشخصية للفصل الدراسي", "order": 9},
-    {"id": "r_c5_s1_010", "subcategory_id": "c5_s1", "name": "توثيق لمراجعة الأهداف مع الطلاب في نهاية الحصة للتأكد من تحقيقها", "order": 10},
-
-    # ======================================================
-    # c5_s2: تقديم إفادة سريعة ومحددة
-    # ======================================================
-    {"id": "r_c5_s2_001", "subcategory_id": "c5_s2", "name": "تقرير عن تصحيح أوراق العمل أثناء الحصة وتقديم ملاحظات فورية للطلاب", "order": 1},
-    {"id": "r_c5_s2_002", "subcategory_id": "c5_s2", "name": "توثيق لتعليقاتي على إجابات الطلاب الشفوية", "order": 2},
-    {"id": "r_c5_s2_003", "subcategory_id": "c5_s2", "name": "تقرير عن تقديم تغذية راجعة مكتوبة على دفاتر الواجبات", "order": 3},
-    {"id": "r_c5_s2_004", "subcategory_id": "c5_s2", "name": "توثيق لمراجعة الإملاء مع الطلاب مباشرة بعد كتابته", "order": 4},
-    {"id": "r_c5_s2_005", "subcategory_id": "c5_s2", "name": "تقرير عن مناقشة أخطاء الاختبار القصير مع الطلاب في الحصة التالية", "order": 5},
-    {"id": "r_c5_s2_006", "subcategory_id": "c5_s2", "name": "توثيق لتوجيه الطلاب لتصحيح أخطائهم بأنفسهم بعد التوضيح", "order": 6},
-    {"id": "r_c5_s2_007", "subcategory_id": "c5_s2", "name": "تقرير عن استخدام عبارات تشجيعية محددة", "order": 7},
-    {"id": "r_c5_s2_008", "subcategory_id": "c5_s2", "name": "توثيق لتقديم نموذج إجابة صحيحة ومقارنتها بإجابة الطالب", "order": 8},
-    {"id": "r_c5_s2_009", "subcategory_id": "c5_s2", "name": "تقرير عن تخصيص دقائق آخر الحصة لمراجعة الأخطاء الشائعة", "order": 9},
-    {"id": "r_c5_s2_010", "subcategory_id": "c5_s2", "name": "توثيق لاستخدام بطاقات ملاحظات لاصقة على دفاتر الطلاب", "order": 10},
-
-    # ======================================================
-    # c5_s3: تكييف الإفادة وفق الاحتياجات الفردية
-    # ======================================================
-    {"id": "r_c5_s3_001", "subcategory_id": "c5_s3", "name": "تقرير عن تقديم تغذية راجعة شفهية فردية لطالب يعاني من ضعف في التحصيل", "order": 1},
-    {"id": "r_c5_s3_002", "subcategory_id": "c5_s3", "name": "توثيق لكتابة ملاحظات مبسطة ومصحوبة برسوم لطالب من ذوي صعوبات التعلم", "order": 2},
-    {"id": "r_c5_s3_003", "subcategory_id": "c5_s3", "name": "تقرير عن لقاء فردي مع طالب متميز لتوجيهه لموارد إضافية", "order": 3},
-    {"id": "r_c5_s3_004", "subcategory_id": "c5_s3", "name": "توثيق لتقديم تغذية راجعة عبر تسجيل صوتي لطالب بالمرحلة الابتدائية", "order": 4},
-    {"id": "r_c5_s3_005", "subcategory_id": "c5_s3", "name": "تقرير عن تخصيص وقت للجلوس مع كل مجموعة والعمل على توجيهها", "order": 5},
-    {"id": "r_c5_s3_006", "subcategory_id": "c5_s3", "name": "توثيق لاستخدام لغة جسد وتعبيرات وجه مناسبة مع الطلاب الخجولين", "order": 6},
-    {"id": "r_c5_s3_007", "subcategory_id": "c5_s3", "name": "تقرير عن إعادة شرح فكرة معينة لطالب لم يستوعبها بطريقة مختلفة", "order": 7},
-    {"id": "r_c5_s3_008", "subcategory_id": "c5_s3", "name": "توثيق لتكليف طالب سريع التعلم بمساعدة زميل له", "order": 8},
-    {"id": "r_c5_s3_009", "subcategory_id": "c5_s3", "name": "تقرير عن تعديل أسلوب التصحيح لطلاب الابتدائي", "order": 9},
-    {"id": "r_c5_s3_010", "subcategory_id": "c5_s3", "name": "توثيق لمراعاة الفروق الفردية في سرعة التعلم أثناء تقديم الملاحظات", "order": 10},
-
-    # ======================================================
-    # c5_s4: تعزيز الثقة وتشجيع التطور
-    # ======================================================
-    {"id": "r_c5_s4_001", "subcategory_id": "c5_s4", "name": "تقرير عن استخدام عبارات تحفيزية", "order": 1},
-    {"id": "r_c5_s4_002", "subcategory_id": "c5_s4", "name": "توثيق لإعطاء الطالب فرصة لإعادة الاختبار أو تحسين واجبه", "order": 2},
-    {"id": "r_c5_s4_003", "subcategory_id": "c5_s4", "name": "تقرير عن تخصيص ركن نجوم التميز في الفصل لعرض أعمال الطلاب المجيدة", "order": 3},
-    {"id": "r_c5_s4_004", "subcategory_id": "c5_s4", "name": "توثيق لإرسال بطاقات شكر وتقدير لأولياء أمور الطلاب المتميزين", "order": 4},
-    {"id": "r_c5_s4_005", "subcategory_id": "c5_s4", "name": "تقرير عن الاحتفاء بأي تقدم بسيط للطلاب الضعاف", "order": 5},
-    {"id": "r_c5_s4_006", "subcategory_id": "c5_s4", "name": "توثيق لتشجيع الطلاب على مشاركة إنجازاتهم أمام الزملاء", "order": 6},
-    {"id": "r_c5_s4_007", "subcategory_id": "c5_s4", "name": "تقرير عن تصحيح الأخطاء بطريقة لا تقلل من ثقة الطالب بنفسه", "order": 7},
-    {"id": "r_c5_s4_008", "subcategory_id": "c5_s4", "name": "توثيق لتحويل الأخطاء إلى فرص تعلم", "order": 8},
-    {"id": "r_c5_s4_009", "subcategory_id": "c5_s4", "name": "تقرير عن تخصيص دقائق للتحدث عن الإنجازات الأسبوعية", "order": 9},
-    {"id": "r_c5_s4_010", "subcategory_id": "c5_s4", "name": "توثيق لإشراك الطلاب في وضع أهداف تحسينية بسيطة لأنفسهم", "order": 10},
-
-    # ======================================================
-    # c5_s5: استخدام التكنولوجيا لتقديم الإفادة
-    # ======================================================
-    {"id": "r_c5_s5_001", "subcategory_id": "c5_s5", "name": "تقرير عن إرسال تغذية راجعة عبر منصة مدرستي على واجبات الطلاب", "order": 1},
-    {"id": "r_c5_s5_002", "subcategory_id": "c5_s5", "name": "توثيق لاستخدام البريد الإلكتروني لإرسال تقارير تقدم للطلاب وأولياء أمورهم", "order": 2},
-    {"id": "r_c5_s5_003", "subcategory_id": "c5_s5", "name": "تقرير عن استخدام خاصية التعليقات في مستندات جوجل لتصحيح الأبحاث", "order": 3},
-    {"id": "r_c5_s5_004", "subcategory_id": "c5_s5", "name": "توثيق لإرسال رسائل نصية قصيرة للطلاب المتفوقين", "order": 4},
-    {"id": "r_c5_s5_005", "subcategory_id": "c5_s5", "name": "تقرير عن استخدام الاختبارات الإلكترونية التي تظهر النتيجة والتعليق فوراً", "order": 5},
-    {"id": "r_c5_s5_006", "subcategory_id": "c5_s5", "name": "توثيق لإنشاء قناة على اليوتيوب وعرض فيديوهات تصحيح للأخطاء الشائعة", "order": 6},
-    {"id": "r_c5_s5_007", "subcategory_id": "c5_s5", "name": "تقرير عن استخدام برامج تحويل النص إلى كلام لطلاب صعوبات القراءة", "order": 7},
-    {"id": "r_c5_s5_008", "subcategory_id": "c5_s5", "name": "توثيق لمشاركة نماذج إجابة ممتازة عبر منصة الفصل", "order": 8},
-    {"id": "r_c5_s5_009", "subcategory_id": "c5_s5", "name": "تقرير عن استخدام استبيانات إلكترونية لجمع آراء الطلاب حول أدائهم", "order": 9},
-    {"id": "r_c5_s5_010", "subcategory_id": "c5_s5", "name": "توثيق لإرسال شارات رقمية للطلاب عند تحقيق إنجاز", "order": 10},
-
-    # ======================================================
-    # c6_s1: وضع أهداف تعليمية واضحة وقابلة للقياس
-    # ======================================================
-    {"id": "r_c6_s1_001", "subcategory_id": "c6_s1", "name": "نموذج من خطة تحضير يومية تحتوي على أهداف سلوكية قابلة للقياس", "order": 1},
-    {"id": "r_c6_s1_002", "subcategory_id": "c6_s1", "name": "تقرير عن صياغة أهداف درس باستخدام أفعال قياسية", "order": 2},
-    {"id": "r_c6_s1_003", "subcategory_id": "c6_s1", "name": "توثيق لمطابقة الأهداف الموضوعة مع نواتج التعلم في المنهج", "order": 3},
-    {"id": "r_c6_s1_004", "subcategory_id": "c6_s1", "name": "تقرير عن مشاركة الأهداف مع الطلاب والتأكد من فهمهم لها", "order": 4},
-    {"id": "r_c6_s1_005", "subcategory_id": "c6_s1", "name": "توثيق لكتابة أهداف أسبوعية للخطة الدراسية", "order": 5},
-    {"id": "r_c6_s1_006", "subcategory_id": "c6_s1", "name": "تقرير عن مراجعة الأهداف بعد تنفيذ الدرس للتأكد من تحقيقها", "order": 6},
-    {"id": "r_c6_s1_007", "subcategory_id": "c6_s1", "name": "توثيق لتعديل أهداف درس بناءً على مستوى الطلاب الفعلي", "order": 7},
-    {"id": "r_c6_s1_008", "subcategory_id": "c6_s1", "name": "تقرير عن تصميم أنشطة تقويمية تقيس الأهداف الموضوعة", "order": 8},
-    {"id": "r_c6_s1_009", "subcategory_id": "c6_s1", "name": "توثيق لصياغة أهداف للطلاب الموهوبين في الخطة الإثرائية", "order": 9},
-    {"id": "r_c6_s1_010", "subcategory_id": "c6_s1", "name": "تقرير عن وضع أهداف علاجية للطلاب المتعثرين في خطة الدعم", "order": 10},
-
-    # ======================================================
-    # c6_s2: تصميم خطة دراسية تتوافق مع المنهج واحتياجات الطلاب
-    # ======================================================
-    {"id": "r_c6_s2_001", "subcategory_id": "c6_s2", "name": "نموذج من خطة توزيع المنهج على أسابيع الفصل الدراسي", "order": 1},
-    {"id": "r_c6_s2_002", "subcategory_id": "c6_s2", "name": "تقرير عن تصميم خطة درس تراعي وجود طلاب من ذوي صعوبات التعلم بالفصل", "order": 2},
-    {"id": "r_c6_s2_003", "subcategory_id": "c6_s2", "name": "توثيق لإعداد خطة نشاط لا صفي يتوافق مع المنهج", "order": 3},
-    {"id": "r_c6_s2_004", "subcategory_id": "c6_s2", "name": "تقرير عن تخصيص حصص للمراجعة في الخطة قبل الاختبارات", "order": 4},
-    {"id": "r_c6_s2_005", "subcategory_id": "c6_s2", "name": "توثيق لتصميم خطة للأنشطة الإثرائية للطلاب المتفوقين", "order": 5},
-    {"id": "r_c6_s2_006", "subcategory_id": "c6_s2", "name": "تقرير عن إعداد خطة علاجية للطلاب الضعاف في المهارات الأساسية", "order": 6},
-    {"id": "r_c6_s2_007", "subcategory_id": "c6_s2", "name": "توثيق لمراعاة أيام المناسبات والإجازات في خطة التوزيع", "order": 7},
-    {"id": "r_c6_s2_008", "subcategory_id": "c6_s2", "name": "تقرير عن تصميم خطة درس باستخدام استراتيجية التعلم النشط", "order": 8},
-    {"id": "r_c6_s2_009", "subcategory_id": "c6_s2", "name": "توثيق لتكامل الخطة مع معلم المواد الأخرى", "order": 9},
-    {"id": "r_c6_s2_010", "subcategory_id": "c6_s2", "name": "تقرير عن إعداد خطة بديلة في حال تعطل الوسائل التقنية", "order": 10},
-
-    # ======================================================
-    # c6_s3: مراجعة الخطط بشكل دوري وتعديلها بناءً على نتائج الطلاب
-    # ======================================================
-    {"id": "r_c6_s3_001", "subcategory_id": "c6_s3", "name": "تقرير عن تعديل خطة الأسبوع القادم بناءً على نتائج اختبار الأسبوع الحالي", "order": 1},
-    {"id": "r_c6_s3_002", "subcategory_id": "c6_s3", "name": "توثيق لمراجعة خطة الدرس بعد شعوري بأن الوقت لم يكفِ لتحقيق الأهداف", "order": 2},
-    {"id": "r_c6_s3_003", "subcategory_id": "c6_s3", "name": "تقرير عن إعادة توزيع المنهج بعد تأخير بسبب ظروف مدرسية", "order": 3},
-    {"id": "r_c6_s3_004", "subcategory_id": "c6_s3", "name": "توثيق لإضافة حصص تدريبية على مهارة معينة بعد ضعف الطلاب فيها", "order": 4},
-    {"id": "r_c6_s3_005", "subcategory_id": "c6_s3", "name": "تقرير عن تغيير استراتيجية تدريس في الخطة بعد عدم تفاعل الطلاب معها", "order": 5},
-    {"id": "r_c6_s3_006", "subcategory_id": "c6_s3", "name": "توثيق لمراجعة الخطة الفصلية مع قائد المدرسة أو المشرف التربوي", "order": 6},
-    {"id": "r_c6_s3_007", "subcategory_id": "c6_s3", "name": "تقرير عن تقليص بعض الأنشطة في الخطة بسبب ضيق الوقت", "order": 7},
-    {"id": "r_c6_s3_008", "subcategory_id": "c6_s3", "name": "توثيق لتعديل خطة الدروس بناءً على نتائج التقويم القبلي", "order": 8},
-    {"id": "r_c6_s3_009", "subcategory_id": "c6_s3", "name": "تقرير عن مراجعة الخطة العلاجية وتعديلها بعد تحسن مستوى الطالب", "order": 9},
-    {"id": "r_c6_s3_010", "subcategory_id": "c6_s3", "name": "توثيق لتدوين الملاحظات على الخطة الأصلية لتحسينها في العام القادم", "order": 10},
-
-    # ======================================================
-    # c6_s4: مشاركة الخطط مع الزملاء للحصول على ملاحظات
-    # ======================================================
-    {"id": "r_c6_s4_001", "subcategory_id": "c6_s4", "name": "تقرير عن مشاركة خطة درس مع معلم نفس التخصص لمناقشتها", "order": 1},
-    {"id": "r_c6_s4_002", "subcategory_id": "c6_s4", "name": "توثيق لجلسة تخطيط تعاوني مع فريق المواد الدراسية", "order": 2},
-    {"id": "r_c6_s4_003", "subcategory_id": "c6_s4", "name": "تقرير عن استشارة معلم خبير في تعديل خطة الوحدة الدراسية", "order": 3},
-    {"id": "r_c6_s4_004", "subcategory_id": "c6_s4", "name": "توثيق لمراجعة خطة زميل جديد وتقديم ملاحظات له", "order": 4},
-    {"id": "r_c6_s4_005", "subcategory_id": "c6_s4", "name": "تقرير عن مناقشة خطة الأنشطة الصفية مع معلم الصفوف الأولية", "order": 5},
-    {"id": "r_c6_s4_006", "subcategory_id": "c6_s4", "name": "توثيق للاستفادة من ملاحظات زميل في تحسين خطة الدرس", "order": 6},
-    {"id": "r_c6_s4_007", "subcategory_id": "c6_s4", "name": "تقرير عن تبادل خطط التحضير الإسبوعية مع المعلمين في المدرسة", "order": 7},
-    {"id": "r_c6_s4_008", "subcategory_id": "c6_s4", "name": "توثيق لمشاركة خطة مشروع مدرسي مع لجنة النشاط", "order": 8},
-    {"id": "r_c6_s4_009", "subcategory_id": "c6_s4", "name": "تقرير عن حضور ورشة تخطيط جماعي لتصميم خطة فصلية موحدة", "order": 9},
-    {"id": "r_c6_s4_010", "subcategory_id": "c6_s4", "name": "توثيق لمراجعة الخطة العلاجية مع الأخصائي النفسي أو المرشد الطلابي", "order": 10},
-
-    # ======================================================
-    # c6_s5: تفهم الخصائص النفسية للمرحلة العمرية
-    # ======================================================
-    {"id": "r_c6_s5_001", "subcategory_id": "c6_s5", "name": "تقرير عن تصميم أنشطة حركية قصيرة تناسب طلاب المرحلة الابتدائية", "order": 1},
-    {"id": "r_c6_s5_002", "subcategory_id": "c6_s5", "name": "توثيق لاستخدام أسلوب الحوار والمناقشة مع طلاب المرحلة المتوسطة", "order": 2},
-    {"id": "r_c6_s5_003", "subcategory_id": "c6_s5", "name": "تقرير عن إعطاء مسؤوليات وقيادة للطلاب في المرحلة الثانوية", "order": 3},
-    {"id": "r_c6_s5_004", "subcategory_id": "c6_s5", "name": "توثيق لمراعاة فترات الانتباه القصيرة لطلاب الصفوف الأولية", "order": 4},
-    {"id": "r_c6_s5_005", "subcategory_id": "c6_s5", "name": "تقرير عن التعامل مع حاجة طلاب المرحلة المتوسطة للانتماء للجماعة", "order": 5},
-    {"id": "r_c6_s5_006", "subcategory_id": "c6_s5", "name": "توثيق لاستخدام القدوة والتوجيه المباشر مع طلاب المرحلة الابتدائية", "order": 6},
-    {"id": "r_c6_s5_007", "subcategory_id": "c6_s5", "name": "تقرير عن احترام استقلالية طلاب المرحلة الثانوية وإشراكهم في اتخاذ القرارات", "order": 7},
-    {"id": "r_c6_s5_008", "subcategory_id": "c6_s5", "name": "توثيق لاستخدام التعزيز المادي والمعنوي مع طلاب المرحلة الابتدائية", "order": 8},
-    {"id": "r_c6_s5_009", "subcategory_id": "c6_s5", "name": "تقرير عن تفهم التغيرات النفسية والجسدية لطلاب المرحلة المتوسطة", "order": 9},
-    {"id": "r_c6_s5_010", "subcategory_id": "c6_s5", "name": "توثيق لتوجيه طلاب الثانوي للتخطيط لمستقبلهم المهني والأكاديمي", "order": 10},
-
-    # ======================================================
-    # c7_s1: استخدام السبورات الذكية والأجهزة اللوحية
-    # ======================================================
-    {"id": "r_c7_s1_001", "subcategory_id": "c7_s1", "name": "تقرير عن استخدام السبورة التفاعلية في شرح الدروس", "order": 1},
-    {"id": "r_c7_s1_002", "subcategory_id": "c7_s1", "name": "توثيق لتوظيف الأجهزة اللوحية في البحث عن معلومات أثناء الحصة", "order": 2},
-    {"id": "r_c7_s1_003", "subcategory_id": "c7_s1", "name": "تقرير عن استخدام تطبيق تعليمي على التابلت لشرح المفاهيم", "order": 3},
-    {"id": "r_c7_s1_004", "subcategory_id": "c7_s1", "name": "توثيق لعرض فيديو تعليمي عبر السبورة الذكية", "order": 4},
-    {"id": "r_c7_s1_005", "subcategory_id": "c7_s1", "name": "تقرير عن استخدام القلم الضوئي على السبورة الذكية للكتابة والرسم", "order": 5},
-    {"id": "r_c7_s1_006", "subcategory_id": "c7_s1", "name": "توثيق لتوظيف الأجهزة اللوحية في قراءة النصوص الرقمية", "order": 6},
-    {"id": "r_c7_s1_007", "subcategory_id": "c7_s1", "name": "تقرير عن استخدام برنامج الرسم على التابلت في الحصة", "order": 7},
-    {"id": "r_c7_s1_008", "subcategory_id": "c7_s1", "name": "توثيق لعرض خرائط ذهنية تفاعلية عبر السبورة الذكية", "order": 8},
-    {"id": "r_c7_s1_009", "subcategory_id": "c7_s1", "name": "تقرير عن استخدام تطبيقات التصويت الفوري عبر الأجهزة اللوحية", "order": 9},
-    {"id": "r_c7_s1_010", "subcategory_id": "c7_s1", "name": "توثيق لتشغيل المحاكاة الافتراضية عبر السبورة الذكية", "order": 10},
-
-    # ======================================================
-    # c7_s2: تطبيق برامج التعلم الالكتروني
-    # ======================================================
-    {"id": "r_c7_s2_001", "subcategory_id": "c7_s2", "name": "تقرير عن استخدام منصة مدرستي في رفع الدروس والمصادر للطلاب", "order": 1},
-    {"id": "r_c7_s2_002", "subcategory_id": "c7_s2", "name": "توثيق لإنشاء فصل افتراضي عبر منصة مايكروسوفت تيمز لحصة مراجعة", "order": 2},
-    {"id": "r_c7_s2_003", "subcategory_id": "c7_s2", "name": "تقرير عن استخدام نظام نور لرصد الدرجات ومتابعة الغياب", "order": 3},
-    {"id": "r_c7_s2_004", "subcategory_id": "c7_s2", "name": "توثيق لتصميم اختبار إلكتروني عبر منصة مدرستي وتصحيحه آلياً", "order": 4},
-    {"id": "r_c7_s2_005", "subcategory_id": "c7_s2", "name": "تقرير عن تفعيل الواجبات الإلكترونية للطلاب عبر المنصة", "order": 5},
-    {"id": "r_c7_s2_006", "subcategory_id": "c7_s2", "name": "توثيق للتواصل مع الطلاب وأولياء الأمور عبر منصة المدرسة", "order": 6},
-    {"id": "r_c7_s2_007", "subcategory_id": "c7_s2", "name": "تقرير عن استخدام بنك الأسئلة في المنصة لتصميم اختبارات متنوعة", "order": 7},
-    {"id": "r_c7_s2_008", "subcategory_id": "c7_s2", "name": "توثيق لمشاركة فيديوهات تعليمية مسجلة عبر قناة المدرسة على اليوتيوب", "order": 8},
-    {"id": "r_c7_s2_009", "subcategory_id": "c7_s2", "name": "تقرير عن استخدام منصات تعليمية عالمية كمصادر إثرائية", "order": 9},
-    {"id": "r_c7_s2_010", "subcategory_id": "c7_s2", "name": "توثيق لحضور اجتماعات مجلس المعلمين عبر منصة افتراضية", "order": 10},
-
-    # ======================================================
-    # c7_s3: تشجيع الطلاب على استخدام التطبيقات التعليمية
-    # ======================================================
-    {"id": "r_c7_s3_001", "subcategory_id": "c7_s3", "name": "تقرير عن توجيه الطلاب لاستخدام تطبيقات تعليمية للمراجعة", "order": 1},
-    {"id": "r_c7_s3_002", "subcategory_id": "c7_s3", "name": "توثيق لتكليف الطلاب باستخدام تطبيقات لحفظ المفردات والمصطلحات", "order": 2},
-    {"id": "r_c7_s3_003", "subcategory_id": "c7_s3", "name": "تقرير عن تشجيع الطلاب على استخدام المنصات التعليمية", "order": 3},
-    {"id": "r_c7_s3_004", "subcategory_id": "c7_s3", "name": "توثيق لتطبيق حل المسائل والتحقق من الحلول", "order": 4},
-    {"id": "r_c7_s3_005", "subcategory_id": "c7_s3", "name": "تقرير عن استخدام تطبيقات تعلم اللغات", "order": 5},
-    {"id": "r_c7_s3_006", "subcategory_id": "c7_s3", "name": "توثيق لتكليف الطلاب بإنشاء عروض تقديمية باستخدام برامج متخصصة", "order": 6},
-    {"id": "r_c7_s3_007", "subcategory_id": "c7_s3", "name": "تقرير عن استخدام تطبيقات الخرائط والمواقع الجغرافية", "order": 7},
-    {"id": "r_c7_s3_008", "subcategory_id": "c7_s3", "name": "توثيق لتشجيع الطلاب على استخدام تطبيقات القراءة الرقمية", "order": 8},
-    {"id": "r_c7_s3_009", "subcategory_id": "c7_s3", "name": "تقرير عن استخدام منصات التفاعل والمشاركة في العصف الذهني", "order": 9},
-    {"id": "r_c7_s3_010", "subcategory_id": "c7_s3", "name": "توثيق لتكليف الطلاب بتصميم مقاطع فيديو قصيرة", "order": 10},
-
-    # ======================================================
-    # c7_s4: تنظيم ورش العمل حول استخدام التكنولوجيا
-    # ======================================================
-    {"id": "r_c7_s4_001", "subcategory_id": "c7_s4", "name": "تقرير عن تقديم ورشة للزملاء عن أساسيات استخدام السبورة الذكية", "order": 1},
-    {"id": "r_c7_s4_002", "subcategory_id": "c7_s4", "name": "توثيق لتنظيم دورة تدريبية للطلاب عن الاستخدام الآمن للإنترنت", "order": 2},
-    {"id": "r_c7_s4_003", "subcategory_id": "c7_s4", "name": "تقرير عن مشاركتي في تنظيم ورشة عن تصميم الاختبارات الإلكترونية", "order": 3},
-    {"id": "r_c7_s4_004", "subcategory_id": "c7_s4", "name": "توثيق لحضور ورشة عن تطبيقات الذكاء الاصطناعي في التعليم", "order": 4},
-    {"id": "r_c7_s4_005", "subcategory_id": "c7_s4", "name": "تقرير عن تنظيم ورشة توعوية لأولياء الأمور عن منصة مدرستي", "order": 5},
-    {"id": "r_c7_s4_006", "subcategory_id": "c7_s4", "name": "توثيق لورشة عن استخدام برامج العروض التقديمية التفاعلية للطلاب", "order": 6},
-    {"id": "r_c7_s4_007", "subcategory_id": "c7_s4", "name": "تقرير عن تنظيم معرض داخلي للتطبيقات التعليمية المفيدة", "order": 7},
-    {"id": "r_c7_s4_008", "subcategory_id": "c7_s4", "name": "توثيق لورشة عن صناعة المحتوى الرقمي لطلاب الثانوي", "order": 8},
-    {"id": "r_c7_s4_009", "subcategory_id": "c7_s4", "name": "تقرير عن تقديم حصة تطبيقية للزملاء عن استخدام الأجهزة اللوحية", "order": 9},
-    {"id": "r_c7_s4_010", "subcategory_id": "c7_s4", "name": "توثيق للمشاركة في تنظيم يوم تقني مفتوح بالمدرسة", "order": 10},
-
-    # ======================================================
-    # c8_s1: تزيين الفصل بوسائل تعليمية جذابة
-    # ======================================================
-    {"id": "r_c8_s1_001", "subcategory_id": "c8_s1", "name": "تقرير عن إعداد لوحة إعلانات فصلية عن إنجازات الطلاب", "order": 1},
-    {"id": "r_c8_s1_002", "subcategory_id": "c8_s1", "name": "توثيق لتعليق لوحات حائطية بالمعلومات الأساسية للمادة", "order": 2},
-    {"id": "r_c8_s1_003", "subcategory_id": "c8_s1", "name": "تقرير عن تزيين الفصل بأعمال الطلاب الفنية والإبداعية", "order": 3},
-    {"id": "r_c8_s1_004", "subcategory_id": "c8_s1", "name": "توثيق لوضع بطاقات تعريفية بالأركان التعليمية", "order": 4},
-    {"id": "r_c8_s1_005", "subcategory_id": "c8_s1", "name": "تقرير عن تغيير ديكور الفصل وتزيينه بالمناسبات", "order": 5},
-    {"id": "r_c8_s1_006", "subcategory_id": "c8_s1", "name": "توثيق لتعليق لوحات بالجداريات العلمية", "order": 6},
-    {"id": "r_c8_s1_007", "subcategory_id": "c8_s1", "name": "تقرير عن استخدام الملصقات المحفزة والملونة على جدران الفصل", "order": 7},
-    {"id": "r_c8_s1_008", "subcategory_id": "c8_s1", "name": "توثيق لوضع ساعة تعليمية وركن للتاريخ الهجري والميلادي", "order": 8},
-    {"id": "r_c8_s1_009", "subcategory_id": "c8_s1", "name": "تقرير عن تخصيص ركن لعرض مجسمات الطلاب", "order": 9},
-    {"id": "r_c8_s1_010", "subcategory_id": "c8_s1", "name": "توثيق لتزيين باب الفصل باسم الفصل وشعار مميز", "order": 10},
-
-    # ======================================================
-    # c8_s2: تنظيم الفصل بشكل يسهل الحركة والتفاعل
-    # ======================================================
-    {"id": "r_c8_s2_001", "subcategory_id": "c8_s2", "name": "تقرير عن إعادة ترتيب المقاعد على شكل مجموعات لتسهيل العمل التعاوني", "order": 1},
-    {"id": "r_c8_s2_002", "subcategory_id": "c8_s2", "name": "توثيق لتخصيص مساحة فارغة في مقدمة الفصل للأنشطة الحركية", "order": 2},
-    {"id": "r_c8_s2_003", "subcategory_id": "c8_s2", "name": "تقرير عن تنظيم المقاعد على شكل حرف U لتسهيل المناقشة", "order": 3},
-    {"id": "r_c8_s2_004", "subcategory_id": "c8_s2", "name": "توثيق لتحديد مسار واضح للحركة بين المقاعد", "order": 4},
-    {"id": "r_c8_s2_005", "subcategory_id": "c8_s2", "name": "تقرير عن ترتيب أركان التعلم بشكل منظم وسهل الوصول", "order": 5},
-    {"id": "r_c8_s2_006", "subcategory_id": "c8_s2", "name": "توثيق لتخصيص ركن للقراءة به مقاعد مريحة وسجادة", "order": 6},
-    {"id": "r_c8_s2_007", "subcategory_id": "c8_s2", "name": "تقرير عن وضع مكتب المعلم في مكان يسمح برؤية جميع الطلاب", "order": 7},
-    {"id": "r_c8_s2_008", "subcategory_id": "c8_s2", "name": "توثيق لتنظيم أدوات الطلاب بشكل لا يعيق الحركة", "order": 8},
-    {"id": "r_c8_s2_009", "subcategory_id": "c8_s2", "name": "تقرير عن تخصيص ركن للأنشطة الفردية والهادئة", "order": 9},
-    {"id": "r_c8_s2_010", "subcategory_id": "c8_s2", "name": "توثيق لترتيب الفصل بما يتناسب مع طلاب ذوي الاحتياجات الخاصة", "order": 10},
-
-    # ======================================================
-    # c8_s3: توفير الأدوات والموارد التعليمية اللازمة
-    # ======================================================
-    {"id": "r_c8_s3_001", "subcategory_id": "c8_s3", "name": "تقرير عن تجهيز حقيبة الطوارئ الصفية للطلاب المحتاجين", "order": 1},
-    {"id": "r_c8_s3_002", "subcategory_id": "c8_s3", "name": "توثيق لتوفير مجموعة من القواميس والمراجع البسيطة في ركن القراءة", "order": 2},
-    {"id": "r_c8_s3_003", "subcategory_id": "c8_s3", "name": "تقرير عن توفير السبورات الشخصية للطلاب للمشاركة", "order": 3},
-    {"id": "r_c8_s3_004", "subcategory_id": "c8_s3", "name": "توثيق لتجهيز مواد للتجارب العملية", "order": 4},
-    {"id": "r_c8_s3_005", "subcategory_id": "c8_s3", "name": "تقرير عن توفير بطاقات ومجسمات تعليمية للمفاهيم المجردة", "order": 5},
-    {"id": "r_c8_s3_006", "subcategory_id": "c8_s3", "name": "توثيق لصيانة الأدوات التعليمية التالفة", "order": 6},
-    {"id": "r_c8_s3_007", "subcategory_id": "c8_s3", "name": "تقرير عن توفير كتب وقصص إضافية في مكتبة الفصل", "order": 7},
-    {"id": "r_c8_s3_008", "subcategory_id": "c8_s3", "name": "توثيق لتجهيز مواد للأنشطة الفنية", "order": 8},
-    {"id": "r_c8_s3_009", "subcategory_id": "c8_s3", "name": "تقرير عن توفير وسائل تقنية عند الحاجة", "order": 9},
-    {"id": "r_c8_s3_010", "subcategory_id": "c8_s3", "name": "توثيق للتأكد من توفر أدوات النظافة بشكل دائم", "order": 10},
-
-    # ======================================================
-    # c8_s4: توفير بيئة تعليمية آمنة
-    # ======================================================
-    {"id": "r_c8_s4_001", "subcategory_id": "c8_s4", "name": "تقرير عن الفحص الدوري لمقاعد الطلاب وإبلاغ الإدارة بأي تلف", "order": 1},
-    {"id": "r_c8_s4_002", "subcategory_id": "c8_s4", "name": "توثيق للتأكد من سلامة التوصيلات الكهربائية في الفصل", "order": 2},
-    {"id": "r_c8_s4_003", "subcategory_id": "c8_s4", "name": "تقرير عن إبعاد أي مواد خطرة عن متناول الطلاب", "order": 3},
-    {"id": "r_c8_s4_004", "subcategory_id": "c8_s4", "name": "توثيق لتدريب الطلاب على خطة الإخلاء وطريق الخروج الآمن", "order": 4},
-    {"id": "r_c8_s4_005", "subcategory_id": "c8_s4", "name": "تقرير عن التأكد من تهوية الفصل وإنارته بشكل جيد", "order": 5},
-    {"id": "r_c8_s4_006", "subcategory_id": "c8_s4", "name": "توثيق لخلق جو من الاحترام المتبادل بين الطلاب", "order": 6},
-    {"id": "r_c8_s4_007", "subcategory_id": "c8_s4", "name": "تقرير عن تشجيع الطلاب على التعبير عن آرائهم بحرية دون خوف", "order": 7},
-    {"id": "r_c8_s4_008", "subcategory_id": "c8_s4", "name": "توثيق للتعامل مع أي سلوك عدواني فوراً وبحزم لحماية الطلاب", "order": 8},
-    {"id": "r_c8_s4_009", "subcategory_id": "c8_s4", "name": "تقرير عن طمأنة الطلاب الجدد والخجولين واحتضانهم", "order": 9},
-    {"id": "r_c8_s4_010", "subcategory_id": "c8_s4", "name": "توثيق لمراعاة مشاعر الطلاب وعدم التعنيف اللفظي أو الجسدي", "order": 10},
-
-    # ======================================================
-    # c8_s5: تمكين المتعلمين من التعبير عن أنفسهم
-    # ======================================================
-    {"id": "r_c8_s5_001", "subcategory_id": "c8_s5", "name": "تقرير عن تخصيص وقت شارك فكرتك في نهاية الحصة", "order": 1},
-    {"id": "r_c8_s5_002", "subcategory_id": "c8_s5", "name": "توثيق لاستخدام استراتيجية رأيي مهم لجمع آراء الطلاب", "order": 2},
-    {"id": "r_c8_s5_003", "subcategory_id": "c8_s5", "name": "تقرير عن تشجيع الطلاب على طرح الأسئلة وعدم السخرية من أسئلتهم", "order": 3},
-    {"id": "r_c8_s5_004", "subcategory_id": "c8_s5", "name": "توثيق لإنشاء صندوق للاقتراحات في الفصل", "order": 4},
-    {"id": "r_c8_s5_005", "subcategory_id": "c8_s5", "name": "تقرير عن إتاحة الفرصة للطلاب لتقديم عروض عن مواضيع يختارونها", "order": 5},
-    {"id": "r_c8_s5_006", "subcategory_id": "c8_s5", "name": "توثيق لتنظيم مسابقة متحدث الفصل لطلاب المرحلة الابتدائية", "order": 6},
-    {"id": "r_c8_s5_007", "subcategory_id": "c8_s5", "name": "تقرير عن إشراك الطلاب في اتخاذ قرارات الفصل", "order": 7},
-    {"id": "r_c8_s5_008", "subcategory_id": "c8_s5", "name": "توثيق لعرض أعمال الطلاب ومشاركتها مع الزملاء", "order": 8},
-    {"id": "r_c8_s5_009", "subcategory_id": "c8_s5", "name": "تقرير عن استخدام استراتيجية المشروع الحر", "order": 9},
-    {"id": "r_c8_s5_010", "subcategory_id": "c8_s5", "name": "توثيق لتشجيع النقد البناء بين الطلاب في المناقشات", "order": 10},
-
-    # ======================================================
-    # c8_s6: إثارة دافعية المتعلمين
-    # ======================================================
-    {"id": "r_c8_s6_001", "subcategory_id": "c8_s6", "name": "تقرير عن استخدام الألعاب التعليمية والمسابقات لزيادة الحماس", "order": 1},
-    {"id": "r_c8_s6_002", "subcategory_id": "c8_s6", "name": "توثيق لاستخدام القصص المشوقة لبداية الحصة", "order": 2},
-    {"id": "r_c8_s6_003", "subcategory_id": "c8_s6", "name": "تقرير عن ربط الدروس بحياة الطلاب اليومية لزيادة الاهتمام", "order": 3},
-    {"id": "r_c8_s6_004", "subcategory_id": "c8_s6", "name": "توثيق لاستخدام المكافآت العينية والرمزية", "order": 4},
-    {"id": "r_c8_s6_005", "subcategory_id": "c8_s6", "name": "تقرير عن تنويع طرق الشرح", "order": 5},
-    {"id": "r_c8_s6_006", "subcategory_id": "c8_s6", "name": "توثيق لإعطاء الطلاب مسؤوليات", "order": 6},
-    {"id": "r_c8_s6_007", "subcategory_id": "c8_s6", "name": "تقرير عن استخدام أسلوب التحدي والألغاز في طرح الأسئلة", "order": 7},
-    {"id": "r_c8_s6_008", "subcategory_id": "c8_s6", "name": "توثيق لتغيير مكان التعلم أحياناً", "order": 8},
-    {"id": "r_c8_s6_009", "subcategory_id": "c8_s6", "name": "تقرير عن تقديم تغذية راجعة إيجابية ومحددة لكل طالب", "order": 9},
-    {"id": "r_c8_s6_010", "subcategory_id": "c8_s6", "name": "توثيق لإشراك الطلاب في اختيار نوع النشاط أو المشروع", "order": 10},
-
-    # ======================================================
-    # c9_s1: وضع قواعد واضحة للسلوك في الصف
-    # ======================================================
-    {"id": "r_c9_s1_001", "subcategory_id": "c9_s1", "name": "تقرير عن مناقشة الطلاب في بداية العام لوضع قوانين الفصل", "order": 1},
-    {"id": "r_c9_s1_002", "subcategory_id": "c9_s1", "name": "توثيق لكتابة القواعد الصفية وتعليقها في مكان بارز بالفصل", "order": 2},
-    {"id": "r_c9_s1_003", "subcategory_id": "c9_s1", "name": "تقرير عن شرح عواقب مخالفة القواعد بشكل واضح للطلاب", "order": 3},
-    {"id": "r_c9_s1_004", "subcategory_id": "c9_s1", "name": "توثيق لمراجعة القواعد بشكل دوري مع الطلاب", "order": 4},
-    {"id": "r_c9_s1_005", "subcategory_id": "c9_s1", "name": "تقرير عن وضع إشارات بصرية للتذكير بالقواعد", "order": 5},
-    {"id": "r_c9_s1_006", "subcategory_id": "c9_s1", "name": "توثيق لتخصيص حصة لمناقشة قواعد السلوك العامة في المدرسة", "order": 6},
-    {"id": "r_c9_s1_007", "subcategory_id": "c9_s1", "name": "تقرير عن تطبيق القواعد بعدالة على جميع الطلاب", "order": 7},
-    {"id": "r_c9_s1_008", "subcategory_id": "c9_s1", "name": "توثيق لتعزيز الطلاب الملتزمين بالقواعد أمام زملائهم", "order": 8},
-    {"id": "r_c9_s1_009", "subcategory_id": "c9_s1", "name": "تقرير عن مناقشة تعديل قاعدة غير مناسبة مع الطلاب", "order": 9},
-    {"id": "r_c9_s1_010", "subcategory_id": "c9_s1", "name": "توثيق لتوقيع الطلاب على تعهد بالالتزام بقوانين الفصل", "order": 10},
-
-    # ======================================================
-    # c9_s2: استخدام أساليب تحفيزية لتشجيع الطلاب على الالتزام
-    # ======================================================
-    {"id": "r_c9_s2_001", "subcategory_id": "c9_s2", "name": "تقرير عن تطبيق نظام النقاط والمكافآت للطلاب الملتزمين", "order": 1},
-    {"id": "r_c9_s2_002", "subcategory_id": "c9_s2", "name": "توثيق لاستخدام بطاقات شكر وتقدير تقدم للطالب المثالي", "order": 2},
-    {"id": "r_c9_s2_003", "subcategory_id": "c9_s2", "name": "تقرير عن تخصيص لوحة نجوم الفصل للطلاب ذوي السلوك الجيد", "order": 3},
-    {"id": "r_c9_s2_004", "subcategory_id": "c9_s2", "name": "توثيق للثناء اللفظي على الطلاب", "order": 4},
-    {"id": "r_c9_s2_005", "subcategory_id": "c9_s2", "name": "تقرير عن منح صلاحيات للطلاب الملتزمين", "order": 5},
-    {"id": "r_c9_s2_006", "subcategory_id": "c9_s2", "name": "توثيق لإرسال رسائل إيجابية لأولياء الأمور عن سلوك أبنائهم", "order": 6},
-    {"id": "r_c9_s2_007", "subcategory_id": "c9_s2", "name": "تقرير عن تخصيص وقت للعب أو نشاط حر كمكافأة جماعية", "order": 7},
-    {"id": "r_c9_s2_008", "subcategory_id": "c9_s2", "name": "توثيق لتكريم الطلاب المثاليين في الإذاعة المدرسية", "order": 8},
-    {"id": "r_c9_s2_009", "subcategory_id": "c9_s2", "name": "تقرير عن استخدام شارات أو أوسمة", "order": 9},
-    {"id": "r_c9_s2_010", "subcategory_id": "c9_s2", "name": "توثيق لتحويل المنافسة بين المجموعات لتعزيز السلوك الإيجابي", "order": 10},
-
-    # ======================================================
-    # c9_s3: التعامل مع المشكلات السلوكية بشكل عادل وحازم
-    # ======================================================
-    {"id": "r_c9_s3_001", "subcategory_id": "c9_s3", "name": "تقرير عن تطبيق أسلوب النظرة العابسة أو الاقتراب لوقف السلوك البسيط", "order": 1},
-    {"id": "r_c9_s3_002", "subcategory_id": "c9_s3", "name": "توثيق لتوجيه إنذار شفهي خاص لطالب مخالف للقواعد", "order": 2},
-    {"id": "r_c9_s3_003", "subcategory_id": "c9_s3", "name": "تقرير عن عزل الطالب مؤقتاً داخل الفصل", "order": 3},
-    {"id": "r_c9_s3_004", "subcategory_id": "c9_s3", "name": "توثيق لتطبيق العواقب المتفق عليها مسبقاً عند مخالفة القواعد", "order": 4},
-    {"id": "r_c9_s3_005", "subcategory_id": "c9_s3", "name": "تقرير عن الاستماع لوجهة نظر الطالب قبل اتخاذ قرار بشأن المخالفة", "order": 5},
-    {"id": "r_c9_s3_006", "subcategory_id": "c9_s3", "name": "توثيق لتحويل طالب لمشكلة سلوكية متكررة للمرشد الطلابي", "order": 6},
-    {"id": "r_c9_s3_007", "subcategory_id": "c9_s3", "name": "تقرير عن التواصل مع ولي الأمر للتباحث حول حل مشكلة سلوكية", "order": 7},
-    {"id": "r_c9_s3_008", "subcategory_id": "c9_s3", "name": "توثيق لتطبيق لائحة السلوك والمواظبة عند الضرورة", "order": 8},
-    {"id": "r_c9_s3_009", "subcategory_id": "c9_s3", "name": "تقرير عن معالجة المشكلة فور حدوثها وعدم تأجيلها", "order": 9},
-    {"id": "r_c9_s3_010", "subcategory_id": "c9_s3", "name": "توثيق للحزم في تطبيق القواعد دون تمييز أو محاباة", "order": 10},
-
-    # ======================================================
-    # c9_s4: تنظيم الوقت بشكل فعال خلال الحصة
-    # ======================================================
-    {"id": "r_c9_s4_001", "subcategory_id": "c9_s4", "name": "تقرير عن كتابة جدول زمني للحصة على السبورة", "order": 1},
-    {"id": "r_c9_s4_002", "subcategory_id": "c9_s4", "name": "توثيق لاستخدام مؤقت على السبورة لضبط وقت الأنشطة", "order": 2},
-    {"id": "r_c9_s4_003", "subcategory_id": "c9_s4", "name": "تقرير عن تجهيز الوسائل والمواد قبل بداية الحصة لتوفير الوقت", "order": 3},
-    {"id": "r_c9_s4_004", "subcategory_id": "c9_s4", "name": "توثيق لبدء الحصة في الوقت المحدد دون إطالة للمقدمة", "order": 4},
-    {"id": "r_c9_s4_005", "subcategory_id": "c9_s4", "name": "تقرير عن مراعاة تنوع الأنشطة بما يتناسب مع الوقت المخصص", "order": 5},
-    {"id": "r_c9_s4_006", "subcategory_id": "c9_s4", "name": "توثيق لتكليف الطلاب بمهام واضحة ومحددة زمنياً", "order": 6},
-    {"id": "r_c9_s4_007", "subcategory_id": "c9_s4", "name": "تقرير عن تخصيص الدقائق الأخيرة للمراجعة والختام", "order": 7},
-    {"id": "r_c9_s4_008", "subcategory_id": "c9_s4", "name": "توثيق لإنهاء الحصة في الوقت المحدد وعدم الاستمرار بعد الجرس", "order": 8},
-    {"id": "r_c9_s4_009", "subcategory_id": "c9_s4", "name": "تقرير عن تقليل الوقت الضائع في الانتقال بين الأنشطة", "order": 9},
-    {"id": "r_c9_s4_010", "subcategory_id": "c9_s4", "name": "توثيق لاستخدام استراتيجيات سريعة لإدارة الوقت بكفاءة", "order": 10},
-
-    # ======================================================
-    # c10_s1: استخدام اختبارات تقييمية دورية
-    # ======================================================
-    {"id": "r_c10_s1_001", "subcategory_id": "c10_s1", "name": "تقرير عن تطبيق اختبار قبلي لقياس مدى معرفة الطلاب بالدرس الجديد", "order": 1},
-    {"id": "r_c10_s1_002", "subcategory_id": "c10_s1", "name": "توثيق لنماذج من اختبارات قصيرة أسبوعية", "order": 2},
-    {"id": "r_c10_s1_003", "subcategory_id": "c10_s1", "name": "تقرير عن تطبيق اختبارات شهرية لقياس نواتج التعلم للوحدة", "order": 3},
-    {"id": "r_c10_s1_004", "subcategory_id": "c10_s1", "name": "توثيق لنتائج الاختبارات التشخيصية في بداية العام الدراسي", "order": 4},
-    {"id": "r_c10_s1_005", "subcategory_id": "c10_s1", "name": "تقرير عن استخدام بطاقات الملاحظة لتقييم الأداء العملي", "order": 5},
-    {"id": "r_c10_s1_006", "subcategory_id": "c10_s1", "name": "توثيق لتطبيق اختبارات تحريرية في منتصف الفصل الدراسي", "order": 6},
-    {"id": "r_c10_s1_007", "subcategory_id": "c10_s1", "name": "تقرير عن تنفيذ اختبارات شفهية لقياس مهارات التحدث", "order": 7},
-    {"id": "r_c10_s1_008", "subcategory_id": "c10_s1", "name": "توثيق لتطبيق اختبارات أدائية في المواد العملية", "order": 8},
-    {"id": "r_c10_s1_009", "subcategory_id": "c10_s1", "name": "تقرير عن استخدام أوراق العمل كأداة تقييم تكويني مستمر", "order": 9},
-    {"id": "r_c10_s1_010", "subcategory_id": "c10_s1", "name": "توثيق لتطبيق اختبارات إلكترونية تفاعلية عبر منصة مدرستي", "order": 10},
-
-    # ======================================================
-    # c10_s2: تحليل النتائج لتحديد نقاط القوة والضعف
-    # ======================================================
-    {"id": "r_c10_s2_001", "subcategory_id": "c10_s2", "name": "تقرير عن إعداد كشف تحليل لنتائج اختبار الفصل الدراسي", "order": 1},
-    {"id": "r_c10_s2_002", "subcategory_id": "c10_s2", "name": "توثيق لاجتماع مع الطلاب لمناقشة نتائجهم في الاختبار بشكل عام", "order": 2},
-    {"id": "r_c10_s2_003", "subcategory_id": "c10_s2", "name": "تقرير عن توضيح الأسئلة التي أخطأ فيها أغلب الطلاب وإعادة شرحها", "order": 3},
-    {"id": "r_c10_s2_004", "subcategory_id": "c10_s2", "name": "توثيق لقاءات فردية مع الطلاب لتحليل أدائهم في الاختبارات", "order": 4},
-    {"id": "r_c10_s2_005", "subcategory_id": "c10_s2", "name": "تقرير عن إشراك الطلاب في استخراج الدروس المستفادة من أخطائهم", "order": 5},
-    {"id": "r_c10_s2_006", "subcategory_id": "c10_s2", "name": "توثيق لاستخدام الرسوم البيانية البسيطة لعرض نتائج الفصل", "order": 6},
-    {"id": "r_c10_s2_007", "subcategory_id": "c10_s2", "name": "تقرير عن توجيه الطلاب لتحديد نقاط قوتهم وضعفهم بأنفسهم", "order": 7},
-    {"id": "r_c10_s2_008", "subcategory_id": "c10_s2", "name": "توثيق لمناقشة تطور أداء الطالب مقارنة بالاختبار السابق", "order": 8},
-    {"id": "r_c10_s2_009", "subcategory_id": "c10_s2", "name": "تقرير عن تحليل نتائج الواجبات الأسبوعية لتحديد المهارات غير المتقنة", "order": 9},
-    {"id": "r_c10_s2_010", "subcategory_id": "c10_s2", "name": "توثيق لتحليل نتائج مجموعات الطلاب لتحديد المجموعات الأكثر احتياجاً", "order": 10},
-
-    # ======================================================
-    # c10_s3: توفير تغذية راجعة فردية للطلاب
-    # ======================================================
-    {"id": "r_c10_s3_001", "subcategory_id": "c10_s3", "name": "تقرير عن لقاء فردي مع طالب متميز لتوجيهه لمصادر إثرائية", "order": 1},
-    {"id": "r_c10_s3_002", "subcategory_id": "c10_s3", "name": "توثيق لاجتماع مع طالب متعثر لمناقشة أسباب ضعفه ووضع خطة دعم", "order": 2},
-    {"id": "r_c10_s3_003", "subcategory_id": "c10_s3", "name": "تقرير عن كتابة ملاحظات فردية على كراس كل طالب", "order": 3},
-    {"id": "r_c10_s3_004", "subcategory_id": "c10_s3", "name": "توثيق لتخصيص وقت بعد الحصة لمناقشة طالب بشكل فردي", "order": 4},
-    {"id": "r_c10_s3_005", "subcategory_id": "c10_s3", "name": "تقرير عن توجيه رسالة خاصة عبر منصة مدرستي لكل طالب", "order": 5},
-    {"id": "r_c10_s3_006", "subcategory_id": "c10_s3", "name": "توثيق لتقديم تغذية راجعة شفهية خاصة لطالب خجول", "order": 6},
-    {"id": "r_c10_s3_007", "subcategory_id": "c10_s3", "name": "تقرير عن مناقشة ولي أمر بحضور الطالب لتقديم تغذية راجعة مشتركة", "order": 7},
-    {"id": "r_c10_s3_008", "subcategory_id": "c10_s3", "name": "توثيق لمراجعة ملف الإنجاز الخاص بكل طالب وتقديم ملاحظات عليه", "order": 8},
-    {"id": "r_c10_s3_009", "subcategory_id": "c10_s3", "name": "تقرير عن توجيه الطالب لخطوات محددة لتحسين مستواه", "order": 9},
-    {"id": "r_c10_s3_010", "subcategory_id": "c10_s3", "name": "توثيق لاستخدام بطاقات التغذية الراجعة الجاهزة لكل طالب", "order": 10},
-
-    # ======================================================
-    # c10_s4: تطبيق خطط علاجية للطلاب الذين يحتاجون إلى دعم
-    # ======================================================
-    {"id": "r_c10_s4_001", "subcategory_id": "c10_s4", "name": "تقرير عن إعداد خطة علاجية للطلاب المتعثرين", "order": 1},
-    {"id": "r_c10_s4_002", "subcategory_id": "c10_s4", "name": "توثيق لتنفيذ حصص تقوية بعد الدوام الرسمي للطلاب الضعاف", "order": 2},
-    {"id": "r_c10_s4_003", "subcategory_id": "c10_s4", "name": "تقرير عن تصميم أوراق عمل علاجية للمهارات الأساسية", "order": 3},
-    {"id": "r_c10_s4_004", "subcategory_id": "c10_s4", "name": "توثيق لتوزيع الطلاب الضعاف على مجموعات دعم داخل الفصل", "order": 4},
-    {"id": "r_c10_s4_005", "subcategory_id": "c10_s4", "name": "تقرير عن متابعة تطور الطالب في الخطة العلاجية أسبوعياً", "order": 5},
-    {"id": "r_c10_s4_006", "subcategory_id": "c10_s4", "name": "توثيق للتعاون مع المرشد الطلابي في وضع خطة للطلاب بطيئي التعلم", "order": 6},
-    {"id": "r_c10_s4_007", "subcategory_id": "c10_s4", "name": "تقرير عن إشراك ولي الأمر في تنفيذ الخطة العلاجية بالمنزل", "order": 7},
-    {"id": "r_c10_s4_008", "subcategory_id": "c10_s4", "name": "توثيق لتعديل الخطة العلاجية بناءً على نتائج التقييم المستمر", "order": 8},
-    {"id": "r_c10_s4_009", "subcategory_id": "c10_s4", "name": "تقرير عن استخدام برامج محوسبة لدعم الخطة العلاجية", "order": 9},
-    {"id": "r_c10_s4_010", "subcategory_id": "c10_s4", "name": "توثيق لتقييم الخطة العلاجية في نهاية الفصل وقياس مدى نجاحها", "order": 10},
-
-    # ======================================================
-    # c10_s5: قياس التطبيق العملي للمعرفة عبر مواقف حقيقية
-    # ======================================================
-    {"id": "r_c10_s5_001", "subcategory_id": "c10_s5", "name": "تقرير عن تقييم مشروع تصميم مجسم تعليمي", "order": 1},
-    {"id": "r_c10_s5_002", "subcategory_id": "c10_s5", "name": "توثيق لتقييم عروض تقديمية لطلاب الثانوي عن قضايا معاصرة", "order": 2},
-    {"id": "r_c10_s5_003", "subcategory_id": "c10_s5", "name": "تقرير عن تقييم أداء الطلاب في معرض المواهب المدرسي", "order": 3},
-    {"id": "r_c10_s5_004", "subcategory_id": "c10_s5", "name": "توثيق لتقييم تطبيق عملي للتجارب في المعامل", "order": 4},
-    {"id": "r_c10_s5_005", "subcategory_id": "c10_s5", "name": "تقرير عن تقييم مهارة الإلقاء والتحدث أمام الجمهور", "order": 5},
-    {"id": "r_c10_s5_006", "subcategory_id": "c10_s5", "name": "توثيق لتقييم مشاركة الطلاب في المسابقات المدرسية", "order": 6},
-    {"id": "r_c10_s5_007", "subcategory_id": "c10_s5", "name": "تقرير عن تقييم مشاريع خدمة المجتمع التي نفذها طلاب الثانوي", "order": 7},
-    {"id": "r_c10_s5_008", "subcategory_id": "c10_s5", "name": "توثيق لتقييم أداء الطلاب في تمثيل مشهد مسرحي", "order": 8},
-    {"id": "r_c10_s5_009", "subcategory_id": "c10_s5", "name": "تقرير عن تقييم ملفات الإنجاز التي تعكس تطور الطالب", "order": 9},
-    {"id": "r_c10_s5_010", "subcategory_id": "c10_s5", "name": "توثيق لتقييم مشاركة الطلاب في محاكاة لمؤتمر أو قمة", "order": 10},
-
-    # ======================================================
-    # c11_s1: استخدام الاختبارات الكتابية والشفوية
-    # ======================================================
-    {"id": "r_c11_s1_001", "subcategory_id": "c11_s1", "name": "تقرير عن تطبيق اختبار كتابي تحريري نهاية كل وحدة دراسية", "order": 1},
-    {"id": "r_c11_s1_002", "subcategory_id": "c11_s1", "name": "توثيق لنماذج من أسئلة الاختبارات القصيرة الأسبوعية", "order": 2},
-    {"id": "r_c11_s1_003", "subcategory_id": "c11_s1", "name": "تقرير عن إجراء اختبارات شفهية لقياس مهارات الحفظ والتحدث", "order": 3},
-    {"id": "r_c11_s1_004", "subcategory_id": "c11_s1", "name": "توثيق لتنويع أسئلة الاختبارات الكتابية", "order": 4},
-    {"id": "r_c11_s1_005", "subcategory_id": "c11_s1", "name": "تقرير عن تطبيق اختبارات إلكترونية", "order": 5},
-    {"id": "r_c11_s1_006", "subcategory_id": "c11_s1", "name": "توثيق لاستخدام بطاقات الأسئلة في الاختبارات الشفوية", "order": 6},
-    {"id": "r_c11_s1_007", "subcategory_id": "c11_s1", "name": "تقرير عن تصميم اختبار كتابي يراعي مستويات الطلاب", "order": 7},
-    {"id": "r_c11_s1_008", "subcategory_id": "c11_s1", "name": "توثيق لتطبيق اختبار شفهي جماعي في نهاية الحصة", "order": 8},
-    {"id": "r_c11_s1_009", "subcategory_id": "c11_s1", "name": "تقرير عن استخدام السبورة الشخصية للاختبارات الشفوية السريعة", "order": 9},
-    {"id": "r_c11_s1_010", "subcategory_id": "c11_s1", "name": "توثيق لتصحيح الاختبارات الكتابية وإعادتها للطلاب بملاحظات", "order": 10},
-
-    # ======================================================
-    # c11_s2: تطبيق التقييم العملي من خلال المشاريع والعروض
-    # ======================================================
-    {"id": "r_c11_s2_001", "subcategory_id": "c11_s2", "name": "تقرير عن تقييم مشروع البحث العلمي لطلاب المرحلة الثانوية", "order": 1},
-    {"id": "r_c11_s2_002", "subcategory_id": "c11_s2", "name": "توثيق لتقييم عروض البوربوينت التي أعدها الطلاب", "order": 2},
-    {"id": "r_c11_s2_003", "subcategory_id": "c11_s2", "name": "تقرير عن تقييم المشاريع الفنية لطلاب الابتدائي", "order": 3},
-    {"id": "r_c11_s2_004", "subcategory_id": "c11_s2", "name": "توثيق لتقييم أداء الطلاب في المعارض العلمية بالمدرسة", "order": 4},
-    {"id": "r_c11_s2_005", "subcategory_id": "c11_s2", "name": "تقرير عن تقييم مشروع إعادة التدوير", "order": 5},
-    {"id": "r_c11_s2_006", "subcategory_id": "c11_s2", "name": "توثيق لتقييم العروض المسرحية", "order": 6},
-    {"id": "r_c11_s2_007", "subcategory_id": "c11_s2", "name": "تقرير عن تقييم مشروع الخطة التسويقية لطلاب الثانوي", "order": 7},
-    {"id": "r_c11_s2_008", "subcategory_id": "c11_s2", "name": "توثيق لتقييم تجارب عملية في المعامل", "order": 8},
-    {"id": "r_c11_s2_009", "subcategory_id": "c11_s2", "name": "تقرير عن تقييم مشاريع ريادة الأعمال المصغرة", "order": 9},
-    {"id": "r_c11_s2_010", "subcategory_id": "c11_s2", "name": "توثيق لتقييم إنتاج محتوى رقمي من قبل الطلاب", "order": 10},
-
-    # ======================================================
-    # c11_s3: استخدام التقييم التكويني لتتبع تقدم الطلاب
-    # ======================================================
-    {"id": "r_c11_s3_001", "subcategory_id": "c11_s3", "name": "تقرير عن استخدام أوراق العمل اليومية كأداة تقييم تكويني", "order": 1},
-    {"id": "r_c11_s3_002", "subcategory_id": "c11_s3", "name": "توثيق لاستخدام بطاقات الخروج في نهاية الحصة", "order": 2},
-    {"id": "r_c11_s3_003", "subcategory_id": "c11_s3", "name": "تقرير عن استخدام استراتيجية الإشارة باليد لقياس الفهم أثناء الشرح", "order": 3},
-    {"id": "r_c11_s3_004", "subcategory_id": "c11_s3", "name": "توثيق لملاحظاتي اليومية المسجلة في دفتر متابعة الطلاب", "order": 4},
-    {"id": "r_c11_s3_005", "subcategory_id": "c11_s3", "name": "تقرير عن استخدام بطاقات الملاحظة أثناء الأنشطة الجماعية", "order": 5},
-    {"id": "r_c11_s3_006", "subcategory_id": "c11_s3", "name": "توثيق لتصحيح الواجبات اليومية وتدوين نتائجها", "order": 6},
-    {"id": "r_c11_s3_007", "subcategory_id": "c11_s3", "name": "تقرير عن استخدام المناقشات الصفية كمؤشر لفهم الطلاب", "order": 7},
-    {"id": "r_c11_s3_008", "subcategory_id": "c11_s3", "name": "توثيق لتطبيق اختبارات قصيرة أسبوعية لقياس التقدم", "order": 8},
-    {"id": "r_c11_s3_009", "subcategory_id": "c11_s3", "name": "تقرير عن استخدام سجل الإتقان لتسجيل المهارات التي أتقنها كل طالب", "order": 9},
-    {"id": "r_c11_s3_010", "subcategory_id": "c11_s3", "name": "توثيق لاستخدام القبعة الصفراء في استراتيجية القبعات الست لقياس الإيجابيات", "order": 10},
-
-    # ======================================================
-    # c11_s4: استخدام التقويم القبلي
-    # ======================================================
-    {"id": "r_c11_s4_001", "subcategory_id": "c11_s4", "name": "تقرير عن تطبيق اختبار قبلي في أول العام الدراسي لتشخيص المستوى", "order": 1},
-    {"id": "r_c11_s4_002", "subcategory_id": "c11_s4", "name": "توثيق لاستخدام أسئلة ماذا تعرف عن؟ في بداية كل وحدة", "order": 2},
-    {"id": "r_c11_s4_003", "subcategory_id": "c11_s4", "name": "تقرير عن إجراء عصف ذهني قبلي لاستخراج الخبرات السابقة للطلاب", "order": 3},
-    {"id": "r_c11_s4_004", "subcategory_id": "c11_s4", "name": "توثيق لاستخدام استراتيجية الرسم التخطيطي لتمثيل المعرفة السابقة", "order": 4},
-    {"id": "r_c11_s4_005", "subcategory_id": "c11_s4", "name": "تقرير عن توجيه أسئلة شفهية سريعة لمعرفة مدى استعداد الطلاب للدرس", "order": 5},
-    {"id": "r_c11_s4_006", "subcategory_id": "c11_s4", "name": "توثيق لاستخدام استبيان قبلي بسيط عن الموضوع", "order": 6},
-    {"id": "r_c11_s4_007", "subcategory_id": "c11_s4", "name": "تقرير عن تصميم بطاقة قائمة التأكد من المهارات الأساسية السابقة", "order": 7},
-    {"id": "r_c11_s4_008", "subcategory_id": "c11_s4", "name": "توثيق لمراجعة مهارات العام السابق قبل البدء بدرس جديد", "order": 8},
-    {"id": "r_c11_s4_009", "subcategory_id": "c11_s4", "name": "تقرير عن استخدام خرائط المفاهيم لربط المعرفة الجديدة بالقديمة", "order": 9},
-    {"id": "r_c11_s4_010", "subcategory_id": "c11_s4", "name": "توثيق لمناقشة الطلاب في خبراتهم الحياتية المرتبطة بالدرس", "order": 10},
-
-    # ======================================================
-    # c11_s5: تطبيق التقويم الختامي
-    # ======================================================
-    {"id": "r_c11_s5_001", "subcategory_id": "c11_s5", "name": "تقرير عن تطبيق اختبار نهاية الفصل الدراسي الأول", "order": 1},
-    {"id": "r_c11_s5_002", "subcategory_id": "c11_s5", "name": "توثيق لنتائج الاختبارات النهائية المحللة", "order": 2},
-    {"id": "r_c11_s5_003", "subcategory_id": "c11_s5", "name": "تقرير عن تطبيق مشروع ختامي شامل يقيّم نواتج التعلم للفصل", "order": 3},
-    {"id": "r_c11_s5_004", "subcategory_id": "c11_s5", "name": "توثيق لتطبيق اختبارات نهاية الوحدة التحريرية", "order": 4},
-    {"id": "r_c11_s5_005", "subcategory_id": "c11_s5", "name": "تقرير عن إصدار أحكام مستوية بناءً على أداء الطالب في الاختبارات", "order": 5},
-    {"id": "r_c11_s5_006", "subcategory_id": "c11_s5", "name": "توثيق لاستخدام سجل الدرجات النهائي لرصد نتائج التقويم الختامي", "order": 6},
-    {"id": "r_c11_s5_007", "subcategory_id": "c11_s5", "name": "تقرير عن إعداد تقرير ختامي لمستوى الفصل في المادة", "order": 7},
-    {"id": "r_c11_s5_008", "subcategory_id": "c11_s5", "name": "توثيق لمقارنة نتائج التقويم الختامي بنتائج التقويم القبلي", "order": 8},
-    {"id": "r_c11_s5_009", "subcategory_id": "c11_s5", "name": "تقرير عن تحليل مدى تحقيق الأهداف العامة للمنهج من خلال الاختبارات النهائية", "order": 9},
-    {"id": "r_c11_s5_010", "subcategory_id": "c11_s5", "name": "توثيق لتسليم كشوف الدرجات النهائية للإدارة", "order": 10}
-]
-
-# إدارات التعليم
-EDUCATION_OFFICES = [
-    "الإدارة العامة للتعليم بمنطقة مكة المكرمة",
-    "الإدارة العامة للتعليم بمنطقة الرياض",
-    "الإدارة العامة للتعليم بمنطقة المدينة المنورة",
-    "الإدارة العامة للتعليم بالمنطقة الشرقية",
-    "الإدارة العامة للتعليم بمنطقة القصيم",
-    "الإدارة العامة للتعليم بمنطقة عسير",
-    "الإدارة العامة للتعليم بمنطقة تبوك",
-    "الإدارة العامة للتعليم بمنطقة حائل",
-    "الإدارة العامة للتعليم بمنطقة الحدود الشمالية",
-    "الإدارة العامة للتعليم بمنطقة جازان",
-    "الإدارة العامة للتعليم بمنطقة نجران",
-    "الإدارة العامة للتعليم بمنطقة الباحة",
-    "الإدارة العامة للتعليم بمنطقة الجوف",
-    "الإدارة العامة للتعليم بمحافظة الأحساء",
-    "الإدارة العامة للتعليم بمحافظة الطائف",
-    "الإدارة العامة للتعليم بمحافظة جدة"
-]
-
-# المواد الدراسية
-SCHOOL_SUBJECTS = [
-    "القرآن الكريم",
-    "الدراسات الإسلامية",
-    "اللغة العربية",
-    "الرياضيات",
-    "العلوم",
-    "الدراسات الاجتماعية",
-    "اللغة الإنجليزية",
-    "التربية الفنية",
-    "التربية البدنية",
-    "المهارات الرقمية",
-    "المهارات الحياتية والأسرية",
-    "التفكير الناقد",
-    "التربية المهنية"
-]
-
-# الصفوف الدراسية
-SCHOOL_GRADES = [
-    "الصف الأول الابتدائي",
-    "الصف الثاني الابتدائي",
-    "الصف الثالث الابتدائي",
-    "الصف الرابع الابتدائي",
-    "الصف الخامس الابتدائي",
-    "الصف السادس الابتدائي",
-    "الصف الأول المتوسط",
-    "الصف الثاني المتوسط",
-    "الصف الثالث المتوسط",
-    "الصف الأول الثانوي",
-    "الصف الثاني الثانوي",
-    "الصف الثالث الثانوي"
-]
+# ---------- Gemini Calls ----------
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "models/gemini-2.5-flash-lite")
+GEMINI_MAX_IN_FLIGHT = int(os.getenv("GEMINI_MAX_IN_FLIGHT", "200"))
+gemini_slots = asyncio.Semaphore(GEMINI_MAX_IN_FLIGHT)
+gemini_pool = GeminiPool(api_keys, GEMINI_MODEL)
+# نموذج احتياطي بنفس المفاتيح وبحالة مستقلة لها، لأن حصص Gemini منفصلة لكل نموذج
+GEMINI_FALLBACK_MODEL = os.getenv("GEMINI_FALLBACK_MODEL", "")
+fallback_pool = GeminiPool(api_keys, GEMINI_FALLBACK_MODEL) if GEMINI_FALLBACK_MODEL else None
+gemini_pools = [p for p in (gemini_pool, fallback_pool) if p]
+GEMINI_MAX_ATTEMPTS = int(os.getenv("GEMINI_MAX_ATTEMPTS", "3"))
+GEMINI_RETRY_BASE_DELAY = float(os.getenv("GEMINI_RETRY_BASE_DELAY", "0.25"))
+GEMINI_RETRY_MAX_DELAY = float(os.getenv("GEMINI_RETRY_MAX_DELAY", "4"))
+# أقصى زمن لتوليد نص واحد شاملاً كل المحاولات والتحوّط
+GEMINI_DEADLINE = float(os.getenv("GEMINI_DEADLINE", "60"))
+# الأسعار بالدولار لكل مليون رمز وتُستخدم لتقدير التكلفة في /admin/usage فقط
+usage_log = UsageLog(
+    flush_interval=float(os.getenv("USAGE_LOG_FLUSH_INTERVAL", "5")),
+    price_input=float(os.getenv("GEMINI_PRICE_INPUT", "0.10")),
+    price_output=float(os.getenv("GEMINI_PRICE_OUTPUT", "0.40")),
+)
 
-# المستهدفون
-TARGET_AUDIENCES = [
-    "الطلاب",
-    "المعلمون",
-    "أولياء الأمور",
-    "المجتمع المحلي",
-    "الإدارة المدرسية",
-    "الموهوبون",
-    "طلاب صعوبات التعلم",
-    "الطلاب المتفوقون",
-    "الطلاب المتعثرون"
-]
+# التحوّط: إن تأخر الرد عن النسبة المئوية المحددة من الأزمنة الأخيرة يُرسل نفس الطلب
+# على مفتاح آخر ويؤخذ أول رد ناجح، بحد أقصى GEMINI_HEDGE_BUDGET من الطلبات
+GEMINI_HEDGE = os.getenv("GEMINI_HEDGE", "0") == "1"
+hedge_policy = HedgePolicy(
+    percentile=float(os.getenv("GEMINI_HEDGE_PERCENTILE", "0.95")),
+    budget=float(os.getenv("GEMINI_HEDGE_BUDGET", "0.05")),
+    min_samples=int(os.getenv("GEMINI_HEDGE_MIN_SAMPLES", "20")),
+    window=int(os.getenv("GEMINI_HEDGE_WINDOW", "500")),
+)
 
-# أماكن التنفيذ
-IMPLEMENTATION_PLACES = [
-    "قاعة الدرس",
-    "مصادر التعلم",
-    "مختبر العلوم",
-    "معمل الحاسب",
-    "ساحة المدرسة",
-    "المكتبة",
-    "قاعة النشاط",
-    "المسرح المدرسي",
-    "الفصول الافتراضية",
-    "الملعب الرياضي"
-]
+async def attempt_gemini(pool: GeminiPool, prompt: str, code_id: int = None, used_keys: list = None):
+    """محاولة واحدة على مفتاح من المجمّع، ويُضاف رقم المفتاح إلى used_keys"""
+    async with gemini_slots:
+        async with pool.borrow(used_keys or ()) as client:
+            if used_keys is not None:
+                used_keys.append(client.index)
+            start = time.perf_counter()
+            response = await client.generate_async(prompt)
+            latency = time.perf_counter() - start
+            usage_log.record(code_id, client.index, client.model_name, response, latency)
+            hedge_policy.record_latency(latency)
+    return response
+
+def retry_delay(attempt: int) -> float:
+    # full jitter حتى لا تعود الطلبات المتزامنة في نفس اللحظة
+    return random.uniform(0, min(GEMINI_RETRY_MAX_DELAY, GEMINI_RETRY_BASE_DELAY * 2 ** attempt))
+
+async def call_gemini(prompt: str, code_id: int = None, used_keys: list = None):
+    """
+    إعادة المحاولة على الأخطاء العابرة وأخطاء المفتاح (ملغى أو غير صالح) بمفتاح
+    مختلف في كل مرة، ثم على النموذج الاحتياطي إن فشلت محاولات النموذج الأساسي
+    أو لم يبقَ له مفتاح متاح.
+    """
+    used_keys = [] if used_keys is None else used_keys
+    error = None
+    for pool in gemini_pools:
+        # أرقام المفاتيح تخص مجمّع النموذج الأساسي فقط
+        tried = used_keys if pool is gemini_pool else []
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(retry_delay(attempt))
+            try:
+                return await attempt_gemini(pool, prompt, code_id, tried)
+            except HTTPException as e:
+                # كل مفاتيح هذا النموذج في فترة تبريد
+                if e.status_code != 503:
+                    raise
+                error = e
+                break
+            except Exception as e:
+                if not (is_retryable(e) or is_key_error(e)):
+                    raise
+                error = e
+                metrics.gemini_retries.labels(pool.model_name).inc()
+
+    if isinstance(error, HTTPException):
+        raise error
+    raise HTTPException(
+        status_code=503,
+        detail="Gemini is temporarily unavailable",
+        headers={"Retry-After": "10"},
+    )
 
-# الأدوات والوسائل التعليمية
-EDUCATIONAL_TOOLS = [
-    "سبورة",
-    "سبورة ذكية",
-    "جهاز عرض",
-    "أوراق عمل",
-    "حاسب",
-    "عرض تقديمي",
-    "بطاقات تعليمية",
-    "صور توضيحية",
-    "كتاب",
-    "أدوات رياضية",
-    "جهاز لوحي",
-    "منصة مدرستي",
-    "نظام نور",
-    "تطبيقات تعليمية",
-    "فيديو تعليمي"
-]
+async def generate_text(prompt: str, code_id: int = None) -> str:
+    metrics.generations.inc()
+    try:
+        async with asyncio.timeout(GEMINI_DEADLINE):
+            return await hedged_text(prompt, code_id)
+    except TimeoutError:
+        raise HTTPException(status_code=504, detail="Gemini did not respond in time")
+
+async def hedged_text(prompt: str, code_id: int = None) -> str:
+    delay = hedge_policy.delay() if GEMINI_HEDGE and len(gemini_pool) > 1 else None
+    if delay is None:
+        return (await call_gemini(prompt, code_id)).text
+
+    used_keys = []
+    primary = asyncio.ensure_future(call_gemini(prompt, code_id, used_keys))
+    pending = {primary}
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done or not hedge_policy.allow():
+            hedge_policy.settle(False)
+            return (await primary).text
+
+        hedge_policy.settle(True)
+        hedge = asyncio.ensure_future(call_gemini(prompt, code_id, used_keys))
+        pending.add(hedge)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if not task.exception():
+                    metrics.hedges.labels("hedge" if task is hedge else "primary").inc()
+                    return task.result().text
+        # فشل الاثنان: خطأ الطلب الأصلي هو الأوضح للمستخدم
+        metrics.hedges.labels("none").inc()
+        return primary.result().text
+    finally:
+        # الطلب الخاسر، أو كلاهما عند انتهاء المهلة أو انقطاع العميل
+        for task in pending:
+            task.cancel()
+
+async def stream_text(prompt: str, code_id: int = None):
+    async with gemini_slots:
+        async with gemini_pool.borrow() as client:
+            start = time.perf_counter()
+            response = await client.generate_async(prompt, stream=True)
+            async for chunk in response:
+                if chunk.parts:
+                    yield chunk.text
+            # usage_metadata يكتمل مع آخر جزء من البث
+            usage_log.record(
+                code_id, client.index, client.model_name, response, time.perf_counter() - start
+            )
 
 # ---------- برومبت الذكاء الاصطناعي ----------
+# يجب رفع الإصدار عند تعديل البرومبت حتى لا تُعاد نتائج مخزنة من إصدار سابق
+AI_PROMPT_VERSION = 1
+
 AI_PROMPT_TEMPLATE = """أنت خبير تربوي تعليمي محترف تمتلك خبرة ميدانية واسعة في التعليم العام.  
 اعتمد منظورًا تربويًا مهنيًا احترافيًا يركّز على تحسين جودة التعليم، ودعم المعلم، وتعزيز بيئة التعلّم، وخدمة القيادة المدرسية.  
 
@@ -1231,62 +362,183 @@ AI_PROMPT_TEMPLATE = """أنت خبير تربوي تعليمي محترف تم
 
 يرجى تقديم الإجابة باللغة العربية الفصحى، وتنظيمها بحيث يكون كل حقل في سطر منفصل يبدأ برقمه فقط دون ذكر العنوان."""
 
-def build_ai_prompt(report_name: str, subcategory_name: str, criterion_name: str, report_data: dict = None):
-    """بناء البرومت المناسب للذكاء الاصطناعي"""
+def report_data_lines(report_data: dict = None):
+    """أسطر بيانات التقرير الاختيارية، والسطر الفارغ يعني أن الحقل غير مُدخل"""
     if not report_data:
         report_data = {}
     
-    subject_line = f"المادة: {report_data.get('subject', '')}" if report_data.get('subject') else ""
-    lesson_line = f"الدرس: {report_data.get('lesson', '')}" if report_data.get('lesson') else ""
-    grade_line = f"الصف: {report_data.get('grade', '')}" if report_data.get('grade') else ""
-    target_line = f"المستهدفون: {report_data.get('target', '')}" if report_data.get('target') else ""
-    place_line = f"مكان التنفيذ: {report_data.get('place', '')}" if report_data.get('place') else ""
-    count_line = f"عدد الحضور: {report_data.get('count', '')}" if report_data.get('count') else ""
-    
+    return {
+        "subject_line": f"المادة: {report_data.get('subject', '')}" if report_data.get('subject') else "",
+        "lesson_line": f"الدرس: {report_data.get('lesson', '')}" if report_data.get('lesson') else "",
+        "grade_line": f"الصف: {report_data.get('grade', '')}" if report_data.get('grade') else "",
+        "target_line": f"المستهدفون: {report_data.get('target', '')}" if report_data.get('target') else "",
+        "place_line": f"مكان التنفيذ: {report_data.get('place', '')}" if report_data.get('place') else "",
+        "count_line": f"عدد الحضور: {report_data.get('count', '')}" if report_data.get('count') else ""
+    }
+
+def build_ai_prompt(report_name: str, subcategory_name: str, criterion_name: str, report_data: dict = None):
+    """بناء البرومت المناسب للذكاء الاصطناعي"""
     return AI_PROMPT_TEMPLATE.format(
         report_name=report_name,
         subcategory_name=subcategory_name,
         criterion_name=criterion_name,
-        subject_line=subject_line,
-        lesson_line=lesson_line,
-        grade_line=grade_line,
-        target_line=target_line,
-        place_line=place_line,
-        count_line=count_line
+        **report_data_lines(report_data)
     )
 
+def build_report_context(report_name: str, subcategory_name: str, criterion_name: str, report_data: dict = None):
+    """وصف مختصر للتقرير يُستخدم في برومبت استكمال الحقول الناقصة"""
+    lines = [
+        f'التقرير: "{report_name}" ضمن التصنيف الفرعي "{subcategory_name}" والمعيار "{criterion_name}"'
+    ]
+    lines += [line for line in report_data_lines(report_data).values() if line]
+    return "\n".join(lines)
+
+# ---------- تخزين المحتوى المولد ----------
+report_cache = ReportCache(
+    max_entries=int(os.getenv("REPORT_CACHE_SIZE", "2000")),
+    ttl_seconds=float(os.getenv("REPORT_CACHE_TTL", "86400")),
+    persistent=os.getenv("REPORT_CACHE_PERSIST", "0") == "1",
+)
+
 # ============================================================================
 # دوال مساعدة للبحث في البيانات
 # ============================================================================
+# تأخذ نسخة الكتالوج التي التقطها الطلب مرة واحدة، فلا تتغير بين بحث وآخر
 
-def get_criterion_by_id(criterion_id: str):
+def get_criterion_by_id(catalog, criterion_id: str):
     """الحصول على معيار تربوي حسب المعرف"""
-    for criterion in CRITERIA:
-        if criterion["id"] == criterion_id:
-            return criterion
-    return None
+    return catalog.criteria_by_id.get(criterion_id)
 
-def get_subcategory_by_id(subcategory_id: str):
+def get_subcategory_by_id(catalog, subcategory_id: str):
     """الحصول على تصنيف فرعي حسب المعرف"""
-    for subcategory in SUBCATEGORIES:
-        if subcategory["id"] == subcategory_id:
-            return subcategory
-    return None
+    return catalog.subcategories_by_id.get(subcategory_id)
 
-def get_report_by_id(report_id: str):
+def get_report_by_id(catalog, report_id: str):
     """الحصول على تقرير حسب المعرف"""
-    for report in REPORTS:
-        if report["id"] == report_id:
-            return report
-    return None
+    return catalog.reports_by_id.get(report_id)
 
-def get_subcategories_by_criterion(criterion_id: str):
+def get_subcategories_by_criterion(catalog, criterion_id: str):
     """الحصول على جميع التصنيفات الفرعية لمعيار معين"""
-    return [s for s in SUBCATEGORIES if s["criterion_id"] == criterion_id]
+    return catalog.subcategories_by_criterion.get(criterion_id, ())
 
-def get_reports_by_subcategory(subcategory_id: str):
+def get_reports_by_subcategory(catalog, subcategory_id: str):
     """الحصول على جميع التقارير لتصنيف فرعي معين"""
-    return [r for r in REPORTS if r["subcategory_id"] == subcategory_id]
+    return catalog.reports_by_subcategory.get(subcategory_id, ())
+
+# ---------- الاستجابات المحسوبة مسبقاً ----------
+CATALOG_CACHE_CONTROL = f"public, max-age={int(os.getenv('CATALOG_MAX_AGE', '300'))}"
+
+def build_full_structure(catalog):
+    """بناء الهيكل الكامل (معايير + تصنيفات فرعية + تقارير)"""
+    result = []
+    for criterion in catalog.criteria:
+        criterion_data = criterion._asdict()
+        criterion_data["subcategories"] = []
+        
+        for subcategory in catalog.subcategories_by_criterion.get(criterion.id, ()):
+            subcategory_data = subcategory._asdict()
+            subcategory_data["reports"] = [
+                r._asdict() for r in catalog.reports_by_subcategory.get(subcategory.id, ())
+            ]
+            criterion_data["subcategories"].append(subcategory_data)
+        
+        result.append(criterion_data)
+    
+    return {"structure": result}
+
+def report_details(catalog, report):
+    subcategory = catalog.subcategories_by_id.get(report.subcategory_id)
+    criterion = None
+    if subcategory:
+        criterion = catalog.criteria_by_id.get(subcategory.criterion_id)
+    
+    return {
+        "report": report._asdict(),
+        "subcategory": subcategory._asdict() if subcategory else None,
+        "criterion": criterion._asdict() if criterion else None
+    }
+
+def build_catalog_responses(catalog):
+    """ترميز وضغط جميع استجابات البيانات الثابتة مرة واحدة"""
+    def pre(payload):
+        return PrecomputedResponse(payload, CATALOG_CACHE_CONTROL)
+
+    responses = {
+        "criteria": pre({"criteria": [c._asdict() for c in catalog.criteria]}),
+        "full_structure": pre(build_full_structure(catalog)),
+        "criterion": {c.id: pre(c._asdict()) for c in catalog.criteria},
+        "criterion_subcategories": {
+            c.id: pre({
+                "criterion": c._asdict(),
+                "subcategories": [
+                    s._asdict() for s in catalog.subcategories_by_criterion.get(c.id, ())
+                ]
+            })
+            for c in catalog.criteria
+        },
+        "subcategory": {s.id: pre(s._asdict()) for s in catalog.subcategories},
+        "subcategory_reports": {
+            s.id: pre({
+                "subcategory": s._asdict(),
+                "reports": [r._asdict() for r in catalog.reports_by_subcategory.get(s.id, ())]
+            })
+            for s in catalog.subcategories
+        },
+        "report": {r.id: pre(report_details(catalog, r)) for r in catalog.reports},
+    }
+    for name, values in catalog.lists.items():
+        responses[name] = pre(values)
+    return responses
+
+class CatalogState:
+    """
+    نسخة الكتالوج مع كل ما يُشتق منها. تُبنى كاملة خارج مسار الطلبات ثم
+    تُستبدل بإسناد واحد، فلا يرى أي طلب خليطاً من نسختين.
+    """
+
+    __slots__ = ("catalog", "source_mtime", "loaded_at", "responses", "search_index", "trigram_index")
+
+    def __init__(self, catalog, source_mtime):
+        self.catalog = catalog
+        self.source_mtime = source_mtime
+        self.loaded_at = datetime.utcnow().isoformat()
+        self.responses = build_catalog_responses(catalog)
+        self.search_index = SearchIndex(catalog.reports, catalog.subcategories, catalog.criteria)
+        self.trigram_index = TrigramIndex(catalog.reports)
+
+def load_catalog_state():
+    source_mtime = os.stat(CATALOG_PATH).st_mtime_ns
+    return CatalogState(load_catalog(CATALOG_PATH), source_mtime)
+
+# ---------- بيانات المعايير والتقارير ----------
+# تُحمَّل من catalog.json (أو CATALOG_PATH) ويُتحقق من المعرفات والارتباطات قبل استخدامها
+CATALOG_WATCH_INTERVAL = float(os.getenv("CATALOG_WATCH_INTERVAL", "10"))
+catalog_state = load_catalog_state()
+catalog_reload_lock = threading.Lock()
+catalog_watch_stop = threading.Event()
+catalog_failed_mtime = None
+
+def reload_catalog():
+    """تحميل نسخة جديدة والتحقق منها ثم استبدال النسخة الحالية دفعة واحدة"""
+    global catalog_state
+    with catalog_reload_lock:
+        catalog_state = load_catalog_state()
+        return catalog_state
+
+def watch_catalog():
+    # كل عامل يراقب الملف بنفسه حتى تصل النسخة الجديدة إلى جميع عمال gunicorn
+    global catalog_failed_mtime
+    while not catalog_watch_stop.wait(CATALOG_WATCH_INTERVAL):
+        mtime = None
+        try:
+            mtime = os.stat(CATALOG_PATH).st_mtime_ns
+            if mtime in (catalog_state.source_mtime, catalog_failed_mtime):
+                continue
+            reload_catalog()
+        except Exception:
+            # ملف غير صالح: تستمر النسخة الحالية ولا يُعاد المحاولة حتى يتغير الملف
+            logger.exception("Catalog reload failed")
+            catalog_failed_mtime = mtime
 
 # ============================================================================
 # المسارات (Routes)
@@ -1296,6 +548,11 @@ def get_reports_by_subcategory(subcategory_id: str):
 def root():
     return {"status": "running", "message": "Teacher Reports API"}
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
 @app.get("/health")
 def health(_: int = Depends(activation_required)):
     return {"status": "ok"}
@@ -1303,24 +560,24 @@ def health(_: int = Depends(activation_required)):
 # ---------- مسارات الاشتراك ----------
 @app.get("/subscription/status")
 def subscription_status(code_id: int = Depends(activation_required)):
-    conn = get_connection()
-    cur = conn.cursor()
-
-    cur.execute("""
-        SELECT
-            expires_at,
-            usage_limit,
-            usage_count
-        FROM activation_codes
-        WHERE id = ?
-    """, (code_id,))
-    row = cur.fetchone()
-    conn.close()
+    with connection() as conn:
+        cur = conn.cursor()
+
+        cur.execute("""
+            SELECT
+                expires_at,
+                usage_limit,
+                usage_count
+            FROM activation_codes
+            WHERE id = ?
+        """, (code_id,))
+        row = cur.fetchone()
 
     if not row:
         raise HTTPException(status_code=404, detail="Subscription not found")
 
     expires_at, usage_limit, usage_count = row
+    usage_count += activation_cache.pending_for(code_id)
     now = datetime.utcnow()
 
     expired = False
@@ -1342,226 +599,465 @@ def subscription_status(code_id: int = Depends(activation_required)):
 
 # ---------- المسار الرئيسي للذكاء الاصطناعي ----------
 @app.post("/ask")
-def ask(
+async def ask(
     req: Req,
-    code_id: int = Depends(activation_required)
+    code: str = Depends(activation_code)
 ):
-    conn = get_connection()
-    cur = conn.cursor()
+    code_id, slot_id = await admit_generation(code)
+    try:
+        answer = await generate_text(req.prompt, code_id)
+    finally:
+        await release_generation(slot_id)
 
-    cur.execute("""
-        UPDATE activation_codes
-        SET usage_count = usage_count + 1,
-            last_used_at = ?
-        WHERE id = ?
-    """, (datetime.utcnow().isoformat(), code_id))
-
-    conn.commit()
-    conn.close()
-
-    genai.configure(api_key=get_api_key())
-    model = genai.GenerativeModel("models/gemini-2.5-flash-lite")
-    response = model.generate_content(req.prompt)
-
-    return {"answer": response.text}
+    return {"answer": answer}
 
 # ---------- مسارات البيانات الجديدة ----------
 
+def catalog_response(group: str, item_id: str = None, not_found: str = None):
+    responses = catalog_state.responses[group]
+    if item_id is None:
+        return responses
+    response = responses.get(item_id)
+    if not response:
+        raise HTTPException(status_code=404, detail=not_found)
+    return response
+
 @app.get("/api/criteria")
-def get_all_criteria():
+async def get_all_criteria(request: Request):
     """جلب جميع المعايير التربوية"""
-    return {"criteria": CRITERIA}
+    return catalog_response("criteria").respond(request)
 
 @app.get("/api/criteria/{criterion_id}")
-def get_criterion(criterion_id: str):
+async def get_criterion(criterion_id: str, request: Request):
     """جلب معيار تربوي محدد"""
-    criterion = get_criterion_by_id(criterion_id)
-    if not criterion:
-        raise HTTPException(status_code=404, detail="Criterion not found")
-    return criterion
+    return catalog_response("criterion", criterion_id, "Criterion not found").respond(request)
 
 @app.get("/api/criteria/{criterion_id}/subcategories")
-def get_subcategories(criterion_id: str):
+async def get_subcategories(criterion_id: str, request: Request):
     """جلب جميع التصنيفات الفرعية لمعيار معين"""
-    criterion = get_criterion_by_id(criterion_id)
-    if not criterion:
-        raise HTTPException(status_code=404, detail="Criterion not found")
-    
-    subcategories = get_subcategories_by_criterion(criterion_id)
-    return {
-        "criterion": criterion,
-        "subcategories": subcategories
-    }
+    return catalog_response(
+        "criterion_subcategories", criterion_id, "Criterion not found"
+    ).respond(request)
 
 @app.get("/api/subcategories/{subcategory_id}")
-def get_subcategory(subcategory_id: str):
+async def get_subcategory(subcategory_id: str, request: Request):
     """جلب تصنيف فرعي محدد"""
-    subcategory = get_subcategory_by_id(subcategory_id)
-    if not subcategory:
-        raise HTTPException(status_code=404, detail="Subcategory not found")
-    return subcategory
+    return catalog_response("subcategory", subcategory_id, "Subcategory not found").respond(request)
 
 @app.get("/api/subcategories/{subcategory_id}/reports")
-def get_reports(subcategory_id: str):
+async def get_reports(subcategory_id: str, request: Request):
     """جلب جميع التقارير لتصنيف فرعي معين"""
-    subcategory = get_subcategory_by_id(subcategory_id)
-    if not subcategory:
-        raise HTTPException(status_code=404, detail="Subcategory not found")
-    
-    reports = get_reports_by_subcategory(subcategory_id)
-    return {
-        "subcategory": subcategory,
-        "reports": reports
-    }
+    return catalog_response(
+        "subcategory_reports", subcategory_id, "Subcategory not found"
+    ).respond(request)
 
 @app.get("/api/reports/{report_id}")
-def get_report(report_id: str):
+async def get_report(report_id: str, request: Request):
     """جلب تقرير محدد"""
-    report = get_report_by_id(report_id)
-    if not report:
-        raise HTTPException(status_code=404, detail="Report not found")
-    
-    subcategory = get_subcategory_by_id(report["subcategory_id"])
-    criterion = None
-    if subcategory:
-        criterion = get_criterion_by_id(subcategory["criterion_id"])
-    
-    return {
-        "report": report,
-        "subcategory": subcategory,
-        "criterion": criterion
-    }
+    return catalog_response("report", report_id, "Report not found").respond(request)
 
 @app.get("/api/full-structure")
-def get_full_structure():
+async def get_full_structure(request: Request):
     """جلب الهيكل الكامل (معايير + تصنيفات فرعية + تقارير)"""
-    result = []
-    for criterion in CRITERIA:
-        criterion_data = criterion.copy()
-        subcategories = get_subcategories_by_criterion(criterion["id"])
-        criterion_data["subcategories"] = []
-        
-        for subcategory in subcategories:
-            subcategory_data = subcategory.copy()
-            reports = get_reports_by_subcategory(subcategory["id"])
-            subcategory_data["reports"] = reports
-            criterion_data["subcategories"].append(subcategory_data)
-        
-        result.append(criterion_data)
-    
-    return {"structure": result}
+    return catalog_response("full_structure").respond(request)
+
+@app.get("/api/catalog/version")
+async def get_catalog_version():
+    """إصدار الكتالوج المستخدم حالياً"""
+    state = catalog_state
+    return {
+        "version": state.catalog.version,
+        "loaded_at": state.loaded_at,
+        "criteria": len(state.catalog.criteria),
+        "subcategories": len(state.catalog.subcategories),
+        "reports": len(state.catalog.reports)
+    }
 
 # ---------- مسارات البيانات الإضافية ----------
 @app.get("/api/education-offices")
-def get_education_offices():
+async def get_education_offices(request: Request):
     """جلب جميع إدارات التعليم"""
-    return EDUCATION_OFFICES
+    return catalog_response("education_offices").respond(request)
 
 @app.get("/api/school-subjects")
-def get_school_subjects():
+async def get_school_subjects(request: Request):
     """جلب جميع المواد الدراسية"""
-    return SCHOOL_SUBJECTS
+    return catalog_response("school_subjects").respond(request)
 
 @app.get("/api/school-grades")
-def get_school_grades():
+async def get_school_grades(request: Request):
     """جلب جميع الصفوف الدراسية"""
-    return SCHOOL_GRADES
+    return catalog_response("school_grades").respond(request)
 
 @app.get("/api/target-audiences")
-def get_target_audiences():
+async def get_target_audiences(request: Request):
     """جلب جميع الفئات المستهدفة"""
-    return TARGET_AUDIENCES
+    return catalog_response("target_audiences").respond(request)
 
 @app.get("/api/implementation-places")
-def get_implementation_places():
+async def get_implementation_places(request: Request):
     """جلب جميع أماكن التنفيذ"""
-    return IMPLEMENTATION_PLACES
+    return catalog_response("implementation_places").respond(request)
 
 @app.get("/api/educational-tools")
-def get_educational_tools():
+async def get_educational_tools(request: Request):
     """جلب جميع الأدوات التعليمية"""
-    return EDUCATIONAL_TOOLS
+    return catalog_response("educational_tools").respond(request)
 
-@app.get("/api/search-reports")
-def search_reports(q: str = Query(..., min_length=2)):
-    """البحث في التقارير"""
-    results = []
-    q_lower = q.lower()
-    
-    for report in REPORTS:
-        if q_lower in report["name"].lower():
-            subcategory = get_subcategory_by_id(report["subcategory_id"])
-            criterion = None
-            if subcategory:
-                criterion = get_criterion_by_id(subcategory["criterion_id"])
-            
-            results.append({
-                "report": report,
-                "subcategory_name": subcategory["name"] if subcategory else None,
-                "criterion_name": criterion["name"] if criterion else None
-            })
+def search_result(catalog, report):
+    subcategory = get_subcategory_by_id(catalog, report.subcategory_id)
+    criterion = None
+    if subcategory:
+        criterion = get_criterion_by_id(catalog, subcategory.criterion_id)
     
-    return {"results": results[:20]}
+    return {
+        "report": report._asdict(),
+        "subcategory_name": subcategory.name if subcategory else None,
+        "criterion_name": criterion.name if criterion else None
+    }
 
-# ---------- مسار توليد محتوى التقرير ----------
-@app.post("/api/generate-report-content")
-def generate_report_content(
-    req: GenerateReportRequest,
-    code_id: int = Depends(activation_required)
+@app.get("/api/search-reports")
+async def search_reports(
+    q: str = Query(..., min_length=2),
+    mode: str = Query("exact", pattern="^(exact|fuzzy)$"),
+    min_score: float = Query(0.4, ge=0, le=1),
+    limit: int = Query(20, ge=1, le=100)
 ):
     """
-    توليد محتوى التقرير باستخدام الذكاء الاصطناعي
+    البحث في التقارير مع توحيد أشكال الحروف العربية وترتيب النتائج حسب الصلة.
+    النمط fuzzy يتسامح مع الأخطاء الإملائية ويعيد درجة التشابه لكل نتيجة.
+    """
+    state = catalog_state
+    if mode == "fuzzy":
+        results = []
+        for position, score in state.trigram_index.search(q, min_score, limit):
+            result = search_result(state.catalog, state.trigram_index.reports[position])
+            result["score"] = score
+            results.append(result)
+        return {"results": results}
+
+    positions = state.search_index.search(q, limit)
+    return {"results": [search_result(state.catalog, state.search_index.reports[p]) for p in positions]}
+
+# ---------- مسار توليد محتوى التقرير ----------
+def resolve_report_request(req: GenerateReportRequest, catalog=None):
+    """
+    التحقق من تسلسل المعيار والتصنيف والتقرير وبناء البرومبت من نسخة واحدة
+    من الكتالوج، ويعيد إصدارها مع النتيجة لأنه جزء من مفتاح التخزين المؤقت.
     """
-    report = get_report_by_id(req.report_id)
+    catalog = catalog or catalog_state.catalog
+    report = get_report_by_id(catalog, req.report_id)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
-    subcategory = get_subcategory_by_id(req.subcategory_id)
+    subcategory = get_subcategory_by_id(catalog, req.subcategory_id)
     if not subcategory:
         raise HTTPException(status_code=404, detail="Subcategory not found")
     
-    if report["subcategory_id"] != req.subcategory_id:
+    if report.subcategory_id != req.subcategory_id:
         raise HTTPException(status_code=400, detail="Report does not belong to this subcategory")
     
-    criterion = get_criterion_by_id(req.criterion_id)
+    criterion = get_criterion_by_id(catalog, req.criterion_id)
     if not criterion:
         raise HTTPException(status_code=404, detail="Criterion not found")
     
-    if subcategory["criterion_id"] != req.criterion_id:
+    if subcategory.criterion_id != req.criterion_id:
         raise HTTPException(status_code=400, detail="Subcategory does not belong to this criterion")
     
     prompt = build_ai_prompt(
-        report_name=report["name"],
-        subcategory_name=subcategory["name"],
-        criterion_name=criterion["name"],
+        report_name=report.name,
+        subcategory_name=subcategory.name,
+        criterion_name=criterion.name,
         report_data=req.report_data
     )
-    
-    conn = get_connection()
-    cur = conn.cursor()
-    
-    cur.execute("""
-        UPDATE activation_codes
-        SET usage_count = usage_count + 1,
-            last_used_at = ?
-        WHERE id = ?
-    """, (datetime.utcnow().isoformat(), code_id))
-    
-    conn.commit()
-    conn.close()
-    
-    genai.configure(api_key=get_api_key())
-    model = genai.GenerativeModel("models/gemini-2.5-flash-lite")
-    response = model.generate_content(prompt)
-    
+    return report, subcategory, criterion, prompt, catalog.version
+
+def report_content_response(req, report, subcategory, criterion, entry, cached):
+    # نتائج مخزنة قبل إضافة الحقول المنظمة تُحلَّل عند قراءتها
+    fields = entry.get("fields") or parse_fields(entry["content"])
     return {
-        "content": response.text,
+        "content": entry["content"],
+        "fields": fields,
+        "missing_fields": missing_fields(fields),
         "report_id": req.report_id,
-        "report_name": report["name"],
-        "subcategory_name": subcategory["name"],
-        "criterion_name": criterion["name"],
+        "report_name": report.name,
+        "subcategory_name": subcategory.name,
+        "criterion_name": criterion.name,
+        "generated_at": entry["generated_at"],
+        "cached": cached
+    }
+
+async def cached_report_content(req: GenerateReportRequest, catalog_version: str):
+    # إصدار الكتالوج جزء من المفتاح لأن تعديل اسم تقرير يغيّر البرومبت
+    version = f"{AI_PROMPT_VERSION}:{catalog_version}"
+    key = cache_key(req.report_id, req.report_data, version)
+    if req.fresh:
+        return key, None
+    return key, await run_in_threadpool(report_cache.get, key)
+
+async def store_report_content(key: str, content: str, fields: dict) -> dict:
+    entry = {
+        "content": content,
+        "fields": fields,
         "generated_at": datetime.utcnow().isoformat()
     }
+    # التقرير الناقص لا يُخزَّن حتى لا يتكرر لكل من يطلبه لاحقاً
+    if not missing_fields(fields):
+        await run_in_threadpool(report_cache.set, key, entry)
+    return entry
+
+# ---------- استكمال الحقول الناقصة ----------
+REPORT_REPAIR_ATTEMPTS = int(os.getenv("REPORT_REPAIR_ATTEMPTS", "1"))
+field_repairs = {"reports": 0, "fields": 0, "unrepaired": 0}
+
+async def complete_report_fields(content: str, context: str, code_id: int = None) -> dict:
+    """
+    تحليل الحقول السبعة، وطلب الناقص منها فقط ببرومبت قصير بدل إعادة توليد
+    التقرير كاملاً وخصم استخدام جديد من المستخدم.
+    """
+    fields = parse_fields(content)
+    missing = missing_fields(fields)
+    for _ in range(REPORT_REPAIR_ATTEMPTS if missing else 0):
+        field_repairs["reports"] += 1
+        field_repairs["fields"] += len(missing)
+        try:
+            text = await generate_text(build_repair_prompt(context, fields, missing), code_id)
+        except Exception:
+            break
+        repaired = parse_fields(text)
+        fields.update({key: repaired[key] for key in missing if key in repaired})
+        missing = missing_fields(fields)
+        if not missing:
+            break
+    if missing:
+        field_repairs["unrepaired"] += 1
+    return {key: fields[key] for key in FIELD_KEYS if key in fields}
+
+async def finish_report_content(key: str, content: str, context: str, code_id: int = None) -> dict:
+    fields = await complete_report_fields(content, context, code_id)
+    if fields:
+        content = format_fields(fields)
+    return await store_report_content(key, content, fields)
+
+# الطلبات المتطابقة المتزامنة تنتظر استدعاء Gemini واحداً، ويُخصم رصيد كل طالب كالمعتاد
+report_flights = SingleFlight()
+
+async def generate_and_store(key: str, prompt: str, context: str, code_id: int = None):
+    # عند دمج الطلبات تُنسب الرموز لصاحب الطلب الذي بدأ الاستدعاء
+    content = await generate_text(prompt, code_id)
+    return await finish_report_content(key, content, context, code_id)
+
+async def generate_resolved_report(
+    req, report, subcategory, criterion, prompt, catalog_version, code_id=None
+):
+    key, cached = await cached_report_content(req, catalog_version)
+    entry = cached
+    if not cached:
+        context = build_report_context(report.name, subcategory.name, criterion.name, req.report_data)
+        if req.fresh:
+            # طلب صياغة جديدة لا يشارك نصه مع غيره ولا يأخذ نص غيره
+            entry = await generate_and_store(key, prompt, context, code_id)
+        else:
+            entry = await report_flights.do(
+                prompt, lambda: generate_and_store(key, prompt, context, code_id)
+            )
+    
+    return report_content_response(
+        req, report, subcategory, criterion, entry, cached is not None
+    )
+
+@app.post("/api/generate-report-content")
+async def generate_report_content(
+    req: GenerateReportRequest,
+    code: str = Depends(activation_code)
+):
+    """
+    توليد محتوى التقرير باستخدام الذكاء الاصطناعي
+    """
+    resolved = resolve_report_request(req)
+    
+    code_id, slot_id = await admit_generation(code)
+    try:
+        return await generate_resolved_report(req, *resolved, code_id=code_id)
+    finally:
+        await release_generation(slot_id)
+
+def sse_event(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+class GenerationStream(StreamingResponse):
+    """
+    بث SSE يحرر مقعد التزامن بعد انتهاء الاستجابة كلها، سواء اكتمل البث أو
+    انقطع العميل أو لم يبدأ البث أصلاً (لا يكفي finally داخل المولّد لذلك).
+    """
+
+    def __init__(self, content, slot_id):
+        super().__init__(
+            content,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+        self.slot_id = slot_id
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await release_generation(self.slot_id)
+
+@app.post("/api/generate-report-content/stream")
+async def generate_report_content_stream(
+    req: GenerateReportRequest,
+    code: str = Depends(activation_code)
+):
+    """
+    توليد محتوى التقرير مع إرسال النص تدريجياً عبر Server-Sent Events.
+    أحداث delta تحمل أجزاء النص، والحدث الأخير done يحمل نفس استجابة المسار العادي.
+    """
+    report, subcategory, criterion, prompt, catalog_version = resolve_report_request(req)
+
+    code_id, slot_id = await admit_generation(code)
+
+    async def events():
+        key, cached = await cached_report_content(req, catalog_version)
+        if cached:
+            yield sse_event("delta", {"text": cached["content"]})
+            yield sse_event("done", report_content_response(
+                req, report, subcategory, criterion, cached, True
+            ))
+            return
+
+        parts = []
+        try:
+            async for text in stream_text(prompt, code_id):
+                parts.append(text)
+                yield sse_event("delta", {"text": text})
+        except Exception:
+            yield sse_event("error", {"detail": "Generation failed"})
+            return
+
+        # الحقول الناقصة تُستكمل بعد البث ويحمل done النص الموحّد
+        context = build_report_context(report.name, subcategory.name, criterion.name, req.report_data)
+        entry = await finish_report_content(key, "".join(parts), context, code_id)
+        yield sse_event("done", report_content_response(
+            req, report, subcategory, criterion, entry, False
+        ))
+
+    # مقعد التزامن يبقى محجوزاً حتى ينتهي البث أو ينقطع العميل
+    return GenerationStream(events(), slot_id)
+
+@app.post("/api/generate-report-content/batch")
+async def generate_report_content_batch(
+    req: GenerateBatchRequest,
+    code: str = Depends(activation_code)
+):
+    """
+    توليد عدة تقارير دفعة واحدة. يُتحقق من جميع العناصر ويُخصم رصيدها معاً
+    قبل البدء، ثم تُولَّد بالتوازي على مفاتيح Gemini وتُرسل نتيجة كل عنصر
+    كحدث item فور اكتماله، ويختم الحدث done بملخص الدفعة.
+    """
+    if not req.items:
+        raise HTTPException(status_code=400, detail="Batch is empty")
+    if len(req.items) > BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Batch is limited to {BATCH_MAX_ITEMS} items")
+
+    # كل عناصر الدفعة تُحل من نفس نسخة الكتالوج
+    catalog = catalog_state.catalog
+    resolved = []
+    for index, item in enumerate(req.items):
+        try:
+            resolved.append(resolve_report_request(item, catalog))
+        except HTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail=f"Item {index}: {e.detail}")
+
+    # الدفعة تشغل مقعد تزامن واحداً لا يعمل تحته أكثر من حد التزامن من عناصرها،
+    # ويُسحب من حد المعدل رمز لكل عنصر عند بدئه: ما يتجاوز سعة الحد ينتظر امتلاءه
+    concurrency = await run_in_threadpool(rate_limiter.concurrency, code)
+    code_id, slot_id = await admit_generation(code, len(req.items), rate_cost=1)
+    running = asyncio.Semaphore(concurrency)
+
+    async def generate_item(index):
+        try:
+            async with running:
+                # رمز العنصر الأول سُحب عند قبول الدفعة
+                if index:
+                    await wait_for_rate(code)
+                result = await generate_resolved_report(
+                    req.items[index], *resolved[index], code_id=code_id
+                )
+            return {"index": index, "result": result}
+        except HTTPException as e:
+            return {"index": index, "error": e.detail}
+        except Exception:
+            return {"index": index, "error": "Generation failed"}
+
+    async def events():
+        tasks = [asyncio.ensure_future(generate_item(i)) for i in range(len(req.items))]
+        failed = 0
+        try:
+            for finished in asyncio.as_completed(tasks):
+                outcome = await finished
+                failed += "error" in outcome
+                yield sse_event("item", outcome)
+        finally:
+            # انقطاع الاتصال يلغي ما تبقى من عناصر بدل تركها تعمل بلا مستلم
+            for task in tasks:
+                task.cancel()
+
+        yield sse_event("done", {
+            "total": len(tasks),
+            "succeeded": len(tasks) - failed,
+            "failed": failed
+        })
+
+    return GenerationStream(events(), slot_id)
+
+# ---------- مهام التوليد في الخلفية ----------
+async def run_job(kind: str, payload: dict, code_id: int):
+    if kind != "report_content":
+        raise JobFailed(f"Unknown job kind: {kind}")
+    req = GenerateReportRequest(**payload)
+    try:
+        # الكتالوج قد يتغير بين الإرسال والتنفيذ فيُعاد التحقق
+        resolved = resolve_report_request(req)
+    except HTTPException as e:
+        raise JobFailed(e.detail)
+    return await generate_resolved_report(req, *resolved, code_id=code_id)
+
+job_queue = JobQueue(
+    run_job,
+    concurrency=int(os.getenv("JOB_CONCURRENCY", "8")),
+    max_attempts=int(os.getenv("JOB_MAX_ATTEMPTS", "3")),
+    retention_seconds=float(os.getenv("JOB_RETENTION_SECONDS", str(24 * 3600))),
+    lease_seconds=float(os.getenv("JOB_LEASE_SECONDS", "300")),
+    poll_interval=float(os.getenv("JOB_POLL_INTERVAL", "1")),
+)
+
+@app.post("/api/jobs/report-content", status_code=202)
+async def submit_report_content_job(
+    req: GenerateReportRequest,
+    code: str = Depends(activation_code)
+):
+    """
+    إرسال طلب توليد كمهمة في الخلفية. يُخصم الرصيد عند الإرسال وتبقى النتيجة
+    محفوظة حتى يُسترجعها العميل من GET /api/jobs/{job_id}.
+    """
+    resolve_report_request(req)
+
+    # المهمة لا تشغل اتصالاً، فيكفي حد المعدل وتضبط الخلفيةُ التزامن بـ JOB_CONCURRENCY
+    code_id, _ = await admit_generation(code, slot=False)
+
+    job_id = await run_in_threadpool(
+        job_queue.submit, code_id, "report_content", req.model_dump()
+    )
+    return {"job_id": job_id, "status": "queued"}
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, code_id: int = Depends(activation_owner)):
+    job = await run_in_threadpool(job_queue.get, job_id, code_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
 # ---------- Admin APIs ----------
 @app.post("/admin/generate", dependencies=[Depends(admin_auth)])
@@ -1581,35 +1077,111 @@ def admin_generate(req: GenerateKeyReq):
     return {
         "code": create_key(
             expires_at.isoformat(),
-            plan["usage"]
+            plan["usage"],
+            req.plan
         ),
         "expires_at": expires_at.isoformat(),
         "usage_limit": plan["usage"]
     }
 
-@app.get("/admin/codes", dependencies=[Depends(admin_auth)])
-def admin_codes():
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        SELECT
-            id,
-            code,
-            is_active,
-            expires_at,
-            usage_limit,
-            usage_count
-        FROM activation_codes
-    """)
-    rows = cur.fetchall()
-    conn.close()
+# عمود الترتيب -> التعبير المفهرس في activation_codes (الترتيب الثانوي دائماً id)
+CODE_SORTS = {
+    "id": "id",
+    "expires_at": "COALESCE(expires_at, '')",
+    "usage_count": "usage_count",
+}
+CODE_STATUSES = ("all", "active", "expired", "disabled")
+
+def encode_cursor(value, row_id: int) -> str:
+    raw = json.dumps([value, row_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def decode_cursor(cursor: str):
+    try:
+        value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return value, int(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def prefix_upper_bound(prefix: str) -> str:
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
 
+@app.get("/admin/codes", dependencies=[Depends(admin_auth)])
+def admin_codes(
+    status: str = Query("all", pattern=f"^({'|'.join(CODE_STATUSES)})$"),
+    plan: Optional[str] = None,
+    q: Optional[str] = Query(None, max_length=32),
+    sort: str = Query("id", pattern=f"^({'|'.join(CODE_SORTS)})$"),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None
+):
+    """
+    صفحة من الأكواد مع التصفية والترتيب. الانتقال للصفحة التالية بـ next_cursor
+    (keyset) فلا يزداد زمن الاستعلام مع عمق الصفحة.
+    """
+    activation_cache.flush()
     now = datetime.utcnow()
+    now_iso = now.isoformat()
+    column = CODE_SORTS[sort]
+    where, params = [], []
+
+    # expires_at نص ISO بنفس الصيغة فتصح المقارنة النصية
+    exhausted = "(usage_limit IS NOT NULL AND usage_count >= usage_limit)"
+    if status == "active":
+        where.append(f"is_active = 1 AND (expires_at IS NULL OR expires_at >= ?) AND NOT {exhausted}")
+        params.append(now_iso)
+    elif status == "expired":
+        where.append(f"is_active = 1 AND (expires_at < ? OR {exhausted})")
+        params.append(now_iso)
+    elif status == "disabled":
+        where.append("is_active = 0")
+    if plan:
+        where.append("plan = ?")
+        params.append(plan)
+    if q:
+        # نطاق على فهرس code الفريد بدل LIKE
+        prefix = q.strip().upper()
+        if prefix:
+            where.append("code >= ? AND code < ?")
+            params += [prefix, prefix_upper_bound(prefix)]
+    if cursor:
+        value, row_id = decode_cursor(cursor)
+        # بدل (column, id) < (?, ?) لأن SQLite لا يبحث بمقارنة الصفوف في فهرس التعبير
+        op = "<" if order == "desc" else ">"
+        where.append(f"{column} {op}= ? AND ({column} {op} ? OR id {op} ?)")
+        params += [value, value, row_id]
+
+    direction = order.upper()
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute(f"""
+            SELECT
+                id,
+                code,
+                is_active,
+                expires_at,
+                usage_limit,
+                usage_count,
+                plan,
+                {column}
+            FROM activation_codes
+            {"WHERE " + " AND ".join(where) if where else ""}
+            ORDER BY {column} {direction}, id {direction}
+            LIMIT ?
+        """, (*params, limit + 1))
+        rows = cur.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][7], rows[-1][0])
+
     result = []
 
     for r in rows:
         expired = False
-        if r[3] and datetime.fromisoformat(r[3]) < now:
+        if r[3] and r[3] < now_iso:
             expired = True
         if r[4] is not None and r[5] >= r[4]:
             expired = True
@@ -1621,33 +1193,77 @@ def admin_codes():
             "expires_at": r[3],
             "usage_limit": r[4],
             "usage_count": r[5],
+            "plan": r[6],
             "expired": expired
         })
 
-    return result
+    return {"items": result, "next_cursor": next_cursor}
 
 @app.put("/admin/code/{code_id}/toggle", dependencies=[Depends(admin_auth)])
 def admin_toggle(code_id: int):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("""
-        UPDATE activation_codes
-        SET is_active = CASE WHEN is_active=1 THEN 0 ELSE 1 END
-        WHERE id = ?
-    """, (code_id,))
-    conn.commit()
-    conn.close()
-    return {"status": "ok"}
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            UPDATE activation_codes
+            SET is_active = CASE WHEN is_active=1 THEN 0 ELSE 1 END
+            WHERE id = ?
+            RETURNING is_active
+        """, (code_id,))
+        row = cur.fetchone()
+    activation_cache.invalidate(code_id)
+    if not row:
+        raise HTTPException(status_code=404, detail="Code not found")
+    return {"status": "ok", "active": bool(row[0])}
 
 @app.delete("/admin/code/{code_id}", dependencies=[Depends(admin_auth)])
 def admin_delete(code_id: int):
-    conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM activation_codes WHERE id=?", (code_id,))
-    conn.commit()
-    conn.close()
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM activation_codes WHERE id=?", (code_id,))
+    activation_cache.invalidate(code_id)
     return {"status": "deleted"}
 
+@app.post("/admin/catalog/reload", dependencies=[Depends(admin_auth)])
+async def admin_catalog_reload():
+    try:
+        state = await run_in_threadpool(reload_catalog)
+    except (OSError, CatalogError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Catalog not reloaded: {e}")
+    return {"status": "reloaded", "version": state.catalog.version, "loaded_at": state.loaded_at}
+
+@app.get("/admin/keys", dependencies=[Depends(admin_auth)])
+def admin_keys():
+    return {
+        "keys": gemini_pool.scheduler.stats(),
+        "fallback_keys": fallback_pool.scheduler.stats() if fallback_pool else None,
+        "hedging": {"enabled": GEMINI_HEDGE, **hedge_policy.stats()}
+    }
+
+@app.get("/admin/cache", dependencies=[Depends(admin_auth)])
+def admin_cache():
+    return {
+        **report_cache.stats(),
+        "single_flight": report_flights.stats(),
+        "field_repairs": dict(field_repairs)
+    }
+
+@app.get("/admin/usage", dependencies=[Depends(admin_auth)])
+def admin_usage(
+    group_by: str = Query("code", pattern=f"^({'|'.join(USAGE_GROUPS)})$"),
+    since: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    until: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    limit: int = Query(100, ge=1, le=1000)
+):
+    """استهلاك رموز Gemini مجمّعاً حسب الكود أو الخطة أو المفتاح أو اليوم (UTC)"""
+    return {
+        "group_by": group_by,
+        "rows": usage_log.aggregate(group_by, since, until, limit)
+    }
+
+@app.get("/admin/jobs", dependencies=[Depends(admin_auth)])
+def admin_jobs():
+    return job_queue.stats()
+
 # ---------- Admin Panel ----------
 @app.get("/admin/panel", response_class=HTMLResponse)
 def admin_panel():
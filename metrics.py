@@ -0,0 +1,89 @@
+# metrics.py
+# مقاييس Prometheus. مع gunicorn يجب ضبط PROMETHEUS_MULTIPROC_DIR على مجلد فارغ
+# قبل تشغيل العمال، فيكتب كل عامل قيمه في ملفات ويجمعها /metrics من أي عامل.
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+# زمن Gemini يمتد لثوانٍ، وزمن SQLite لأجزاء من الملي ثانية
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+GEMINI_BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60)
+DB_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1, 5)
+
+http_request_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency until the response starts",
+    ["method", "route", "status"],
+    buckets=HTTP_BUCKETS,
+)
+gemini_request_seconds = Histogram(
+    "gemini_request_duration_seconds",
+    "Gemini call latency per API key",
+    ["key"],
+    buckets=GEMINI_BUCKETS,
+)
+gemini_errors = Counter(
+    "gemini_errors_total",
+    "Failed Gemini calls per API key and exception type",
+    ["key", "error"],
+)
+gemini_in_flight = Gauge(
+    "gemini_in_flight",
+    "Gemini calls currently running",
+    ["key"],
+    multiprocess_mode="livesum",
+)
+generations = Counter(
+    "gemini_generations_total",
+    "Text generations requested, hedged or not",
+)
+gemini_retries = Counter(
+    "gemini_retries_total",
+    "Transient Gemini failures that were retried, by model",
+    ["model"],
+)
+hedges = Counter(
+    "gemini_hedges_total",
+    "Duplicate Gemini calls started after the hedge delay, by which call won",
+    ["winner"],
+)
+coalesced_requests = Counter(
+    "single_flight_coalesced_total",
+    "Requests that shared an identical in-flight call",
+)
+db_query_seconds = Histogram(
+    "db_query_duration_seconds",
+    "Time a pooled SQLite connection is held, per call site",
+    ["site"],
+    buckets=DB_BUCKETS,
+)
+cache_lookups = Counter(
+    "cache_lookups_total",
+    "Cache lookups by cache and result",
+    ["cache", "result"],
+)
+
+
+def render():
+    """نص المقاييس وContent-Type المناسب"""
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int):
+    """تُستدعى من child_exit في gunicorn حتى لا تبقى قيم العامل المتوقف في المقاييس الحية"""
+    if MULTIPROCESS:
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,71 @@
+# precomputed.py
+import gzip
+import hashlib
+import json
+import zlib
+
+from fastapi import Request, Response
+
+
+def _encodings(accept_encoding: str):
+    accepted = set()
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        try:
+            quality = float(params[2:]) if params.startswith("q=") else 1.0
+        except ValueError:
+            quality = 0.0
+        if quality > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+class PrecomputedResponse:
+    """استجابة JSON ثابتة تُرمَّز وتُضغط مرة واحدة وتُقدَّم كبايتات مع ETag"""
+
+    __slots__ = ("bodies", "etags", "cache_control")
+
+    def __init__(self, payload, cache_control: str):
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.bodies = {
+            None: body,
+            "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+            "deflate": zlib.compress(body, 9),
+        }
+        # ETag قوي مختلف لكل ترميز محتوى كما يتطلب HTTP
+        self.etags = {
+            None: f'"{digest}"',
+            "gzip": f'"{digest}-gz"',
+            "deflate": f'"{digest}-df"',
+        }
+        self.cache_control = cache_control
+
+    def not_modified(self, if_none_match: str) -> bool:
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return not tags.isdisjoint(self.etags.values())
+
+    def respond(self, request: Request) -> Response:
+        accepted = _encodings(request.headers.get("accept-encoding", ""))
+        encoding = next((e for e in ("gzip", "deflate") if e in accepted), None)
+        headers = {
+            "ETag": self.etags[encoding],
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+
+        if self.not_modified(request.headers.get("if-none-match", "")):
+            return Response(status_code=304, headers=headers)
+
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(
+            content=self.bodies[encoding],
+            media_type="application/json",
+            headers=headers,
+        )
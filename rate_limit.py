@@ -0,0 +1,131 @@
+# rate_limit.py
+import math
+import threading
+import time
+
+from fastapi import HTTPException
+
+from database import connection
+
+
+class CodeLimits:
+    __slots__ = ("rate", "burst", "concurrency")
+
+    def __init__(self, rate: float, burst: int, concurrency: int):
+        # rate بالطلبات في الدقيقة
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+
+
+def too_many(detail: str, retry_after: float):
+    return HTTPException(
+        status_code=429,
+        detail=detail,
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+class RateLimiter:
+    """
+    حد معدل (token bucket) وحد للتوليدات المتزامنة لكل كود تفعيل حسب خطته.
+    الحالة في قاعدة البيانات وكل فحص جملة واحدة ذرية، فالحدود مشتركة بين
+    جميع عمال gunicorn. مقاعد التزامن مؤقتة بمدة slot_ttl حتى لا يحجزها
+    للأبد عامل توقف قبل تحريرها.
+    """
+
+    def __init__(self, plans: dict, default: CodeLimits, slot_ttl: float):
+        self.limits = {
+            name: CodeLimits(plan["rate"], plan["burst"], plan["concurrency"])
+            for name, plan in plans.items()
+        }
+        self.default = default
+        self.slot_ttl = slot_ttl
+        self._plans = {}
+        self._lock = threading.Lock()
+
+    def _plan_of(self, cur, code: str):
+        # خطة الكود لا تتغير بعد إنشائه فتُحفظ في الذاكرة
+        with self._lock:
+            if code in self._plans:
+                return self._plans[code]
+        cur.execute("SELECT id, plan FROM activation_codes WHERE code = ?", (code,))
+        row = cur.fetchone()
+        if row:
+            with self._lock:
+                self._plans[code] = row
+        return row
+
+    def _take_token(self, cur, code_id: int, limits: CodeLimits, cost: int, now: float):
+        per_second = limits.rate / 60
+        cur.execute("""
+            INSERT INTO code_rate (code_id, tokens, updated_at)
+            VALUES (?, ? - ?, ?)
+            ON CONFLICT (code_id) DO UPDATE
+            SET tokens = MIN(?, tokens + (excluded.updated_at - updated_at) * ?) - ?,
+                updated_at = excluded.updated_at
+            WHERE MIN(?, tokens + (excluded.updated_at - updated_at) * ?) >= ?
+            RETURNING tokens
+        """, (
+            code_id, limits.burst, cost, now,
+            limits.burst, per_second, cost,
+            limits.burst, per_second, cost,
+        ))
+        if cur.fetchone():
+            return
+
+        cur.execute("SELECT tokens, updated_at FROM code_rate WHERE code_id = ?", (code_id,))
+        tokens, updated_at = cur.fetchone()
+        available = min(limits.burst, tokens + (now - updated_at) * per_second)
+        raise too_many("Rate limit exceeded for this activation code", (cost - available) / per_second)
+
+    def _take_slot(self, cur, code_id: int, limits: CodeLimits, now: float):
+        cur.execute("DELETE FROM code_slots WHERE code_id = ? AND expires_at <= ?", (code_id, now))
+        cur.execute("""
+            INSERT INTO code_slots (code_id, expires_at)
+            SELECT ?, ?
+            WHERE (SELECT COUNT(*) FROM code_slots WHERE code_id = ?) < ?
+            RETURNING id
+        """, (code_id, now + self.slot_ttl, code_id, limits.concurrency))
+        row = cur.fetchone()
+        if row:
+            return row[0]
+        raise too_many("Too many concurrent generations for this activation code", 5)
+
+    def admit(self, code: str, cost: int = 1, slot: bool = True):
+        """
+        يرفع 429 عند تجاوز أي من الحدين، وإلا يعيد رقم مقعد التزامن
+        (أو None) الذي يجب تحريره بـ release بعد انتهاء التوليد.
+        الكود غير الموجود يُترك لفحص التفعيل المعتاد.
+        """
+        now = time.time()
+        with connection() as conn:
+            cur = conn.cursor()
+            row = self._plan_of(cur, code)
+            if not row:
+                return None
+            code_id, plan = row
+            limits = self.limits.get(plan, self.default)
+            if cost > limits.burst:
+                # لن يمتلئ الحد لهذه الكلفة أبداً فلا فائدة من Retry-After
+                raise HTTPException(
+                    status_code=429,
+                    detail=f"This activation code allows at most {limits.burst} generations at once",
+                )
+            # المقعد أولاً: رفض حد المعدل بعده يتراجع عن المقعد مع بقية المعاملة
+            slot_id = self._take_slot(cur, code_id, limits, now) if slot else None
+            self._take_token(cur, code_id, limits, cost, now)
+        return slot_id
+
+    def concurrency(self, code: str) -> int:
+        """عدد التوليدات المتزامنة المسموح بها للكود"""
+        with connection() as conn:
+            row = self._plan_of(conn.cursor(), code)
+        plan = row[1] if row else None
+        return self.limits.get(plan, self.default).concurrency
+
+    def release(self, slot_id):
+        if slot_id is None:
+            return
+        with connection() as conn:
+            conn.execute("DELETE FROM code_slots WHERE id = ?", (slot_id,))
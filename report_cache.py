@@ -0,0 +1,129 @@
+# report_cache.py
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from database import connection
+from metrics import cache_lookups
+
+REPORT_DATA_FIELDS = ("subject", "lesson", "grade", "target", "place", "count")
+PURGE_INTERVAL = 300
+
+
+def normalize_report_data(report_data: dict) -> dict:
+    """إبقاء الحقول المؤثرة في البرومبت فقط بعد توحيد المسافات"""
+    normalized = {}
+    for field in REPORT_DATA_FIELDS:
+        value = (report_data or {}).get(field)
+        if value is None:
+            continue
+        value = " ".join(str(value).split())
+        if value:
+            normalized[field] = value
+    return normalized
+
+
+def cache_key(report_id: str, report_data: dict, prompt_version) -> str:
+    raw = json.dumps(
+        [report_id, normalize_report_data(report_data), prompt_version],
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ReportCache:
+    def __init__(self, max_entries: int, ttl_seconds: float, persistent: bool = False):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.persistent = persistent
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+        self.counters = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0}
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def _remember(self, key: str, value: dict, expires_at: float):
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.counters["memory_hits"] += 1
+                cache_lookups.labels("report", "memory_hit").inc()
+                return entry[1]
+            if entry:
+                del self._entries[key]
+
+        if self.persistent:
+            with connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    "SELECT value, expires_at FROM report_cache WHERE key = ?", (key,)
+                )
+                row = cur.fetchone()
+                if row and row[1] <= now:
+                    cur.execute("DELETE FROM report_cache WHERE key = ?", (key,))
+                    row = None
+            if row:
+                value = json.loads(row[0])
+                self._remember(key, value, row[1])
+                self._count("disk_hits")
+                cache_lookups.labels("report", "disk_hit").inc()
+                return value
+
+        self._count("misses")
+        cache_lookups.labels("report", "miss").inc()
+        return None
+
+    def set(self, key: str, value: dict):
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        self._remember(key, value, expires_at)
+        self._count("stores")
+
+        if self.persistent:
+            with connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    "INSERT OR REPLACE INTO report_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(value, ensure_ascii=False), expires_at),
+                )
+            # الصفوف المنتهية لا تُحذف عند القراءة إلا إن طُلب مفتاحها مجدداً
+            with self._lock:
+                due = now - self._last_purge >= PURGE_INTERVAL
+                if due:
+                    self._last_purge = now
+            if due:
+                self.purge(now)
+
+    def purge(self, now: float = None):
+        with connection() as conn:
+            conn.execute(
+                "DELETE FROM report_cache WHERE expires_at <= ?", (now or time.time(),)
+            )
+
+    def stats(self):
+        with self._lock:
+            counters = dict(self.counters)
+            entries = len(self._entries)
+        hits = counters["memory_hits"] + counters["disk_hits"]
+        lookups = hits + counters["misses"]
+        return {
+            **counters,
+            "entries": entries,
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "persistent": self.persistent,
+        }
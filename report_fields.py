@@ -0,0 +1,119 @@
+# report_fields.py
+import re
+from collections import Counter
+
+# نفس ترتيب "الحقول المطلوبة" في AI_PROMPT_TEMPLATE
+FIELDS = (
+    ("goal", "الهدف التربوي"),
+    ("summary", "نبذة مختصرة"),
+    ("procedures", "إجراءات التنفيذ"),
+    ("strategies", "الاستراتيجيات المستخدمة"),
+    ("strengths", "نقاط القوة"),
+    ("improvements", "نقاط التحسين"),
+    ("recommendations", "التوصيات"),
+)
+FIELD_KEYS = tuple(key for key, _ in FIELDS)
+MIN_FIELD_WORDS = 5
+
+DIGITS = str.maketrans("٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹", "01234567890123456789")
+# "1." أو "1)" أو "1-" أو "1:" في بداية السطر، مع ما قد يضيفه النموذج من ** أو #
+NUMBERED_LINE = re.compile(r"^[\s*#>]*(\d)\s*[.)\-:،]\s*(.*)$")
+MARKUP = re.compile(r"[*#]+")
+
+
+def _strip_title(text: str, title: str) -> str:
+    """حذف عنوان الحقل إن كتبه النموذج رغم التعليمات"""
+    text = MARKUP.sub("", text).strip()
+    if text.startswith(title):
+        text = text[len(title):].lstrip(" :：-–")
+    return text.strip()
+
+
+def _split_inline(number: int, text: str, later):
+    """
+    فصل حقل تالٍ دمجه النموذج في نفس السطر، مثل '... المهارات. 3. يتم ...'.
+    لا يُفصل إن جاء الرقم التالي لاحقاً في سطر مستقل، فيكون "3." هنا جزءاً
+    من النص نفسه مثل '... لطلاب الصف 3. تم ...'.
+    """
+    if number >= len(FIELDS) or number + 1 in later:
+        return [(number, text)]
+    marker = re.search(rf"(?:^|\s){number + 1}\s*[.)]\s+", text)
+    if not marker:
+        return [(number, text)]
+    head, tail = text[:marker.start()], text[marker.end():]
+    return [(number, head)] + _split_inline(number + 1, tail, later)
+
+
+def parse_fields(text: str) -> dict:
+    """
+    تحويل نص Gemini إلى الحقول السبعة. الحقل غير الموجود أو الأقصر من
+    MIN_FIELD_WORDS كلمات لا يُدرج في النتيجة، والأسطر بلا رقم تُلحق بالحقل السابق.
+    """
+    rows = []
+    for line in (text or "").translate(DIGITS).splitlines():
+        match = NUMBERED_LINE.match(line)
+        if match and 1 <= int(match.group(1)) <= len(FIELDS):
+            rows.append((line, int(match.group(1)), match.group(2)))
+        else:
+            rows.append((line, None, None))
+    # أرقام الحقول التي ستأتي في أسطر مستقلة بعد السطر الحالي
+    later = Counter(number for _, number, _ in rows if number)
+
+    parts = {}
+    current = None
+    for line, number, rest in rows:
+        if number:
+            later[number] -= 1
+            for current, part in _split_inline(number, rest, +later):
+                parts.setdefault(current, []).append(part)
+        elif current and line.strip():
+            parts[current].append(line)
+
+    fields = {}
+    for number, lines in parts.items():
+        key, title = FIELDS[number - 1]
+        value = _strip_title(" ".join(" ".join(lines).split()), title)
+        if len(value.split()) >= MIN_FIELD_WORDS:
+            fields[key] = value
+    return fields
+
+
+def missing_fields(fields: dict):
+    return [key for key in FIELD_KEYS if key not in fields]
+
+
+def format_fields(fields: dict) -> str:
+    """النص الموحّد بالشكل الذي يطلبه البرومبت: سطر لكل حقل يبدأ برقمه"""
+    return "\n".join(
+        f"{number}. {fields[key]}"
+        for number, (key, _) in enumerate(FIELDS, 1)
+        if key in fields
+    )
+
+
+def build_repair_prompt(context: str, fields: dict, missing) -> str:
+    """
+    برومبت قصير يطلب الحقول الناقصة فقط، مع الحقول الموجودة كسياق
+    حتى يبقى الترابط بينها دون إعادة توليد التقرير كاملاً.
+    """
+    existing = "\n".join(
+        f"{number}. {title}: {fields[key]}"
+        for number, (key, title) in enumerate(FIELDS, 1)
+        if key in fields
+    )
+    wanted = "\n".join(
+        f"{number}. {title}"
+        for number, (key, title) in enumerate(FIELDS, 1)
+        if key in missing
+    )
+    return f"""أنت خبير تربوي تكمل تقريراً مهنياً كتبه معلم عن ممارسة فعلية قام بها.
+
+{context}
+
+الحقول المكتوبة سابقاً:
+{existing or "لا يوجد"}
+
+اكتب الحقول التالية فقط، بما يقارب 25 كلمة لكل حقل، بلغة عربية فصحى وبصيغة تقريرية مترابطة مع ما سبق:
+{wanted}
+
+اجعل كل حقل في سطر منفصل يبدأ برقمه فقط دون ذكر العنوان."""
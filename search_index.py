@@ -0,0 +1,260 @@
+# search_index.py
+import heapq
+import math
+import re
+from collections import Counter
+
+TASHKEEL = re.compile("[\u0610-\u061a\u064b-\u065f\u0670\u06d6-\u06ed\u0640]")
+NON_WORD = re.compile(r"[^\w]+")
+LETTER_MAP = str.maketrans({
+    "أ": "ا",
+    "إ": "ا",
+    "آ": "ا",
+    "ٱ": "ا",
+    "ة": "ه",
+    "ى": "ي",
+})
+ARTICLES = ("وال", "بال", "فال", "كال", "ال", "لل")
+MIN_TERM_LENGTH = 2
+PREFIX_WEIGHT = 0.7
+
+# أوزان الحقول: التطابق في اسم التقرير أهم من التطابق في التصنيف أو المعيار
+REPORT_WEIGHT = 3.0
+SUBCATEGORY_WEIGHT = 1.0
+CRITERION_WEIGHT = 0.5
+
+
+def normalize_arabic(text: str) -> str:
+    """توحيد أشكال الألف والتاء المربوطة والألف المقصورة وحذف التشكيل"""
+    text = TASHKEEL.sub("", text or "").translate(LETTER_MAP).lower()
+    return NON_WORD.sub(" ", text).strip()
+
+
+def strip_article(token: str) -> str:
+    for article in ARTICLES:
+        if token.startswith(article) and len(token) - len(article) >= MIN_TERM_LENGTH:
+            return token[len(article):]
+    return token
+
+
+def tokenize(text: str):
+    return [t for t in normalize_arabic(text).split() if len(t) >= MIN_TERM_LENGTH]
+
+
+def build_postings(names):
+    """فهرس مقلوب: كل كلمة وكل بادئة منها -> {رقم العنصر: الوزن}"""
+    postings = {}
+    for position, name in enumerate(names):
+        for token in tokenize(name):
+            for variant in {token, strip_article(token)}:
+                for end in range(MIN_TERM_LENGTH, len(variant) + 1):
+                    term = variant[:end]
+                    weight = 1.0 if end == len(variant) else PREFIX_WEIGHT
+                    items = postings.setdefault(term, {})
+                    if items.get(position, 0.0) < weight:
+                        items[position] = weight
+    return postings
+
+
+def rank(postings):
+    return {
+        term: tuple(sorted(items, key=lambda p, items=items: (-items[p], p)))
+        for term, items in postings.items()
+    }
+
+
+class TermMatch:
+    """مطابقات كلمة واحدة من الاستعلام في الحقول الثلاثة"""
+
+    __slots__ = ("index", "reports", "ranked", "subcategories", "criteria")
+
+    def __init__(self, index, term: str):
+        self.index = index
+        self.reports = index.report_postings.get(term, {})
+        self.ranked = index.report_ranked.get(term, ())
+        self.subcategories = index.subcategory_postings.get(term, {})
+        self.criteria = index.criterion_postings.get(term, {})
+
+    def size(self) -> int:
+        index = self.index
+        return (
+            len(self.reports)
+            + sum(len(index.reports_of_sub[s]) for s in self.subcategories)
+            + sum(index.criterion_sizes[c] for c in self.criteria)
+        )
+
+    def max_weight(self) -> float:
+        if self.ranked:
+            return self.reports[self.ranked[0]] * REPORT_WEIGHT
+        if self.subcategories:
+            return max(self.subcategories.values()) * SUBCATEGORY_WEIGHT
+        if self.criteria:
+            return max(self.criteria.values()) * CRITERION_WEIGHT
+        return 0.0
+
+    def weight(self, position: int) -> float:
+        index = self.index
+        sub = index.sub_of[position]
+        return max(
+            self.reports.get(position, 0.0) * REPORT_WEIGHT,
+            self.subcategories.get(sub, 0.0) * SUBCATEGORY_WEIGHT,
+            self.criteria.get(index.crit_of_sub[sub], 0.0) * CRITERION_WEIGHT,
+        )
+
+    def ranked_positions(self):
+        """
+        التقارير بترتيب الوزن تنازلياً ثم الترتيب الأصلي. أوزان الحقول متدرجة
+        (أقل وزن لاسم التقرير أكبر من أعلى وزن للتصنيف)، فيكفي المرور على
+        الحقول بالترتيب دون حساب الأوزان كلها مسبقاً.
+        """
+        index = self.index
+        yield from self.ranked
+        for weight in (1.0, PREFIX_WEIGHT):
+            lists = [index.reports_of_sub[s] for s, w in self.subcategories.items() if w == weight]
+            for position in heapq.merge(*lists):
+                if position not in self.reports:
+                    yield position
+        for weight in (1.0, PREFIX_WEIGHT):
+            lists = [
+                index.reports_of_sub[s]
+                for c, w in self.criteria.items() if w == weight
+                for s in index.subs_of_crit[c]
+            ]
+            for position in heapq.merge(*lists):
+                if position not in self.reports and index.sub_of[position] not in self.subcategories:
+                    yield position
+
+
+class SearchIndex:
+    def __init__(self, reports, subcategories, criteria):
+        self.reports = tuple(reports)
+        self.subcategories = tuple(subcategories)
+        self.criteria = tuple(criteria)
+
+        sub_positions = {s.id: i for i, s in enumerate(self.subcategories)}
+        crit_positions = {c.id: i for i, c in enumerate(self.criteria)}
+
+        # التقارير غير المرتبطة بتصنيف معروف تُربط بخانة وهمية في نهاية الجداول
+        orphan_sub = len(self.subcategories)
+        orphan_crit = len(self.criteria)
+        self.sub_of = tuple(
+            sub_positions.get(r.subcategory_id, orphan_sub) for r in self.reports
+        )
+        self.crit_of_sub = tuple(
+            crit_positions.get(s.criterion_id, orphan_crit) for s in self.subcategories
+        ) + (orphan_crit,)
+
+        reports_of_sub = [[] for _ in range(orphan_sub + 1)]
+        for position, sub in enumerate(self.sub_of):
+            reports_of_sub[sub].append(position)
+        self.reports_of_sub = tuple(tuple(items) for items in reports_of_sub)
+
+        subs_of_crit = [[] for _ in range(orphan_crit + 1)]
+        for sub, crit in enumerate(self.crit_of_sub):
+            subs_of_crit[crit].append(sub)
+        self.subs_of_crit = tuple(tuple(items) for items in subs_of_crit)
+        self.criterion_sizes = tuple(
+            sum(len(self.reports_of_sub[s]) for s in subs) for subs in self.subs_of_crit
+        )
+
+        self.report_postings = build_postings(r.name for r in self.reports)
+        self.report_ranked = rank(self.report_postings)
+        self.subcategory_postings = build_postings(s.name for s in self.subcategories)
+        self.criterion_postings = build_postings(c.name for c in self.criteria)
+
+    def search(self, query: str, limit: int = 20):
+        """
+        ترجع أرقام التقارير مرتبة حسب الصلة، ويجب أن تطابق كل كلمات الاستعلام.
+        يُمر على مرشحي أندر كلمة بترتيب الوزن ويُتوقف حين يعجز أي مرشح
+        متبقٍ عن تجاوز أضعف نتيجة ضمن الحد.
+        """
+        matches = [TermMatch(self, token) for token in tokenize(query)]
+        if not matches or not all(m.max_weight() for m in matches):
+            return []
+
+        matches.sort(key=lambda m: m.size())
+        lead, rest = matches[0], matches[1:]
+        rest_max = sum(m.max_weight() for m in rest)
+
+        top = []
+        for position in lead.ranked_positions():
+            weight = lead.weight(position)
+            if len(top) == limit:
+                # داخل الوزن الواحد تتصاعد الأرقام، فالتعادل هنا لا يتقدم على ما سبقه
+                bound, floor = weight + rest_max, top[0]
+                if bound < floor[0] or (bound == floor[0] and -position < floor[1]):
+                    break
+            total = weight
+            for match in rest:
+                extra = match.weight(position)
+                if not extra:
+                    break
+                total += extra
+            else:
+                item = (total, -position)
+                if len(top) < limit:
+                    heapq.heappush(top, item)
+                elif item > top[0]:
+                    heapq.heapreplace(top, item)
+
+        return [-position for _, position in sorted(top, reverse=True)]
+
+
+def trigrams(text: str):
+    padded = f" {normalize_arabic(text)} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """فهرس ثلاثيات الحروف للبحث المتسامح مع الأخطاء الإملائية في أسماء التقارير"""
+
+    def __init__(self, reports):
+        self.reports = tuple(reports)
+        self.grams = tuple(trigrams(r.name) for r in self.reports)
+        postings = {}
+        for position, grams in enumerate(self.grams):
+            for gram in grams:
+                postings.setdefault(gram, []).append(position)
+        self.postings = {gram: tuple(items) for gram, items in postings.items()}
+
+    def search(self, query: str, min_score: float = 0.4, limit: int = 20):
+        """
+        ترجع (رقم التقرير، الدرجة) مرتبة. الدرجة نسبة ثلاثيات الاستعلام الموجودة
+        في الاسم، ويُفضَّل عند التعادل الاسم الأقرب طولاً للاستعلام.
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        # أي نتيجة تحقق min_score يجب أن تحتوي واحدة على الأقل من أندر
+        # (عدد الثلاثيات - الحد الأدنى المطلوب + 1) ثلاثية، فلا حاجة لقوائم الشائعة
+        needed = max(1, math.ceil(min_score * len(query_grams)))
+        rare_first = sorted(query_grams, key=lambda g: len(self.postings.get(g, ())))
+        prefix = rare_first[:len(query_grams) - needed + 1]
+        unseen = len(query_grams) - len(prefix)
+        counts = Counter()
+        for gram in prefix:
+            counts.update(self.postings.get(gram, ()))
+
+        # المرشح لا يتجاوز ما وُجد له في البادئة + عدد الثلاثيات خارجها،
+        # فبعد امتلاء النتائج يُتوقف عند أول مرشح لا يبلغ أضعفها
+        top = []
+        for position, count in counts.most_common():
+            floor = top[0][0] if len(top) == limit else 0
+            if count + unseen < max(needed, floor):
+                break
+            grams = self.grams[position]
+            shared = len(query_grams & grams)
+            if shared < needed:
+                continue
+            similarity = shared / (len(query_grams) + len(grams) - shared)
+            item = (shared, similarity, -position)
+            if len(top) < limit:
+                heapq.heappush(top, item)
+            elif item > top[0]:
+                heapq.heapreplace(top, item)
+
+        return [
+            (-negative_position, round(shared / len(query_grams), 3))
+            for shared, _, negative_position in sorted(top, reverse=True)
+        ]
@@ -1,22 +1,21 @@
 from fastapi import Header, HTTPException
-from database import get_connection
+from database import connection
 from datetime import datetime
+import os
 
-def activation_required(
-    x_activation_code: str = Header(...)
-):
-    conn = get_connection()
-    cur = conn.cursor()
+from activation_cache import ActivationCache
 
-    cur.execute("""
-        SELECT id, is_active, expires_at, usage_limit, usage_count
-        FROM activation_codes
-        WHERE code=?
-    """, (x_activation_code,))
-    row = cur.fetchone()
+# ACTIVATION_CACHE_TTL=0 يعطّل النسخة المحلية ويعيد الخصم الذري المباشر في قاعدة البيانات،
+# والأكواد التي بقي لها أقل من ACTIVATION_STRICT_MARGIN استخداماً تُخصم ذرياً دائماً
+activation_cache = ActivationCache(
+    ttl_seconds=float(os.getenv("ACTIVATION_CACHE_TTL", "10")),
+    flush_interval=float(os.getenv("USAGE_FLUSH_INTERVAL", "2")),
+    flush_batch=int(os.getenv("USAGE_FLUSH_BATCH", "50")),
+    strict_margin=int(os.getenv("ACTIVATION_STRICT_MARGIN", "20")),
+)
 
+def reject_activation(row):
     if not row:
-        conn.close()
         raise HTTPException(
             status_code=403,
             detail="كود التفعيل غير صحيح"
@@ -25,25 +24,103 @@ def activation_required(
     code_id, active, expires, limit, used = row
 
     if not active:
-        conn.close()
         raise HTTPException(
             status_code=403,
             detail="تم إيقاف هذا الاشتراك"
         )
 
     if expires and datetime.fromisoformat(expires) < datetime.utcnow():
-        conn.close()
         raise HTTPException(
             status_code=403,
             detail="انتهت مدة الاشتراك"
         )
 
     if limit is not None and used >= limit:
-        conn.close()
         raise HTTPException(
             status_code=403,
             detail="تم استهلاك جميع استخدامات الاشتراك"
         )
 
-    conn.close()
-    return code_id
\ No newline at end of file
+def has_quota(row, amount: int = 1):
+    code_id, active, expires, limit, used = row
+    if not active:
+        return False
+    if expires and datetime.fromisoformat(expires) < datetime.utcnow():
+        return False
+    return limit is None or used + amount <= limit
+
+def fetch_activation(cur, code: str):
+    cur.execute("""
+        SELECT id, is_active, expires_at, usage_limit, usage_count
+        FROM activation_codes
+        WHERE code=?
+    """, (code,))
+    return cur.fetchone()
+
+def activation_required(
+    x_activation_code: str = Header(...)
+):
+    # مسار للقراءة فقط: لا يستهلك من رصيد الاشتراك
+    if activation_cache.enabled:
+        row = activation_cache.lookup(x_activation_code)
+    else:
+        with connection() as conn:
+            row = fetch_activation(conn.cursor(), x_activation_code)
+
+    reject_activation(row)
+    return row[0]
+
+def activation_owner(
+    x_activation_code: str = Header(...)
+):
+    # لاسترجاع ما دُفع مسبقاً: يكفي أن يكون الكود موجوداً حتى لو نفد رصيده
+    with connection() as conn:
+        row = fetch_activation(conn.cursor(), x_activation_code)
+    if not row:
+        raise HTTPException(
+            status_code=403,
+            detail="كود التفعيل غير صحيح"
+        )
+    return row[0]
+
+def activation_code(
+    x_activation_code: str = Header(...)
+):
+    return x_activation_code
+
+def consume_activation(code: str, amount: int = 1):
+    if activation_cache.enabled:
+        row, reserved = activation_cache.reserve(code, amount, has_quota)
+        if reserved:
+            return row[0]
+        reject_activation(row)
+        raise HTTPException(
+            status_code=403,
+            detail="تم استهلاك جميع استخدامات الاشتراك"
+        )
+
+    # التحقق والخصم في جملة واحدة حتى لا تتجاوز الطلبات المتزامنة حد الاستخدام
+    now = datetime.utcnow().isoformat()
+    with connection() as conn:
+        cur = conn.cursor()
+        cur.execute("""
+            UPDATE activation_codes
+            SET usage_count = usage_count + ?,
+                last_used_at = ?
+            WHERE code = ?
+              AND is_active = 1
+              AND (expires_at IS NULL OR expires_at > ?)
+              AND (usage_limit IS NULL OR usage_count + ? <= usage_limit)
+            RETURNING id
+        """, (amount, now, code, now, amount))
+        row = cur.fetchone()
+        if row:
+            return row[0]
+        row = fetch_activation(cur, code)
+
+    reject_activation(row)
+    # الكود صالح لكن الرصيد المتبقي أقل من المطلوب
+    raise HTTPException(
+        status_code=403,
+        detail="تم استهلاك جميع استخدامات الاشتراك"
+    )
@@ -0,0 +1,31 @@
+# single_flight.py
+import asyncio
+
+from metrics import coalesced_requests
+
+
+class SingleFlight:
+    """
+    يدمج الاستدعاءات المتزامنة لنفس المفتاح في استدعاء واحد داخل العامل:
+    أول طلب ينفّذ والبقية ينتظرون نتيجته (أو خطأه) ذاتها.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self.counters = {"leaders": 0, "coalesced": 0}
+
+    async def do(self, key, fn):
+        task = self._calls.get(key)
+        if task:
+            self.counters["coalesced"] += 1
+            coalesced_requests.inc()
+        else:
+            self.counters["leaders"] += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # انقطاع أحد المنتظرين لا يلغي الاستدعاء المشترك على البقية
+        return await asyncio.shield(task)
+
+    def stats(self):
+        return {**self.counters, "in_flight": len(self._calls)}
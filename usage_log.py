@@ -0,0 +1,141 @@
+# usage_log.py
+import logging
+import threading
+from datetime import datetime
+
+from database import connection
+
+logger = logging.getLogger(__name__)
+
+# group_by -> (اسم الحقل في الاستجابة، عمود التجميع، عمود إضافي للعرض)
+GROUPS = {
+    "code": ("code_id", "u.code_id", "c.code"),
+    "plan": ("plan", "c.plan", None),
+    "key": ("key_index", "u.key_index", None),
+    "day": ("day", "u.day", None),
+}
+
+
+def token_counts(response):
+    """عدد الرموز من usage_metadata، أو أصفار إن لم يرجعها Gemini"""
+    usage = getattr(response, "usage_metadata", None)
+    return (
+        getattr(usage, "prompt_token_count", 0) or 0,
+        getattr(usage, "candidates_token_count", 0) or 0,
+        getattr(usage, "total_token_count", 0) or 0,
+    )
+
+
+class UsageLog:
+    """
+    سجل رموز Gemini وزمن كل توليد منسوباً إلى كود التفعيل ورقم المفتاح.
+    السجلات تُجمع في الذاكرة وتُكتب على دفعات من خيط خلفي.
+    """
+
+    def __init__(self, flush_interval: float, price_input: float, price_output: float):
+        self.flush_interval = flush_interval
+        # بالدولار لكل مليون رمز
+        self.price_input = price_input
+        self.price_output = price_output
+        self._rows = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def record(self, code_id, key_index: int, model: str, response, latency: float):
+        prompt_tokens, candidate_tokens, total_tokens = token_counts(response)
+        now = datetime.utcnow()
+        row = (
+            code_id, key_index, model, prompt_tokens, candidate_tokens, total_tokens,
+            round(latency * 1000), now.isoformat(), now.date().isoformat()
+        )
+        with self._lock:
+            self._rows.append(row)
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return
+            try:
+                with connection() as conn:
+                    conn.executemany("""
+                        INSERT INTO generation_usage
+                        (code_id, key_index, model, prompt_tokens, candidate_tokens,
+                         total_tokens, latency_ms, created_at, day)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, rows)
+            except BaseException:
+                # تعود السجلات قبل ما أُضيف أثناء المحاولة لتُكتب في الدورة التالية
+                with self._lock:
+                    self._rows[:0] = rows
+                raise
+
+    def aggregate(self, group_by: str, since: str = None, until: str = None, limit: int = 100):
+        """مجاميع حسب code أو plan أو key أو day، مرتبة من الأكثر استهلاكاً"""
+        self.flush()
+        name, column, label = GROUPS[group_by]
+        where, params = [], []
+        if since:
+            where.append("u.day >= ?")
+            params.append(since)
+        if until:
+            where.append("u.day <= ?")
+            params.append(until)
+
+        with connection() as conn:
+            cur = conn.cursor()
+            cur.execute(f"""
+                SELECT {column}, {label or 'NULL'},
+                       COUNT(*), SUM(u.prompt_tokens), SUM(u.candidate_tokens),
+                       SUM(u.total_tokens), AVG(u.latency_ms), MAX(u.latency_ms)
+                FROM generation_usage u
+                LEFT JOIN activation_codes c ON c.id = u.code_id
+                {"WHERE " + " AND ".join(where) if where else ""}
+                GROUP BY {column}
+                ORDER BY SUM(u.total_tokens) DESC
+                LIMIT ?
+            """, (*params, limit))
+            rows = cur.fetchall()
+
+        result = []
+        for value, extra, count, prompt, candidates, total, avg_latency, max_latency in rows:
+            item = {name: value}
+            if label:
+                item[label.split(".")[1]] = extra
+            item.update({
+                "generations": count,
+                "prompt_tokens": prompt,
+                "candidate_tokens": candidates,
+                "total_tokens": total,
+                "avg_latency_ms": round(avg_latency),
+                "max_latency_ms": max_latency,
+                "estimated_cost_usd": round(
+                    (prompt * self.price_input + candidates * self.price_output) / 1_000_000, 6
+                ),
+            })
+            result.append(item)
+        return result
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush generation usage")
+
+    def start(self):
+        if self._thread:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="usage-flush", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._thread:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()